@@ -16,10 +16,252 @@ QThread 워커 클래스를 제공합니다.
 """
 
 from PyQt6.QtCore import QThread, pyqtSignal
+import os
 import re
+import mmap
 import logging
+from array import array
+from bisect import bisect_left
+from functools import lru_cache
 from typing import List, Tuple
 
+# 선형 시간 매칭을 보장하는 RE2 엔진 (선택 사항)
+# 설치되어 있으면 사용자 패턴이 치명적인 역추적으로 워커를 멈추게 하지 않도록 사용하고,
+# 없거나 RE2가 지원하지 않는 구문(전후방탐색, 역참조 등)이 있으면 re 모듈을 사용
+# RE2의 \d, \s, \w, \b는 ASCII만 대상으로 하므로 이런 구문이 있는 패턴도 re 모듈을 사용
+# (설치 여부에 따라 한글/전각 제목의 검색 결과가 달라지지 않도록 함)
+try:
+    import re2
+except ImportError:
+    re2 = None
+
+# 번호 역참조(\1, (?P=name))를 포함한 패턴 감지용 - 결합 시 그룹 번호가 바뀌므로 결합 대상에서 제외
+_BACKREF_RE = re.compile(r'\\[1-9]|\(\?P=')
+
+# 줄 앞뒤의 공백(줄바꿈 제외) - str.strip()과 같은 공백 문자 집합
+_EDGE_SPACE_RE = re.compile(r'^[^\S\n]+|[^\S\n]+$', re.MULTILINE)
+
+# 줄바꿈 위치 검색용
+_NEWLINE_RE = re.compile(r'\n')
+
+# 줄 끝 너머의 텍스트에 따라 결과가 달라질 수 있는 구문 감지용
+# (전후방탐색, \A, \Z, 원자 그룹, 소유 수량자) - 전체 텍스트 검사로 후보를 거를 수 없음
+_LINE_CONTEXT_RE = re.compile(r'\(\?<?[=!]|\(\?>|\\[AZ]|[*+?}]\+')
+
+# 비어있지 않은 모든 줄의 시작 위치
+_NON_EMPTY_LINE_RE = re.compile(r'^(?=[^\n])', re.MULTILINE)
+
+# re와 RE2에서 매치 범위가 다른 문자 클래스 감지용 (이스케이프된 \\d 등은 제외)
+_UNICODE_CLASS_RE = re.compile(r'(?<!\\)(?:\\\\)*\\[dDsSwWbB]')
+
+
+# 리터럴 접두어를 끝내는 정규식 메타 문자
+_REGEX_META_CHARS = frozenset('.^$*+?{}[]()|\\')
+
+
+def _has_top_level_alternation(pattern_str: str) -> bool:
+    """
+    정규식 패턴의 최상위 수준에 대안(|)이 있는지 확인합니다.
+
+    이스케이프 문자와 문자 클래스([...]) 안의 |, 그룹 안의 |는 무시합니다.
+
+    Args:
+        pattern_str (str): 검사할 정규식 패턴
+
+    Returns:
+        bool: 그룹 밖에 |가 있으면 True
+    """
+    depth = 0
+    in_class = False
+    i = 0
+    while i < len(pattern_str):
+        ch = pattern_str[i]
+        if ch == '\\':
+            i += 2
+            continue
+        if in_class:
+            if ch == ']':
+                in_class = False
+        elif ch == '[':
+            in_class = True
+            # [^]...] 또는 []...] 형태에서 첫 ]는 문자 클래스의 일부
+            if pattern_str[i + 1:i + 2] == '^':
+                i += 1
+            if pattern_str[i + 1:i + 2] == ']':
+                i += 1
+        elif ch == '(':
+            depth += 1
+        elif ch == ')':
+            depth -= 1
+        elif ch == '|' and depth == 0:
+            return True
+        i += 1
+    return False
+
+
+def _literal_prefix(pattern_str: str) -> str:
+    """
+    정규식 패턴이 매치되는 문자열이 반드시 시작하는 리터럴 접두어를 구합니다.
+
+    앞의 ^를 제외하고 메타 문자가 나올 때까지의 글자를 모으며,
+    *, ?, { 수량자가 붙은 마지막 글자는 생략될 수 있으므로 제외합니다.
+    (예: '^제\\d+장' -> '제', '외전\\s*\\d+화' -> '외전', '(^[0-9]+화.*)' -> '')
+
+    Args:
+        pattern_str (str): 정규식 패턴
+
+    Returns:
+        str: 리터럴 접두어 (구할 수 없으면 빈 문자열)
+    """
+    if _has_top_level_alternation(pattern_str):
+        return ''
+
+    body = pattern_str[1:] if pattern_str.startswith('^') else pattern_str
+    prefix = []
+    for ch in body:
+        if ch in '*?{':
+            # 바로 앞 글자가 0회 반복될 수 있음
+            if prefix:
+                prefix.pop()
+            break
+        if ch in _REGEX_META_CHARS:
+            break
+        prefix.append(ch)
+    return ''.join(prefix)
+
+
+@lru_cache(maxsize=512)
+def _compile_pattern(pattern_str: str, flags: int = re.MULTILINE):
+    """
+    정규식을 컴파일하고 결과를 프로세스 전체에서 캐시합니다.
+
+    사용자가 같은 패턴으로 챕터 검색을 다시 실행할 때 개별 패턴, 결합 정규식,
+    후보 검색용 정규식의 컴파일 비용이 들지 않도록 합니다.
+    잘못된 패턴의 re.error는 캐시되지 않고 그대로 전달됩니다.
+
+    Args:
+        pattern_str (str): 컴파일할 정규식 패턴
+        flags (int): 정규식 플래그. 기본값은 re.MULTILINE
+
+    Returns:
+        re.Pattern: 컴파일된 정규식 객체
+    """
+    return re.compile(pattern_str, flags)
+
+
+def _compile_re2_pattern(pattern_str: str):
+    """
+    정규식을 RE2 엔진으로 컴파일합니다.
+
+    RE2는 역추적을 하지 않으므로 입력 길이에 비례하는 시간 안에 매칭이 끝납니다.
+    RE2의 \\d, \\s, \\w, \\b는 ASCII 문자만 대상으로 하므로 이런 구문이 있는 패턴과
+    줄 끝 너머의 문맥에 의존하는 패턴은 re 모듈과 결과가 같도록 RE2를 사용하지 않습니다.
+
+    Args:
+        pattern_str (str): 컴파일할 정규식 패턴
+
+    Returns:
+        Optional[re2 패턴 객체]: RE2가 없거나 사용할 수 없는 패턴이면 None
+    """
+    if re2 is None:
+        return None
+    if _UNICODE_CLASS_RE.search(pattern_str) or _LINE_CONTEXT_RE.search(pattern_str):
+        return None
+    try:
+        # 엔진마다 플래그 인자 형식이 다르므로 인라인 플래그로 MULTILINE 지정
+        return re2.compile(f"(?m){pattern_str}")
+    except re2.error as e:
+        logging.debug(f"RE2에서 지원하지 않는 패턴이므로 re 모듈을 사용합니다: {e}")
+        return None
+
+
+def _matched_group_name(match, group_meta) -> str:
+    """
+    결합 정규식의 매치에서 실제로 매치된 패턴의 그룹 이름을 찾습니다.
+
+    RE2 바인딩에 따라 lastgroup을 지원하지 않을 수 있으므로 re와 RE2 모두
+    제공하는 groupdict()로 확인합니다.
+
+    Args:
+        match: 결합 정규식의 매치 객체 (re 또는 RE2)
+        group_meta (Dict[str, Tuple[str, str]]): 그룹명 -> (정규식명, 패턴문자열) 매핑 (패턴 순서)
+
+    Returns:
+        str: 매치에 참여한 첫 번째 패턴 그룹 이름
+    """
+    groups = match.groupdict()
+    for name in group_meta:
+        if groups.get(name) is not None:
+            return name
+    return match.lastgroup
+
+
+def _read_text_file(file_path: str, encoding: str = 'utf-8') -> str:
+    """
+    텍스트 파일을 메모리 매핑하여 읽고 문자열로 디코딩합니다.
+
+    매핑된 파일 내용을 바로 디코딩하므로 파일 크기만큼의 bytes 사본을 만들지 않습니다.
+    줄바꿈은 텍스트 모드 open()과 같이 \\n으로 통일합니다.
+
+    Args:
+        file_path (str): 읽을 텍스트 파일 경로
+        encoding (str): 파일 인코딩. 기본값은 'utf-8'
+
+    Returns:
+        str: 파일 내용
+
+    Raises:
+        OSError: 파일을 열 수 없을 때
+        UnicodeDecodeError: 지정한 인코딩으로 디코딩할 수 없을 때
+    """
+    with open(file_path, 'rb') as f:
+        # 빈 파일은 매핑할 수 없음
+        if os.fstat(f.fileno()).st_size == 0:
+            return ''
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            text = str(mm, encoding)
+
+    if '\r' in text:
+        text = text.replace('\r\n', '\n').replace('\r', '\n')
+    return text
+
+
+class _LineIndex:
+    """
+    공백이 정리된 텍스트와 줄바꿈 위치 배열을 함께 보관하는 줄 인덱스입니다.
+
+    줄바꿈 위치는 array('i')에 저장하여 줄마다 문자열 객체를 만드는
+    splitlines()보다 메모리를 적게 사용합니다.
+
+    Attributes:
+        text (str): 줄 앞뒤 공백이 제거된 텍스트
+        nl_offsets (array): 줄바꿈 문자의 위치 (오름차순)
+    """
+
+    __slots__ = ('text', 'nl_offsets')
+
+    def __init__(self, text: str):
+        self.text = _EDGE_SPACE_RE.sub('', text)
+        self.nl_offsets = array('i', (m.start() for m in _NEWLINE_RE.finditer(self.text)))
+
+
+@lru_cache(maxsize=1)
+def _build_line_index(text: str) -> _LineIndex:
+    """
+    텍스트의 줄 인덱스를 만들고 가장 최근 텍스트의 결과를 프로세스 전체에서 캐시합니다.
+
+    같은 텍스트를 다른 정규식으로 다시 검색하는 워커는 공백 정리와 줄바꿈 검색을
+    생략합니다. 크기 1의 캐시이므로 마지막 텍스트와 인덱스 하나만 메모리에 남습니다.
+
+    Args:
+        text (str): 검색 대상 원본 텍스트
+
+    Returns:
+        _LineIndex: 공백이 정리된 텍스트와 줄바꿈 위치 배열 (워커 간 공유되므로 수정하지 않음)
+    """
+    return _LineIndex(text)
+
+
 class ChapterFinderWorker(QThread):
     """
     텍스트에서 정규식 패턴을 사용하여 챕터를 검색하는 워커 스레드입니다.
@@ -28,19 +270,26 @@ class ChapterFinderWorker(QThread):
     매치되는 줄을 챕터로 인식하여 실시간으로 결과를 전달합니다.
 
     Signals:
-        chapter_found (int, str, str, str): 챕터 발견 시 (라인번호, 제목, 정규식명, 패턴) 전달
+        chapters_found (list): 발견된 챕터 (라인번호, 제목, 정규식명, 패턴) 튜플을 묶어서 전달
         progress (int): 진행률 업데이트 (0-100%)
         finished (int): 검색 완료 시 총 발견된 챕터 수 전달
+        error (str): from_file()로 만든 워커가 파일을 읽지 못했을 때 오류 메시지 전달
 
     Attributes:
-        text (str): 검색 대상 텍스트
+        text (str): 검색 대상 텍스트 (from_file()로 만든 경우 run()에서 읽기 전까지 None)
         patterns (List[Tuple[int, str]]): (인덱스, 정규식패턴) 튜플 리스트
+        file_path (Optional[str]): 검색 대상 텍스트 파일 경로
+        encoding (str): 텍스트 파일 인코딩
     """
 
     # PyQt6 신호 정의
-    chapter_found = pyqtSignal(int, str, str, str)  # line_no, title, regex_name, pattern
+    chapters_found = pyqtSignal(list)               # [(line_no, title, regex_name, pattern), ...]
     progress = pyqtSignal(int)                      # progress_percent
     finished = pyqtSignal(int)                      # total_found_count
+    error = pyqtSignal(str)                         # error_message
+
+    # chapters_found 신호 한 번에 묶어 보낼 최대 챕터 수
+    CHAPTER_BATCH_SIZE = 100
 
     def __init__(self, text: str, patterns: List[Tuple[int, str]]):
         """
@@ -53,35 +302,85 @@ class ChapterFinderWorker(QThread):
         super().__init__()
         self.text = text
         self.patterns = patterns
+        self.file_path = None
+        self.encoding = 'utf-8'
+        self._line_index = None
+
+    @classmethod
+    def from_file(cls, file_path: str, patterns: List[Tuple[int, str]], encoding: str = 'utf-8'):
+        """
+        텍스트 파일에서 챕터를 검색하는 워커를 생성합니다.
+
+        파일은 GUI 스레드가 아닌 워커 스레드의 run()에서 메모리 매핑으로 읽으므로
+        큰 파일을 열 때도 화면이 멈추지 않고, bytes 사본 없이 문자열만 메모리에 올라갑니다.
+
+        Args:
+            file_path (str): 챕터를 검색할 텍스트 파일 경로
+            patterns (List[Tuple[int, str]]): (인덱스, 정규식패턴) 형태의 튜플 리스트
+            encoding (str): 파일 인코딩. 기본값은 'utf-8'
+
+        Returns:
+            ChapterFinderWorker: 파일을 검색 대상으로 하는 워커
+        """
+        worker = cls(None, patterns)
+        worker.file_path = file_path
+        worker.encoding = encoding
+        return worker
+
+    def _get_line_index(self) -> _LineIndex:
+        """
+        검색 대상 텍스트의 줄 인덱스를 반환합니다.
+
+        직전 검색과 같은 텍스트이면 다른 워커가 만든 인덱스를 재사용합니다.
+
+        Returns:
+            _LineIndex: 공백이 정리된 텍스트와 줄바꿈 위치 배열
+        """
+        if self._line_index is None:
+            self._line_index = _build_line_index(self.text)
+        return self._line_index
 
     def run(self):
         """
         워커 스레드의 메인 실행 함수입니다.
 
-        텍스트의 각 줄을 순차적으로 검사하여 선택된 모든 정규식 패턴과 매치를 시도합니다.
+        줄 단위 Python 루프 대신 정규식 엔진이 전체 텍스트를 한 번에 훑어
+        챕터 후보 줄을 찾고, 후보 줄만 줄 범위 안에서 다시 매칭하여 확정합니다.
         이 방식으로 챕터가 문서에 나타나는 순서대로 정확하게 찾을 수 있습니다.
-        
+
         매칭 처리 방식:
         1. 모든 정규식 패턴을 미리 컴파일
-        2. 각 줄마다 모든 정규식 패턴을 순차적으로 검사
-        3. 첫 번째로 매치되는 패턴을 해당 줄의 챕터로 인식
-        4. 줄의 앞뒤 공백을 제거한 후 줄 시작부터 패턴 매칭
-        5. 챕터 발견 시 즉시 신호 발생으로 문서 순서 보장
+        2. 각 줄의 앞뒤 공백을 한 번의 치환으로 제거 (직전 검색과 같은 텍스트는 캐시 재사용)
+        3. 줄 시작 위치에서 패턴을 검사하는 finditer로 후보 줄 수집
+        4. 후보 줄마다 해당 줄 문자열에 대해 패턴을 순서대로 매칭
+        5. 첫 번째로 매치되는 패턴을 해당 줄의 챕터로 인식
+        6. 라인 번호는 줄바꿈 위치 배열을 이진 탐색하여 계산
 
         Returns:
             None
 
         Emits:
-            chapter_found: 챕터 발견 시 라인 정보 (문서 순서대로)
-            progress: 검색 진행률 (20줄마다 업데이트)
+            chapters_found: 발견된 챕터 묶음 (최대 CHAPTER_BATCH_SIZE개, 진행률이 바뀔 때와 검색 종료 시에도 전달)
+            progress: 검색 진행률 (값이 바뀔 때만, 최대 100회)
             finished: 검색 완료 시 총 발견 챕터 수
+            error: 텍스트 파일 읽기 실패 시 오류 메시지 (이 경우 finished는 보내지 않음)
         """
+        # 스레드 간 신호 전달 횟수를 줄이기 위해 발견된 챕터를 묶어서 전달
+        batch = []
         try:
-            lines = self.text.splitlines()
-            total_lines = len(lines)
             total_found = 0
 
-            if total_lines == 0:
+            # from_file()로 만든 워커는 여기서 파일을 읽음
+            if self.text is None and self.file_path:
+                try:
+                    self.text = _read_text_file(self.file_path, self.encoding)
+                    logging.debug(f"텍스트 파일 읽기 완료: {len(self.text)} 문자")
+                except (OSError, UnicodeDecodeError) as e:
+                    logging.error(f"텍스트 파일 읽기 실패: {e}")
+                    self.error.emit(str(e))
+                    return
+
+            if not self.text:
                 logging.warning("검색할 텍스트가 비어있습니다.")
                 self.finished.emit(0)
                 return
@@ -90,9 +389,9 @@ class ChapterFinderWorker(QThread):
             compiled_patterns = []
             for idx, pattern_str in self.patterns:
                 try:
-                    pattern = re.compile(pattern_str, re.MULTILINE)
+                    pattern = _compile_pattern(pattern_str)
                     regex_name = f"정규식 {idx:02}"
-                    compiled_patterns.append((idx, pattern, regex_name, pattern_str))
+                    compiled_patterns.append((idx, pattern, regex_name, pattern_str, _literal_prefix(pattern_str)))
                     logging.debug(f"정규식 패턴 컴파일 완료: {regex_name} - {pattern_str}")
                 except re.error as e:
                     logging.error(f"잘못된 정규식 패턴 (인덱스 {idx}): {pattern_str} - {e}")
@@ -103,40 +402,199 @@ class ChapterFinderWorker(QThread):
                 self.finished.emit(0)
                 return
 
-            # 각 줄에 대해 모든 정규식 패턴을 순차적으로 검사
-            for i, line in enumerate(lines):
-                # 줄의 앞뒤 공백 제거 (탭, 스페이스 등 모든 공백 문자)
-                line_stripped = line.strip()
-
-                # 빈 줄은 건너뛰기
-                if not line_stripped:
-                    # 진행률 업데이트 (빈 줄도 포함하여 계산)
-                    if total_lines > 0 and i % 20 == 0:
-                        percent = min(int((i / total_lines) * 100), 100)
-                        self.progress.emit(percent)
-                    continue
-
-                # 현재 줄에 대해 모든 정규식 패턴 검사
-                chapter_found_in_line = False
-                for idx, pattern, regex_name, pattern_str in compiled_patterns:
-                    # 정규식 매치 검사 - 공백이 제거된 줄이 패턴과 줄 시작부터 일치하는지 확인
-                    if pattern.match(line_stripped):
-                        total_found += 1
-                        logging.debug(f"챕터 발견: 라인 {i+1} - 원본: '{line}' -> 처리됨: '{line_stripped[:50]}...' (패턴: {regex_name})")
-                        self.chapter_found.emit(i + 1, line_stripped, regex_name, pattern_str)
-                        chapter_found_in_line = True
-                        break  # 한 줄에서 첫 번째로 매치된 패턴만 사용
-
-                # 진행률 업데이트 (20줄마다)
-                if total_lines > 0 and i % 20 == 0:
-                    percent = min(int((i / total_lines) * 100), 100)
+            # 모든 패턴을 하나의 대안(alternation) 정규식으로 결합
+            union_pattern, group_meta = self._build_union_pattern(compiled_patterns)
+
+            # 줄 앞뒤 공백(줄바꿈 제외)이 제거된 텍스트와 줄바꿈 위치 배열
+            # 줄바꿈 위치는 매치 위치로부터 라인 번호를 계산하는 데 사용
+            line_index = self._get_line_index()
+            text = line_index.text
+            nl_offsets = line_index.nl_offsets
+            total_lines = len(nl_offsets) + 1
+            text_len = len(text)
+
+            # RE2로 결합 정규식을 컴파일할 수 있으면 후보 검색과 줄 매칭 모두 역추적 없는 엔진으로 수행
+            # (후보 검색용 전방탐색 정규식도 사용자 패턴을 포함하므로 re 모듈을 거치지 않음)
+            re2_pattern = _compile_re2_pattern(union_pattern.pattern) if union_pattern is not None else None
+            re2_scanner = _compile_re2_pattern(f"^(?:{union_pattern.pattern})") if re2_pattern is not None else None
+            if re2_scanner is not None:
+                logging.debug("RE2 엔진으로 챕터를 검색합니다.")
+                union_pattern = re2_pattern
+                candidate_starts = self._find_candidate_starts_re2(text, re2_scanner)
+            else:
+                # 후보 줄 시작 위치 수집 (정규식 엔진이 전체 텍스트를 한 번에 검사)
+                candidate_starts = self._find_candidate_starts(text, union_pattern, compiled_patterns)
+
+            # 마지막으로 전달한 진행률 - 값이 바뀔 때만 신호를 보내 최대 100회로 제한
+            last_percent = -1
+
+            for start in candidate_starts:
+                # 시작 위치 앞의 줄바꿈 개수 = 0부터 시작하는 줄 번호
+                # (빈 줄의 시작 위치는 그 줄의 줄바꿈 위치와 같으므로 bisect_left 사용)
+                line_idx = bisect_left(nl_offsets, start)
+                end = nl_offsets[line_idx] if line_idx < len(nl_offsets) else text_len
+
+                # 후보 줄만 잘라내어 줄 단위로 매칭 (한 줄에서 첫 번째로 매치된 패턴만 사용)
+                line_stripped = text[start:end]
+                matched = None
+                if union_pattern is not None:
+                    # 결합된 정규식으로 한 번만 매칭 - 대안은 왼쪽부터 시도되므로 패턴 순서가 유지됨
+                    m = union_pattern.match(line_stripped)
+                    if m:
+                        matched = group_meta[_matched_group_name(m, group_meta)]
+                else:
+                    for idx, pattern, regex_name, pattern_str, prefix in compiled_patterns:
+                        # 리터럴 접두어가 다르면 정규식 엔진을 호출하지 않고 건너뛰기
+                        if prefix and not line_stripped.startswith(prefix):
+                            continue
+                        # 정규식 매치 검사 - 공백이 제거된 줄이 패턴과 줄 시작부터 일치하는지 확인
+                        if pattern.match(line_stripped):
+                            matched = (regex_name, pattern_str)
+                            break
+
+                if matched:
+                    regex_name, pattern_str = matched
+                    total_found += 1
+                    logging.debug(f"챕터 발견: 라인 {line_idx+1} - '{line_stripped[:50]}...' (패턴: {regex_name})")
+                    batch.append((line_idx + 1, line_stripped, regex_name, pattern_str))
+                    if len(batch) >= self.CHAPTER_BATCH_SIZE:
+                        self.chapters_found.emit(batch)
+                        batch = []
+
+                # 진행률 업데이트 (값이 바뀐 경우에만 - 스레드 간 신호 전달 최소화)
+                percent = (line_idx * 100) // total_lines
+                if percent != last_percent:
+                    # 진행률과 함께 목록도 갱신되도록 모아둔 챕터를 먼저 전달
+                    if batch:
+                        self.chapters_found.emit(batch)
+                        batch = []
                     self.progress.emit(percent)
+                    last_percent = percent
 
             # 검색 완료
+            if batch:
+                self.chapters_found.emit(batch)
             self.progress.emit(100)
             logging.info(f"챕터 검색 완료: 총 {total_found}개 발견")
             self.finished.emit(total_found)
 
         except Exception as e:
             logging.error(f"챕터 검색 중 예상치 못한 오류 발생: {e}")
+            if batch:
+                self.chapters_found.emit(batch)
             self.finished.emit(0)
+
+    @staticmethod
+    def _find_candidate_starts(text, union_pattern, compiled_patterns):
+        """
+        패턴이 매치될 수 있는 줄의 시작 위치를 문서 순서대로 반환합니다.
+
+        각 패턴을 ^(?=...) 형태의 폭이 0인 전방탐색으로 감싸 finditer로 검사하므로
+        매치가 다음 줄을 소비하지 않고, 모든 줄 시작이 독립적으로 검사됩니다.
+        빈 줄은 (?=[^\\n]) 조건으로 정규식 엔진 안에서 제외되므로 후보에 포함되지 않습니다.
+        후보는 줄 경계를 넘는 매치도 포함할 수 있으므로 호출자가 줄 단위로 다시 확인합니다.
+        줄 끝 너머의 텍스트에 따라 결과가 달라지는 패턴(예: (?!\\s*끝)$)은 후보를 놓칠 수
+        있으므로 리터럴 접두어로 시작하는 줄을 후보로 삼고, 접두어가 없으면
+        비어있지 않은 모든 줄을 후보로 반환합니다.
+
+        Args:
+            text (str): 줄 앞뒤 공백이 제거된 검색 대상 텍스트
+            union_pattern (Optional[re.Pattern]): 결합된 정규식 (없으면 패턴별 검사)
+            compiled_patterns (List[Tuple[int, re.Pattern, str, str, str]]):
+                (인덱스, 컴파일된패턴, 정규식명, 패턴문자열, 리터럴접두어) 튜플 리스트
+
+        Returns:
+            List[int]: 비어있지 않은 후보 줄 시작 위치 목록 (오름차순)
+        """
+        line_safe_sources = []
+        context_prefixes = []
+        for _, _, _, pattern_str, prefix in compiled_patterns:
+            if not _LINE_CONTEXT_RE.search(pattern_str):
+                line_safe_sources.append(pattern_str)
+            elif prefix:
+                context_prefixes.append(prefix)
+            else:
+                return [m.start() for m in _NON_EMPTY_LINE_RE.finditer(text)]
+
+        scanners = []
+        if line_safe_sources:
+            if union_pattern is not None:
+                # 역참조가 없으므로 하나의 대안으로 묶어 한 번에 검사
+                joined = "|".join(f"(?:{source})" for source in line_safe_sources)
+                scanners.append(f"^(?=[^\\n])(?=(?:{joined}))")
+            else:
+                scanners.extend(f"^(?=[^\\n])(?=(?:{source}))" for source in line_safe_sources)
+        if context_prefixes:
+            scanners.append("^(?:" + "|".join(re.escape(prefix) for prefix in context_prefixes) + ")")
+
+        starts = set()
+        for scanner in scanners:
+            starts.update(m.start() for m in _compile_pattern(scanner).finditer(text))
+        return sorted(starts)
+
+    @staticmethod
+    def _find_candidate_starts_re2(text, re2_scanner):
+        """
+        RE2 엔진으로 패턴이 매치될 수 있는 줄의 시작 위치를 찾습니다.
+
+        RE2는 전방탐색을 지원하지 않으므로 ^(?:...)로 감싼 결합 정규식을 검색하고,
+        매치가 여러 줄에 걸쳐도 다음 줄 시작부터 다시 검색하여 줄을 건너뛰지 않습니다.
+        빈 줄은 후보에서 제외하며, 후보는 호출자가 줄 단위로 다시 확인합니다.
+
+        Args:
+            text (str): 줄 앞뒤 공백이 제거된 검색 대상 텍스트
+            re2_scanner: RE2로 컴파일된 ^(?:결합 정규식) 패턴
+
+        Returns:
+            List[int]: 비어있지 않은 후보 줄 시작 위치 목록 (오름차순)
+        """
+        starts = []
+        text_len = len(text)
+        pos = 0
+        while pos < text_len:
+            m = re2_scanner.search(text, pos)
+            if m is None:
+                break
+            start = m.start()
+            if start < text_len and text[start] != '\n':
+                starts.append(start)
+            line_end = text.find('\n', start)
+            if line_end < 0:
+                break
+            pos = line_end + 1
+        return starts
+
+    @staticmethod
+    def _build_union_pattern(compiled_patterns):
+        """
+        컴파일된 정규식 패턴들을 하나의 대안(alternation) 정규식으로 결합합니다.
+
+        각 패턴을 (?P<pN>...) 이름 그룹으로 감싸 결합하므로 줄마다 정규식 엔진을
+        한 번만 호출하면 되고, 매치된 패턴은 _matched_group_name()으로 식별합니다.
+        번호 역참조(\\1 등)를 사용하는 패턴은 그룹 번호가 바뀌어 결합할 수 없으며,
+        이름 그룹 충돌 등으로 결합에 실패하면 (None, {})을 반환하여
+        패턴별 순차 검사로 대체하도록 합니다.
+
+        Args:
+            compiled_patterns (List[Tuple[int, re.Pattern, str, str, str]]):
+                (인덱스, 컴파일된패턴, 정규식명, 패턴문자열, 리터럴접두어) 튜플 리스트
+
+        Returns:
+            Tuple[Optional[re.Pattern], Dict[str, Tuple[str, str]]]:
+                결합된 정규식과 그룹명 -> (정규식명, 패턴문자열) 매핑
+        """
+        group_meta = {}
+        parts = []
+        for k, (idx, pattern, regex_name, pattern_str, prefix) in enumerate(compiled_patterns):
+            if _BACKREF_RE.search(pattern_str):
+                logging.debug(f"역참조를 포함한 패턴이 있어 패턴별 검사를 사용합니다: {regex_name}")
+                return None, {}
+            group_name = f"p{k}"
+            parts.append(f"(?P<{group_name}>{pattern_str})")
+            group_meta[group_name] = (regex_name, pattern_str)
+
+        try:
+            return _compile_pattern("|".join(parts)), group_meta
+        except re.error as e:
+            logging.debug(f"정규식 결합 실패, 패턴별 검사를 사용합니다: {e}")
+            return None, {}
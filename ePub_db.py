@@ -22,2246 +22,701 @@ ePub 데이터베이스 관리 모듈
 """
 
 import os
+import atexit
+import shutil
 import sqlite3
-from datetime import datetime
+import threading
+from functools import lru_cache
 import logging
 
 # 항상 현재 파일 기준 경로에 생성
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 DB_FILE = os.path.join(BASE_DIR, "epub_config.db")
 
-def table_exists(cursor, table_name):
-    """
-    데이터베이스에서 지정된 테이블의 존재 여부를 확인합니다.
-
-    Args:
-        cursor (sqlite3.Cursor): SQLite 커서 객체
-        table_name (str): 확인할 테이블명
-
-    Returns:
-        bool: 테이블이 존재하면 True, 그렇지 않으면 False
-
-    Raises:
-        sqlite3.Error: 데이터베이스 쿼리 실행 중 오류 발생 시
-    """
-    try:
-        cursor.execute("""
-            SELECT name FROM sqlite_master
-            WHERE type='table' AND name=?
-        """, (table_name,))
-        return cursor.fetchone() is not None
-    except sqlite3.Error as e:
-        logging.error(f"테이블 존재 여부 확인 중 오류 발생: {e}")
-        return False
-
-def initialize_database():
-    """
-    ePub 변환기의 SQLite 데이터베이스를 초기화합니다.
-
-    데이터베이스 파일이 존재하지 않으면 새로 생성하고,
-    필요한 모든 테이블과 기본 데이터를 설정합니다.
-
-    생성되는 테이블:
-    - Stylesheet: QSS 테마 스타일 저장
-    - ChapterRegex: 챕터 구분용 정규식 패턴
-    - PunctuationRegex: 구두점 스타일링용 정규식
-    - FontInfo: 폰트 정보 및 설정
-    - EpubMeta: ePub 메타데이터 기본값
-
-    Returns:
-        None
-
-    Raises:
-        sqlite3.Error: 데이터베이스 연결 또는 테이블 생성 중 오류 발생 시
-        OSError: 데이터베이스 파일 생성 권한 없음
-    """
-    try:
-        db_exists = os.path.exists(DB_FILE)
-        conn = sqlite3.connect(DB_FILE)
-        cursor = conn.cursor()
-
-        if not db_exists:
-            logging.info("DB 파일이 존재하지 않아 새로 생성합니다...")
-        else:
-            logging.info("기존 DB 파일이 존재합니다. 테이블 구조를 확인합니다...")
-
-        # 각 테이블별로 존재 여부 확인 후 생성
-        tables_created = []
-
-    except sqlite3.Error as e:
-        logging.error(f"데이터베이스 초기화 중 오류 발생: {e}")
-        raise
-    except OSError as e:
-        logging.error(f"데이터베이스 파일 생성 중 오류 발생: {e}")
-        raise
-
-    # Stylesheet 테이블: QSS 테마 스타일 저장
-    if not table_exists(cursor, 'Stylesheet'):
-        cursor.execute("""
-        CREATE TABLE Stylesheet (
-            id INTEGER PRIMARY KEY AUTOINCREMENT, -- 고유 ID
-            name TEXT NOT NULL,                  -- 스타일 이름
-            description TEXT,                    -- 설명
-            content TEXT NOT NULL,               -- QSS 내용
-            is_default INTEGER DEFAULT 0,        -- 기본 적용 여부
-            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP -- 생성일시
-        );
-        """)
-        tables_created.append('Stylesheet')
-
-    # ChapterRegex 테이블: 챕터 구분용 정규식
-    if not table_exists(cursor, 'ChapterRegex'):
-        cursor.execute("""
-        CREATE TABLE ChapterRegex (
-            id INTEGER PRIMARY KEY AUTOINCREMENT, -- 고유 ID
-            name TEXT NOT NULL,                   -- 정규식 이름
-            example TEXT,                         -- 예시 텍스트
-            pattern TEXT NOT NULL,                -- 정규식 패턴
-            is_enabled INTEGER DEFAULT 1,         -- 활성화 여부
-            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-        );
-        """)
-        tables_created.append('ChapterRegex')
-
-    # PunctuationRegex 테이블: 괄호/기호 추출용 정규식
-    if not table_exists(cursor, 'PunctuationRegex'):
-        cursor.execute("""
-        CREATE TABLE PunctuationRegex (
-            id INTEGER PRIMARY KEY AUTOINCREMENT, -- 고유 ID
-            name TEXT NOT NULL,                   -- 정규식 이름
-            pattern TEXT NOT NULL,                -- 정규식 패턴
-            description TEXT,                     -- 설명
-            is_enabled INTEGER DEFAULT 1,         -- 활성화 여부
-            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-        );
-        """)
-        tables_created.append('PunctuationRegex')
-
-    # TextStyle 테이블: 텍스트 스타일 설정 (정렬, 굵기 등)
-    if not table_exists(cursor, 'TextStyle'):
-        cursor.execute("""
-        CREATE TABLE TextStyle (
-            id INTEGER PRIMARY KEY AUTOINCREMENT, -- 고유 ID
-            name TEXT NOT NULL,                   -- 스타일 이름
-            type TEXT NOT NULL,                   -- 구분 (chapter/main/bracket 등)
-            is_enabled INTEGER DEFAULT 1,         -- 활성화 여부
-            align TEXT DEFAULT 'left',            -- 정렬 (left/center/right)
-            font_style TEXT DEFAULT 'normal',     -- 스타일 (normal/bold/italic 등)
-            font_color TEXT DEFAULT '#000000',    -- 색상 (HEX)
-            description TEXT,                     -- 설명
-            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-        );
-        """)
-        tables_created.append('TextStyle')
-
-    # EpubHistory 테이블: ePub 생성 이력
-    if not table_exists(cursor, 'EpubHistory'):
-        cursor.execute("""
-        CREATE TABLE EpubHistory (
-            id INTEGER PRIMARY KEY AUTOINCREMENT, -- 고유 ID
-            file_name TEXT NOT NULL,              -- 출력 파일명
-            output_path TEXT,                     -- 출력 경로
-            title TEXT,                           -- 책 제목
-            author TEXT,                          -- 작가명
-            isbn TEXT,                            -- ISBN
-            generated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP, -- 생성일시
-            chapter_count INTEGER,                -- 챕터 수
-            duration_seconds REAL,                -- 생성 소요시간
-            setting_id INTEGER,                   -- 사용된 설정 ID
-            FOREIGN KEY(setting_id) REFERENCES EpubSetting(id)
-        );
-        """)
-        tables_created.append('EpubHistory')
-
-    # ChapterList 테이블: ePub별 목차 정보
-    if not table_exists(cursor, 'ChapterList'):
-        cursor.execute("""
-        CREATE TABLE ChapterList (
-            id INTEGER PRIMARY KEY AUTOINCREMENT, -- 고유 ID
-            epub_id INTEGER NOT NULL,             -- EpubHistory 참조 ID
-            chapter_index INTEGER NOT NULL,       -- 챕터 인덱스
-            chapter_title TEXT NOT NULL,          -- 챕터 제목
-            regex_used TEXT,                      -- 사용된 정규식
-            FOREIGN KEY(epub_id) REFERENCES EpubHistory(id) ON DELETE CASCADE
-        );
-        """)
-        tables_created.append('ChapterList')
-
-    # EpubSetting 테이블: ePub 생성 시 사용한 전체 세팅 정보 저장
-    if not table_exists(cursor, 'EpubSetting'):
-        cursor.execute("""
-        CREATE TABLE EpubSetting (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,     -- 고유 ID
-            name TEXT NOT NULL,                       -- 세팅 이름
-            description TEXT,                         -- 설명
-            use_body_font INTEGER DEFAULT 0,          -- 본문 폰트 포함 여부
-            use_chapter_font INTEGER DEFAULT 0,       -- 챕터 폰트 포함 여부
-            body_font_path TEXT,                      -- 본문 폰트 경로
-            chapter_font_path TEXT,                   -- 챕터 폰트 경로
-            stylesheet_id INTEGER,                    -- Stylesheet 테이블 참조
-            chapter_regex_id INTEGER,                 -- ChapterRegex 테이블 참조
-            punctuation_regex_ids TEXT,               -- 쉼표로 연결된 정규식 ID 목록
-            top_margin INTEGER DEFAULT 1,             -- 상단 여백
-            bottom_margin INTEGER DEFAULT 4,          -- 하단 여백
-            divide_by_chapter INTEGER DEFAULT 0,      -- 챕터별 분할 여부
-            chapter_style_enabled INTEGER DEFAULT 1,  -- 챕터 스타일 적용 여부
-            chapter_align TEXT DEFAULT 'center',      -- 챕터 정렬
-            chapter_font_style TEXT DEFAULT 'bold',   -- 챕터 폰트 스타일
-            chapter_font_color TEXT DEFAULT '#000000',-- 챕터 폰트 색상
-            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-            FOREIGN KEY(stylesheet_id) REFERENCES Stylesheet(id),
-            FOREIGN KEY(chapter_regex_id) REFERENCES ChapterRegex(id)
-        );
-        """)
-        tables_created.append('EpubSetting')
-
-    # AlignStyle 테이블: Left, Center, Right 정렬 스타일 저장
-    if not table_exists(cursor, 'AlignStyle'):
-        cursor.execute("""
-        CREATE TABLE AlignStyle (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,     -- 고유 ID
-            name TEXT NOT NULL,                       -- 세팅 이름 Left, Center, Right
-            description TEXT                          -- 설명 Left, Center, Right
-        );
-        """)
-        tables_created.append('AlignStyle')
-
-    # FontStyle 테이블: bold, italic, normal 폰트 스타일 저장
-    if not table_exists(cursor, 'FontStyle'):
-        cursor.execute("""
-        CREATE TABLE FontStyle (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,     -- 고유 ID
-            name TEXT NOT NULL,                       -- 세팅 이름 bold, italic, normal
-            description TEXT                          -- 설명 bold, italic, normal
-        );
-        """)
-        tables_created.append('FontStyle')
-
-    # 데이터 삽입 부분 - 테이블이 새로 생성된 경우에만 기본 데이터 삽입
-    data_inserted = []
-
-    # 기본 정규식 (ChapterRegex) - ChapterRegex 테이블이 비어있는 경우에만 삽입
-    cursor.execute("SELECT COUNT(*) FROM ChapterRegex")
-    if cursor.fetchone()[0] == 0:
-        chapter_regex = [
-            ("정규식 01", "[1화]", r"(.+\d+화.)"),
-            ("정규식 02", "005. 가나다라 1", r"(^[0-9]{3,}[.]\s.*.[0-9]$)"),
-            ("정규식 03", "0001 / 1050 ──────────", r"(^[0-9]{4,})(\s[/]\s[0-9]{4,}...........)"),
-            ("정규식 04", "2화 가나다라 (1)", r"(^[0-9]+화.*)"),
-            ("정규식 05", "< 가나다라 >", r"(<.*>)$"),
-            ("정규식 06", "＃1화 가나다라", r"^#\d+.*"),
-            ("정규식 07", "54. 가나다라", r"(\d+\.\s+.+)"),
-            ("정규식 08", "#50. 가나다라(3)", r"(#+\d+\.\s+.+)"),
-            ("정규식 09", "제1장 가나다라", r"^제\d+장\s+.*"),
-            ("정규식 10", "1", r"^\d+$"),
-            ("정규식 11", "제 1화", r"제\s*\d+화\.\s*[^\n]+"),
-            ("정규식 12", "외전 1화 - 가나다라 (2)", r"외전\s*\d+화\s*[-–]\s*[^\n]+"),
-            ("정규식 13", "=-=-=-=", r"=-=-=-="),
-            ("정규식 14", "", r"\b\d{5}\b"),
-            ("정규식 15", "00001 1화", r"\b\d{5}\s\d+화\b"),
-            ("정규식 16", "00001 1화 닥터최태수", r"\b\d{5}\s*\d+화\b"),
-            ("정규식 17", "1화 닥터최태수", r"\d+화\b"),
-            ("정규식 18", "2부 123화 가나다라", r"[0-9]+부\s[0-9]+화\s[^\n]+"),
-            ("정규식 19", "외전 1화", r"외전\s*\d+화"),
-            ("정규식 20", "<1화> 미 국세청 범죄수사국의 검은머리 요원", r"^<\d+화>.+$"),
-            ("정규식 21", "<천하제일 곤륜객잔 1권 1화>", r"<천하제일 곤륜객잔 \d+권 \d+화>"),
-            ("정규식 22", "대한민국 절대 재벌! 1화", r"대한민국 절대 재벌! \d{1,3}화"),
-            ("정규식 23", "< 001 : 프롤로그 >", r"< \d{3} : .+ >$"),
-            ("정규식 24", "524 : 대한민국의 방패", r"^\d{3} : .+$"),
-            ("정규식 25", "1편. 청동기 시대에서의 삶", r"^(?:외전\s*)?\d+편\.\s+.+$"),
-            ("정규식 26", "천마는 조용히 살고싶다-1화", r"천마는 조용히 살고싶다-\d{1,3}화"),
-            ("정규식 27", "01-천산의 객잔?", r"^\d{1,3}-(.*)$"),
-            ("정규식 28", "외전-", r"외전-(.*)$"),
-            ("정규식 29", "제1편", r"제\d+편\s+.*"),
-            ("정규식 30", "우주재벌 막내아들-1화", r"우주재벌 막내아들-\d{1,3}화"),
-            ("정규식 31", "만년만에 귀환한 플레이어 515화", r"만년만에\s귀환한\s플레이어\s(외전\s\(\d+\)|\d+)화"),
-            ("정규식 32", "< Episode 1. 유료 서비스 시작 (1) >", r"< Episode \d+\. [^>]+ >"),
-            ("정규식 33", "# [47화] 대장간", r"^# \[\d+화\] [^\(\r\n]+(?: \(\d+\))?$"),
-            ("정규식 34", "< 진주만에 입항 하다 >", r"^<[^>]+>(?!\s*끝)$"),
-            ("정규식 35", "048 - 비상 계엄 (7)", r"^\d{3} - .+ \(\d+\)$"),
-            ("정규식 36", "002 - 대혼란", r"^\d{3} - .+$"),
-            ("정규식 37", "1화", r"\b\d{1,3}화\b"),
-        ]
-
-        cursor.executemany("""
-            INSERT INTO ChapterRegex (name, example, pattern) VALUES (?, ?, ?)
-        """, chapter_regex)
-        data_inserted.append('ChapterRegex 기본 데이터')
-
-    # 정렬 스타일 (AlignStyle) - AlignStyle 테이블이 비어있는 경우에만 삽입
-    cursor.execute("SELECT COUNT(*) FROM AlignStyle")
-    if cursor.fetchone()[0] == 0:
-        align_Style = [
-            ("Left", "Left"),
-            ("Center", "Center"),
-            ("Right", "Right")
-        ]
-        cursor.executemany("""
-            INSERT INTO AlignStyle (name, description) VALUES (?, ?)
-        """, align_Style)
-        data_inserted.append('AlignStyle 기본 데이터')
-
-    # 폰트 스타일 (FontStyle) - FontStyle 테이블이 비어있는 경우에만 삽입
-    cursor.execute("SELECT COUNT(*) FROM FontStyle")
-    if cursor.fetchone()[0] == 0:
-        font_Style = [
-            ("Bold", "Bold"),
-            ("Italic", "Italic"),
-            ("Normal", "Normal")
-        ]
-        cursor.executemany("""
-            INSERT INTO FontStyle (name, description) VALUES (?, ?)
-        """, font_Style)
-        data_inserted.append('FontStyle 기본 데이터')
-
-    # 기본 괄호 정규식 (PunctuationRegex) - PunctuationRegex 테이블이 비어있는 경우에만 삽입
-    cursor.execute("SELECT COUNT(*) FROM PunctuationRegex")
-    if cursor.fetchone()[0] == 0:
-        punctuation_regex = [
-            ("'...'", r"[‘'](.*?)[’']", "작은 따옴표 감지"),
-            ('"..."', r'[“"](.*?)[”"]', "큰 따옴표 감지"),
-            ("(...) 괄호", r"\((.*?)\)", "소괄호 내용"),
-            ("[...] 괄호", r"\[(.*?)\]", "대괄호 내용")
-        ]
-        cursor.executemany("""
-            INSERT INTO PunctuationRegex (name, pattern, description) VALUES (?, ?, ?)
-        """, punctuation_regex)
-        data_inserted.append('PunctuationRegex 기본 데이터')
-
-    # 기본 스타일시트 (Stylesheet) - Stylesheet 테이블이 비어있는 경우에만 삽입
-    cursor.execute("SELECT COUNT(*) FROM Stylesheet")
-    if cursor.fetchone()[0] == 0:
-        # 기본 스타일시트
-        default_style = """
-
-/*
-    * Available at: https://github.com/GTRONICK/QSS/blob/master/Ubuntu.qss
-    * https://github.com/Abdulrahmantommy/StyleSheets-for-PyQt5/blob/main/MacOS.qss
-    * https://github.com/GTRONICK/QSS/blob/master/Aqua.qss
-    * https://www.pythonguis.com/faq/built-in-qicons-pyqt/ 아이콘
-*/
-
-/* QMainWindow */
-    QMainWindow {
-            background-color:#ffffff;
-
-            /* border: 1px solid #000000; 테두리 스타일 (1px 실선, 검정색) */
-            /* border-radius: 8px; 테두리 둥글기 설정 */
-            /* margin: 10px; 외부 여백 */
-            /* padding: 10px; 내부 여백 */
-            /* color: #ffffff; 기본 텍스트 색상 */
-            /* font-family: Arial, Helvetica, sans-serif; 폰트 패밀리 설정 */
-            /* font-size: 14px; 폰트 크기 */
-            /* min-width: 500px; 최소 너비 설정 */
-            /* min-height: 400px; 최소 높이 설정 */
-            /* opacity: 0.1; 창의 투명도 설정 (95% 불투명) */
-        }
-/* QCheckBox */
-    QCheckBox {
-            color: #000000; /* 체크박스의 기본 텍스트 색상 */
-            padding: 2px;   /* 체크박스와 텍스트 사이의 여백 */
-        }
-
-    QCheckBox:disabled {
-            color: rgb(81,72,65); /* 비활성화된 상태에서의 텍스트 색상 */
-            padding: 2px;         /* 비활성화 상태에서의 체크박스와 텍스트 사이의 여백 */
-        }
-
-    QCheckBox:hover {
-            border-radius: 4px;        /* 마우스 오버 시 체크박스의 테두리 둥글기 */
-            border-style: solid;       /* 마우스 오버 시 테두리의 스타일을 solid로 설정 */
-            padding-left: 1px;         /* 왼쪽 패딩 */
-            padding-right: 1px;        /* 오른쪽 패딩 */
-            padding-bottom: 1px;       /* 아래쪽 패딩 */
-            padding-top: 1px;          /* 위쪽 패딩 */
-            border-width: 1px;         /* 마우스 오버 시 테두리의 두께 */
-            border-color: transparent; /* 마우스 오버 시 테두리 색상 투명 처리 */
-        }
-
-    QCheckBox::indicator:checked {
-            height: 10px; /* 체크박스 크기 - 높이 */
-            width: 10px;  /* 체크박스 크기 - 너비 */
-            border-style: solid; /* 체크박스의 테두리 스타일 */
-            border-width: 1px;   /* 체크박스의 테두리 두께 */
-            border-color: qlineargradient(spread:pad, x1:0.5, y1:1, x2:0.5, y2:0, stop:0 rgba(246, 134, 86, 255), stop:1 rgba(246, 134, 86, 100));
-            /* 체크된 상태에서의 테두리 색상: 색상 변화가 있는 선형 그라디언트 */
-
-            color: #000000; /* 체크된 상태에서의 텍스트 색상 */
-            background-color: qlineargradient(spread:pad, x1:0.5, y1:1, x2:0.5, y2:0, stop:0 rgba(246, 134, 86, 255), stop:1 rgba(246, 134, 86, 100));
-            /* 체크된 상태에서의 배경 색상: 색상 변화가 있는 선형 그라디언트 */
-        }
-
-    QCheckBox::indicator:unchecked {
-            height: 10px; /* 체크되지 않은 상태에서의 체크박스 높이 */
-            width: 10px;  /* 체크되지 않은 상태에서의 체크박스 너비 */
-            border-style: solid; /* 체크되지 않은 상태에서의 테두리 스타일 */
-            border-width: 1px;   /* 체크되지 않은 상태에서의 테두리 두께 */
-            border-color: qlineargradient(spread:pad, x1:0.5, y1:1, x2:0.5, y2:0, stop:0 rgba(246, 134, 86, 255), stop:1 rgba(246, 134, 86, 100));
-            /* 체크되지 않은 상태에서의 테두리 색상: 색상 변화가 있는 선형 그라디언트 */
-
-            color: #000000; /* 체크되지 않은 상태에서의 텍스트 색상 */
-        }
-    QCheckBox::indicator:pressed {
-            background-color: rgba(200, 100, 50, 150); /* 눌렸을 때의 체크박스 배경색 */
-            border-color: rgba(100, 50, 25, 150);      /* 눌렸을 때의 테두리 색상 */
-        }
-
-    QCheckBox::indicator:hover {
-            background-color: rgba(255, 150, 100, 200); /* 마우스를 올렸을 때의 체크박스 배경색 */
-            border-color: rgba(100, 50, 25, 200);       /* 마우스를 올렸을 때의 테두리 색상 */
-        }
-
-    QCheckBox::indicator:disabled {
-            background-color: rgb(200, 200, 200); /* 비활성화 상태에서의 배경색 */
-            border-color: rgb(150, 150, 150);     /* 비활성화 상태에서의 테두리 색상 */
-        }
-
-    QColorDialog{
-            background-color:#f0f0f0;
-        }
-/* QComboBox */
-    QComboBox {
-            font-size: 14px;           /* 콤보박스 내부 텍스트의 글꼴 크기 */
-            color: rgb(81,72,65);      /* 콤보박스 텍스트 색상 */
-            background: #ffffff;       /* 콤보박스의 배경 색상 */
-            border: 1px solid #b0b0b0; /* 콤보박스의 테두리 색상 및 두께 */
-            padding: 2px;              /* 콤보박스 내부 여백 */
-            font-family: '맑은 고딕', Arial, sans-serif; /* 폰트 패밀리 설정 */
-        }
-
-    QComboBox:editable {
-            selection-color: rgb(81,72,65);          /* 편집 가능한 콤보박스에서 선택된 텍스트의 색상 */
-            selection-background-color: #ffffff;     /* 편집 가능한 콤보박스에서 선택된 항목의 배경 색상 */
-            font-size: 14px;                         /* 편집 가능한 콤보박스에서의 글꼴 크기 */
-        }
-
-    QComboBox QAbstractItemView {
-            selection-color: #ffffff;                /* 콤보박스 드롭다운에서 선택된 항목의 텍스트 색상 */
-            selection-background-color: rgb(246, 134, 86); /* 콤보박스 드롭다운에서 선택된 항목의 배경 색상 */
-            font-size: 14px;                         /* 드롭다운 항목의 글꼴 크기 */
-            color: rgb(81,72,65);                    /* 드롭다운 항목의 텍스트 색상 */
-        }
-
-    QComboBox:!editable:on, QComboBox::drop-down:editable:on {
-            color:  #1e1d23;   /* 편집 불가능한 콤보박스 및 드롭다운 버튼을 눌렀을 때의 텍스트 색상 */
-            font-size: 14px;   /* 편집 불가능한 콤보박스에서의 글꼴 크기 */
-        }
-
-    QComboBox::drop-down {
-            subcontrol-origin: padding;        /* 드롭다운 버튼의 위치 */
-            subcontrol-position: top right;    /* 드롭다운 버튼을 콤보박스의 오른쪽 상단에 위치시킴 */
-            width: 25px;                       /* 드롭다운 버튼의 너비 */
-            border-left-width: 1px;            /* 드롭다운 버튼의 왼쪽 테두리 두께 */
-            border-left-color: darkgray;       /* 드롭다운 버튼의 왼쪽 테두리 색상 */
-            border-left-style: solid;          /* 드롭다운 버튼의 왼쪽 테두리 스타일 */
-        }
-
-    QComboBox::down-arrow {
-            image: url("resource/dropdown.png");        /* 드롭다운 화살표 이미지 */
-            width: 10px;                       /* 화살표의 너비 */
-            height: 10px;                      /* 화살표의 높이 */
-        }
-
-    QComboBox::item {
-            padding: 5px;                      /* 드롭다운 메뉴 항목의 패딩 */
-            background-color: #f0f0f0;         /* 드롭다운 메뉴 항목의 배경 색상 */
-            color: rgb(81,72,65);              /* 드롭다운 메뉴 항목의 텍스트 색상 */
-            font-size: 14px;                   /* 드롭다운 메뉴 항목의 글꼴 크기 */
-            font-family:'맑은 고딕', Arial, sans-serif;    /* 드롭다운 메뉴 항목의 폰트 패밀리 */
-        }
-
-    QComboBox::item:selected {
-            background-color: rgb(246, 134, 86); /* 선택된 항목의 배경 색상 */
-            color: #ffffff;                      /* 선택된 항목의 텍스트 색상 */
-        }
-
-    QComboBox::hover {
-            border: 1px solid #555;              /* 콤보박스 위로 마우스를 올렸을 때의 테두리 색상 */
-            background-color: #eaeaea;           /* 콤보박스 위로 마우스를 올렸을 때의 배경 색상 */
-        }
-
-    QDateTimeEdit, QDateEdit, QDoubleSpinBox, QFontComboBox {
-        color:rgb(81,72,65);
-        background-color: #ffffff;
-    }
-
-    QDialog {
-        background-color:#ffffff;
-    }
-
-/* QLabel */
-    QLabel {
-        color: rgb(17, 17, 17);          /* 글자 색상을 어두운 회색으로 설정 */
-        font-size: 14px;                 /* 글자 크기를 14px로 설정 */
-        font-family: "맑은 고딕", "Arial", sans-serif;/* 글꼴을 Arial로 설정 */
-        padding: 5px;                    /* 레이블 안쪽 여백을 5px로 설정 */
-        text-align: left;              /* 텍스트를 중앙 정렬 */
-        /* background-color: #ffffff;       배경 색상을 흰색으로 설정 */
-        /* font-weight: bold;               글자 두께를 굵게 설정 */
-        /* font-style: italic;              글자에 이탤릭 스타일을 적용 */
-        /* border: 1px solid #d3d3d3;       테두리를 회색으로 설정 */
-        /* border-radius: 5px;              테두리를 둥글게 설정 */
-        /* min-width: 100px;                레이블의 최소 너비를 100px로 설정 */
-        /* min-height: 30px;                레이블의 최소 높이를 30px로 설정 */
-        /* margin: 5px;                     레이블 외부 여백을 5px로 설정 */
-        /* text-shadow: 1px 1px 2px rgba(0, 0,255, 0.5); 텍스트 그림자 효과 */
-    }
-    QWidget#convert_tab QLabel#title_font_info_label,  QWidget#convert_tab QLabel#font_info_label{
-        color: rgb(0, 0, 0);          /* 글자 색상 설정 */
-        font-size: 16px;                /*  글자 크기를 14px로 설정 */
-        text-align: left;              /* 텍스트 정렬 */
-
-    }
-    QWidget#metadata_tab QLabel#cover_label, QWidget#metadata_tab QLabel#chapter_label {
-        border: 1px solid #0b8657;     /*  빨간색 테두리를 설정 */
-        /* color: rgb(255, 0, 0);           글자 색상을 빨간색으로 설정 */
-        /* background-color: #f0f0f0;       배경 색상을 밝은 회색으로 설정 */
-        /* font-size: 16px;                 글자 크기를 16px로 설정 */
-        /* font-family: "Verdana", sans-serif; 글꼴을 Verdana로 설정 */
-        /* font-weight: normal;             글자 두께를 기본값으로 설정 */
-        /* border-radius: 10px;             테두리를 더 둥글게 설정 */
-        /* padding: 10px;                   내부 여백을 넉넉하게 설정 */
-        /* text-align: right;               텍스트를 오른쪽으로 정렬 */
-    }
-    /* 특정 레이블 (cover_label, chapter_label) 마우스 hover 시 스타일 */
-    QWidget#metadata_tab QLabel#cover_label:hover, QWidget#metadata_tab QLabel#chapter_label:hover {
-        border: 2px solid #ff0000;       /* 마우스 hover 시 테두리를 빨간색으로 설정 */
-        background-color: #f5f5f5;       /* 마우스 hover 시 배경 색상을 밝은 회색으로 설정 */
-        color: rgb(0, 0, 255);           /* 마우스 hover 시 글자 색상을 파란색으로 설정 */
-    }
-
-/* QLineEdit */
-    QLineEdit {
-        color: rgb(17, 17, 17);                  /* 글자 색상을 어두운 회색으로 설정 */
-        background-color: rgb(255, 255, 255);    /* 배경 색상을 흰색으로 설정 */
-        border: 1px solid rgb(200, 200, 200);    /* 테두리 색상을 연한 회색으로 설정 */
-        border-radius: 5px;                      /* 테두리를 둥글게 설정 (5px 반지름) */
-        padding: 5px;                            /* 내부 여백을 5px로 설정 */
-        font-size: 14px;                         /* 글자 크기를 14px로 설정 */
-        font-family: "맑은 고딕", "Arial", sans-serif; /* 글꼴을 Arial로 설정 */
-        selection-background-color: rgb(236, 116, 64); /* 선택된 텍스트의 배경 색상을 오렌지색으로 설정 */
-        selection-color: rgb(255, 255, 255);     /* 선택된 텍스트의 글자 색상을 흰색으로 설정 */
-    }
-
-    /* QLineEdit 마우스 hover 시 스타일 */
-    QLineEdit:hover {
-        border: 2px solid rgb(236, 116, 64);     /* 마우스 hover 시 테두리를 오렌지색으로 설정 */
-        background-color: rgb(245, 245, 245);    /* 마우스 hover 시 배경 색상을 밝은 회색으로 설정 */
-    }
-
-    /* QLineEdit 활성화된 상태 (focus) 시 스타일 */
-    QLineEdit:focus {
-        border: 2px solid rgb(236, 116, 64);     /* 입력 상태일 때 테두리 두께를 더 두껍게 설정하고 오렌지색으로 설정 */
-        background-color: rgb(255, 255, 255);    /* 입력 상태일 때 배경 색상을 흰색으로 설정 */
-        color: rgb(0, 0, 0);                    /* 입력 상태일 때 글자 색상을 검은색으로 설정 */
-        font-weight: bold;                       /* 입력 상태일 때 글자 두께를 굵게 설정 */
-        outline: none;                           /* 기본 포커스 아웃라인 제거 */
-    }
-
-    /* QLineEdit 비활성화 (disabled) 상태일 때 스타일 */
-    QLineEdit:disabled {
-        background-color: rgb(230, 230, 230);    /* 비활성화 시 배경 색상을 연한 회색으로 설정 */
-        color: rgb(150, 150, 150);               /* 비활성화 시 글자 색상을 흐린 회색으로 설정 */
-        border: 1px solid rgb(200, 200, 200);    /* 비활성화 시 테두리를 연한 회색으로 설정 */
-    }
-
-    /* QLineEdit 읽기 전용 (read-only) 상태일 때 스타일 */
-    QLineEdit[readOnly="true"] {
-        background-color: rgb(240, 240, 240);    /* 읽기 전용일 때 배경 색상을 밝은 회색으로 설정 */
-        color: rgb(100, 100, 100);               /* 읽기 전용일 때 글자 색상을 중간 회색으로 설정 */
-        border: 1px solid rgb(200, 200, 200);    /* 읽기 전용일 때 테두리를 연한 회색으로 설정 */
-        font-style: italic;                      /* 읽기 전용일 때 글자를 이탤릭체로 설정 */
-    }
-
-
-    QMenuBar {
-        color:rgb(223,219,210);
-        background-color:rgb(65,64,59);
-    }
-    QMenuBar::item {
-        padding-top:4px;
-        padding-left:4px;
-        padding-right:4px;
-        color:rgb(223,219,210);
-        background-color:rgb(65,64,59);
-    }
-    QMenuBar::item:selected {
-        color:rgb(255,255,255);
-        padding-top:2px;
-        padding-left:2px;
-        padding-right:2px;
-        border-top-width:2px;
-        border-left-width:2px;
-        border-right-width:2px;
-        border-top-right-radius:4px;
-        border-top-left-radius:4px;
-        border-style:solid;
-        background-color:rgb(65,64,59);
-        border-top-color: rgb(47,47,44);
-        border-right-color: qlineargradient(spread:pad, x1:0, y1:1, x2:1, y2:0, stop:0 rgba(90, 87, 78, 255), stop:1 rgba(47,47,44, 255));
-        border-left-color:  qlineargradient(spread:pad, x1:1, y1:0, x2:0, y2:0, stop:0 rgba(90, 87, 78, 255), stop:1 rgba(47,47,44, 255));
-    }
-    QMenu {
-        color:rgb(223,219,210);
-        background-color:rgb(65,64,59);
-    }
-    QMenu::item {
-        color:rgb(223,219,210);
-        padding:4px 10px 4px 20px;
-    }
-    QMenu::item:selected {
-        color:rgb(255,255,255);
-        background-color: qlineargradient(spread:pad, x1:0.5, y1:1, x2:0.5, y2:0, stop:0 rgba(225, 108, 54, 255), stop:1 rgba(246, 134, 86, 255));
-        border-style:solid;
-        border-width:3px;
-        padding:4px 7px 4px 17px;
-        border-bottom-color:qlineargradient(spread:pad, x1:0.5, y1:1, x2:0.5, y2:0, stop:0 rgba(175,85,48,255), stop:1 rgba(236,114,67, 255));
-        border-top-color:qlineargradient(spread:pad, x1:0.5, y1:1, x2:0.5, y2:0, stop:0 rgba(253,156,113,255), stop:1 rgba(205,90,46, 255));
-        border-right-color:qlineargradient(spread:pad, x1:0, y1:0.5, x2:1, y2:0.5, stop:0 rgba(253,156,113,255), stop:1 rgba(205,90,46, 255));
-        border-left-color:qlineargradient(spread:pad, x1:1, y1:0.5, x2:0, y2:0.5, stop:0 rgba(253,156,113,255), stop:1 rgba(205,90,46, 255));
-    }
-
-    QPlainTextEdit {
-        border: 1px solid transparent;
-        color:rgb(17,17,17);
-        selection-background-color:rgb(236,116,64);
-        background-color: #FFFFFF;
-    }
-
-    QProgressBar {
-        text-align: center;
-        color: rgb(0, 0, 0);
-        border: 1px inset rgb(150,150,150);
-        border-radius: 10px;
-        background-color:rgb(221,221,219);
-    }
-    QProgressBar::chunk:horizontal {
-        background-color: qlineargradient(spread:pad, x1:0.5, y1:1, x2:0.5, y2:0, stop:0 rgba(225, 108, 54, 255), stop:1 rgba(246, 134, 86, 255));
-        border:1px solid;
-        border-radius:8px;
-        border-bottom-color:qlineargradient(spread:pad, x1:0.5, y1:1, x2:0.5, y2:0, stop:0 rgba(175,85,48,255), stop:1 rgba(236,114,67, 255));
-        border-top-color:qlineargradient(spread:pad, x1:0.5, y1:1, x2:0.5, y2:0, stop:0 rgba(253,156,113,255), stop:1 rgba(205,90,46, 255));
-        border-right-color:qlineargradient(spread:pad, x1:0, y1:0.5, x2:1, y2:0.5, stop:0 rgba(253,156,113,255), stop:1 rgba(205,90,46, 255));
-        border-left-color:qlineargradient(spread:pad, x1:1, y1:0.5, x2:0, y2:0.5, stop:0 rgba(253,156,113,255), stop:1 rgba(205,90,46, 255));
-    }
-    QPushButton{
-        color:rgb(17,17,17);
-        border-width: 1px;
-        border-radius: 6px;
-        border-bottom-color: rgb(150,150,150);
-        border-right-color: rgb(165,165,165);
-        border-left-color: rgb(165,165,165);
-        border-top-color: rgb(180,180,180);
-        border-style: solid;
-        padding: 4px;
-        background-color: qlineargradient(spread:pad, x1:0.5, y1:1, x2:0.5, y2:0, stop:0 rgba(220, 220, 220, 255), stop:1 rgba(255, 255, 255, 255));
-    }
-    QPushButton:hover{
-        color:rgb(17,17,17);
-        border-width: 1px;
-        border-radius:6px;
-        border-top-color: rgb(255,150,60);
-        border-right-color: qlineargradient(spread:pad, x1:0, y1:1, x2:1, y2:0, stop:0 rgba(200, 70, 20, 255), stop:1 rgba(255,150,60, 255));
-        border-left-color:  qlineargradient(spread:pad, x1:1, y1:0, x2:0, y2:0, stop:0 rgba(200, 70, 20, 255), stop:1 rgba(255,150,60, 255));
-        border-bottom-color: rgb(200,70,20);
-        border-style: solid;
-        padding: 2px;
-        background-color: qlineargradient(spread:pad, x1:0.5, y1:1, x2:0.5, y2:0, stop:0 rgba(220, 220, 220, 255), stop:1 rgba(255, 255, 255, 255));
-    }
-    QPushButton:default{
-        color:rgb(17,17,17);
-        border-width: 1px;
-        border-radius:6px;
-        border-top-color: rgb(255,150,60);
-        border-right-color: qlineargradient(spread:pad, x1:0, y1:1, x2:1, y2:0, stop:0 rgba(200, 70, 20, 255), stop:1 rgba(255,150,60, 255));
-        border-left-color:  qlineargradient(spread:pad, x1:1, y1:0, x2:0, y2:0, stop:0 rgba(200, 70, 20, 255), stop:1 rgba(255,150,60, 255));
-        border-bottom-color: rgb(200,70,20);
-        border-style: solid;
-        padding: 2px;
-        background-color: qlineargradient(spread:pad, x1:0.5, y1:1, x2:0.5, y2:0, stop:0 rgba(220, 220, 220, 255), stop:1 rgba(255, 255, 255, 255));
-    }
-
-    QPushButton:pressed{
-        color:rgb(17,17,17);
-        border-width: 1px;
-        border-radius: 6px;
-        border-width: 1px;
-        border-top-color: rgba(255,150,60,200);
-        border-right-color: qlineargradient(spread:pad, x1:0, y1:1, x2:1, y2:0, stop:0 rgba(200, 70, 20, 255), stop:1 rgba(255,150,60, 200));
-        border-left-color:  qlineargradient(spread:pad, x1:1, y1:0, x2:0, y2:0, stop:0 rgba(200, 70, 20, 255), stop:1 rgba(255,150,60, 200));
-        border-bottom-color: rgba(200,70,20,200);
-        border-style: solid;
-        padding: 2px;
-        background-color: qlineargradient(spread:pad, x1:0.5, y1:0, x2:0.5, y2:1, stop:0 rgba(220, 220, 220, 255), stop:1 rgba(255, 255, 255, 255));
-    }
-    QPushButton:disabled{
-        color:rgb(174,167,159);
-        border-width: 1px;
-        border-radius: 6px;
-        background-color: qlineargradient(spread:pad, x1:0.5, y1:1, x2:0.5, y2:0, stop:0 rgba(200, 200, 200, 255), stop:1 rgba(230, 230, 230, 255));
-    }
-    QRadioButton {
-        padding: 1px;
-    }
-    QRadioButton::indicator:checked {
-        height: 10px;
-        width: 10px;
-        border-style:solid;
-        border-radius:5px;
-        border-width: 1px;
-        border-color: rgba(246, 134, 86, 255);
-        color: #a9b7c6;
-        background-color:rgba(246, 134, 86, 255);
-    }
-    QRadioButton::indicator:!checked {
-        height: 10px;
-        width: 10px;
-        border-style:solid;
-        border-radius:5px;
-        border-width: 1px;
-        border-color: rgb(246, 134, 86);
-        color: #a9b7c6;
-        background-color: transparent;
-    }
-    QScrollArea {
-        color: white;
-        background-color:#f0f0f0;
-    }
-    QSlider::groove {
-        border-style: solid;
-        border-width: 1px;
-        border-color: rgb(207,207,207);
-    }
-    QSlider::groove:horizontal {
-        height: 5px;
-        background: rgb(246, 134, 86);
-    }
-    QSlider::groove:vertical {
-        width: 5px;
-        background: rgb(246, 134, 86);
-    }
-    QSlider::handle:horizontal {
-        background: rgb(253,253,253);
-        border-style: solid;
-        border-width: 1px;
-        border-color: rgb(207,207,207);
-        width: 12px;
-        margin: -5px 0;
-        border-radius: 7px;
-    }
-    QSlider::handle:vertical {
-        background: rgb(253,253,253);
-        border-style: solid;
-        border-width: 1px;
-        border-color: rgb(207,207,207);
-        height: 12px;
-        margin: 0 -5px;
-        border-radius: 7px;
-    }
-    QSlider::add-page:horizontal, QSlider::add-page:vertical {
-        background: white;
-    }
-    QSlider::sub-page:horizontal, QSlider::sub-page:vertical {
-        background: rgb(246, 134, 86);
-    }
-    QStatusBar {
-        color:rgb(81,72,65);
-    }
-
-/* QSpinBox, QDoubleSpinBox */
-    /* General QSpinBox and QDoubleSpinBox styling */
-    QSpinBox, QDoubleSpinBox {
-        background-color: #ffffff;              /* White background */
-        color: rgb(17, 17, 17);                 /* Text color */
-        border: 1px solid rgb(200, 200, 200);   /* Border color */
-        border-radius: 5px;                     /* Rounded corners */
-        padding-right: 18px;                    /* Space for the up and down buttons */
-        font-size: 14px;                        /* Font size */
-        font-family: "맑은 고딕", "Arial", sans-serif; /* Font family */
-        min-width: 60px;                        /* Minimum width */
-    }
-
-    /* Up and down button positions */
-    QSpinBox::up-button, QDoubleSpinBox::up-button {
-        subcontrol-origin: padding;              /* Align the button within the padding */
-        subcontrol-position: top right;          /* Place the up button in the top right */
-        width: 16px;                             /* Width of the up button */
-        border-left: 1px solid rgb(200, 200, 200); /* Add a separator for the up button */
-        background-color: rgb(245, 245, 245);    /* Button background color */
-        border-top-right-radius: 5px;            /* Rounded top right corner */
-    }
-
-    QSpinBox::down-button, QDoubleSpinBox::down-button {
-        subcontrol-origin: padding;              /* Align the button within the padding */
-        subcontrol-position: bottom right;       /* Place the down button in the bottom right */
-        width: 16px;                             /* Width of the down button */
-        border-left: 1px solid rgb(200, 200, 200); /* Add a separator for the down button */
-        background-color: rgb(245, 245, 245);    /* Button background color */
-        border-bottom-right-radius: 5px;         /* Rounded bottom right corner */
-    }
-
-    /* Arrow icons */
-    QSpinBox::up-arrow, QDoubleSpinBox::up-arrow {
-        image: url("resource/arrow-up.png");     /* Up arrow icon */
-        width: 10px;                             /* Icon width */
-        height: 10px;                            /* Icon height */
-    }
-
-    QSpinBox::down-arrow, QDoubleSpinBox::down-arrow {
-        image: url("resource/arrow-down.png");   /* Down arrow icon */
-        width: 10px;                             /* Icon width */
-        height: 10px;                            /* Icon height */
-    }
-
-    /* Hover effect */
-    QSpinBox:hover, QDoubleSpinBox:hover {
-        border: 1px solid rgb(236, 116, 64);     /* Orange border on hover */
-    }
-
-    /* Focus effect */
-    QSpinBox:focus, QDoubleSpinBox:focus {
-        border: 2px solid rgb(236, 116, 64);     /* Thicker border when focused */
-        background-color: rgb(255, 255, 255);    /* White background when focused */
-    }
-
-    /* Disabled state */
-    QSpinBox:disabled, QDoubleSpinBox:disabled {
-        background-color: rgb(230, 230, 230);    /* Light gray background when disabled */
-        color: rgb(150, 150, 150);               /* Gray text when disabled */
-        border: 1px solid rgb(200, 200, 200);    /* Gray border when disabled */
-    }
-
-    QScrollBar:horizontal {
-        max-height: 20px;
-        border: 1px transparent;
-        margin: 0px 20px 0px 20px;
-    }
-    QScrollBar::handle:horizontal {
-        background: rgb(253,253,253);
-        border: 1px solid rgb(207,207,207);
-        border-radius: 7px;
-        min-width: 25px;
-    }
-    QScrollBar::handle:horizontal:hover {
-        background: rgb(253,253,253);
-        border: 1px solid rgb(255,150,60);
-        border-radius: 7px;
-        min-width: 25px;
-    }
-    QScrollBar::add-line:horizontal {
-        border: 1px solid rgb(207,207,207);
-        border-top-right-radius: 7px;
-        border-top-left-radius: 7px;
-        border-bottom-right-radius: 7px;
-        background: rgb(255, 255, 255);
-        width: 20px;
-        subcontrol-position: right;
-        subcontrol-origin: margin;
-    }
-    QScrollBar::add-line:horizontal:hover {
-        border: 1px solid rgb(255,150,60);
-        border-top-right-radius: 7px;
-        border-top-left-radius: 7px;
-        border-bottom-right-radius: 7px;
-        background: rgb(255, 255, 255);
-        width: 20px;
-        subcontrol-position: right;
-        subcontrol-origin: margin;
-    }
-    QScrollBar::add-line:horizontal:pressed {
-        border: 1px solid grey;
-        border-top-left-radius: 7px;
-        border-top-right-radius: 7px;
-        border-bottom-right-radius: 7px;
-        background: rgb(231,231,231);
-        width: 20px;
-        subcontrol-position: right;
-        subcontrol-origin: margin;
-    }
-    QScrollBar::sub-line:horizontal {
-        border: 1px solid rgb(207,207,207);
-        border-top-right-radius: 7px;
-        border-top-left-radius: 7px;
-        border-bottom-left-radius: 7px;
-        background: rgb(255, 255, 255);
-        width: 20px;
-        subcontrol-position: left;
-        subcontrol-origin: margin;
-    }
-    QScrollBar::sub-line:horizontal:hover {
-        border: 1px solid rgb(255,150,60);
-        border-top-right-radius: 7px;
-        border-top-left-radius: 7px;
-        border-bottom-left-radius: 7px;
-        background: rgb(255, 255, 255);
-        width: 20px;
-        subcontrol-position: left;
-        subcontrol-origin: margin;
-    }
-    QScrollBar::sub-line:horizontal:pressed {
-        border: 1px solid grey;
-        border-top-right-radius: 7px;
-        border-top-left-radius: 7px;
-        border-bottom-left-radius: 7px;
-        background: rgb(231,231,231);
-        width: 20px;
-        subcontrol-position: left;
-        subcontrol-origin: margin;
-    }
-    QScrollBar::left-arrow:horizontal {
-        border: 1px transparent grey;
-        border-top-left-radius: 3px;
-        border-bottom-left-radius: 3px;
-        width: 6px;
-        height: 6px;
-        background: rgb(230,230,230);
-    }
-    QScrollBar::right-arrow:horizontal {
-        border: 1px transparent grey;
-        border-top-right-radius: 3px;
-        border-bottom-right-radius: 3px;
-        width: 6px;
-        height: 6px;
-        background: rgb(230,230,230);
-    }
-    QScrollBar::add-page:horizontal, QScrollBar::sub-page:horizontal {
-        background: none;
-    }
-    QScrollBar:vertical {
-        max-width: 20px;
-        border: 1px transparent grey;
-        margin: 20px 0px 20px 0px;
-    }
-    QScrollBar::add-line:vertical {
-        border: 1px solid;
-        border-color: rgb(207,207,207);
-        border-bottom-right-radius: 7px;
-        border-bottom-left-radius: 7px;
-        border-top-left-radius: 7px;
-        background: rgb(255, 255, 255);
-        height: 20px;
-        subcontrol-position: bottom;
-        subcontrol-origin: margin;
-    }
-    QScrollBar::add-line:vertical:hover {
-        border: 1px solid;
-        border-color: rgb(255,150,60);
-        border-bottom-right-radius: 7px;
-        border-bottom-left-radius: 7px;
-        border-top-left-radius: 7px;
-        background: rgb(255, 255, 255);
-        height: 20px;
-        subcontrol-position: bottom;
-        subcontrol-origin: margin;
-    }
-    QScrollBar::add-line:vertical:pressed {
-        border: 1px solid grey;
-        border-bottom-left-radius: 7px;
-        border-bottom-right-radius: 7px;
-        border-top-left-radius: 7px;
-        background: rgb(231,231,231);
-        height: 20px;
-        subcontrol-position: bottom;
-        subcontrol-origin: margin;
-    }
-    QScrollBar::sub-line:vertical {
-        border: 1px solid rgb(207,207,207);
-        border-top-right-radius: 7px;
-        border-top-left-radius: 7px;
-        border-bottom-left-radius: 7px;
-        background: rgb(255, 255, 255);
-        height: 20px;
-        subcontrol-position: top;
-        subcontrol-origin: margin;
-    }
-    QScrollBar::sub-line:vertical:hover {
-        border: 1px solid rgb(255,150,60);
-        border-top-right-radius: 7px;
-        border-top-left-radius: 7px;
-        border-bottom-left-radius: 7px;
-        background: rgb(255, 255, 255);
-        height: 20px;
-        subcontrol-position: top;
-        subcontrol-origin: margin;
-    }
-    QScrollBar::sub-line:vertical:pressed {
-        border: 1px solid grey;
-        border-top-left-radius: 7px;
-        border-top-right-radius: 7px;
-        background: rgb(231,231,231);
-        height: 20px;
-        subcontrol-position: top;
-        subcontrol-origin: margin;
-    }
-    QScrollBar::handle:vertical {
-        background: rgb(253,253,253);
-        border: 1px solid rgb(207,207,207);
-        border-radius: 7px;
-        min-height: 25px;
-    }
-    QScrollBar::handle:vertical:hover {
-        background: rgb(253,253,253);
-        border: 1px solid rgb(255,150,60);
-        border-radius: 7px;
-        min-height: 25px;
-    }
-    QScrollBar::up-arrow:vertical {
-        border: 1px transparent grey;
-        border-top-left-radius: 3px;
-        border-top-right-radius: 3px;
-        width: 6px;
-        height: 6px;
-        background: rgb(230,230,230);
-    }
-    QScrollBar::down-arrow:vertical {
-        border: 1px transparent grey;
-        border-bottom-left-radius: 3px;
-        border-bottom-right-radius: 3px;
-        width: 6px;
-        height: 6px;
-        background: rgb(230,230,230);
-    }
-    QScrollBar::add-page:vertical, QScrollBar::sub-page:vertical {
-        background: none;
-    }
-
-/* QTabWidget */
-    QTabWidget {
-        color:rgb(0,0,0);
-        background-color:rgb(247,246,246);
-    }
-    QTabWidget::pane {
-        border-color: rgba(136, 136, 136, 255);
-        background-color:rgb(247,246,246);
-        border-style: solid;
-        border-width: 1px;
-        border-radius: 6px;
-    }
-    QTabBar::tab {
-        padding-left:4px;
-        padding-right:4px;
-        padding-bottom:2px;
-        padding-top:2px;
-        color:rgb(81,72,65);
-        background-color: qlineargradient(spread:pad, x1:0.5, y1:1, x2:0.5, y2:0, stop:0 rgba(221,218,217,255), stop:1 rgba(240,239,238,255));
-        border-style: solid;
-        border-width: 1px;
-        border-top-right-radius:4px;
-        border-top-left-radius:4px;
-        border-top-color: rgb(180,180,180);
-        border-left-color: rgb(180,180,180);
-        border-right-color: rgb(180,180,180);
-        border-bottom-color: transparent;
-    }
-    QTabBar::tab:selected, QTabBar::tab:last:selected, QTabBar::tab:hover {
-        font-weight: bold;
-        background-color:rgba(99, 214, 109, 255);
-        margin-left: 0px;
-        margin-right: 1px;
-    }
-    QTabBar::tab:!selected {
-        margin-top: 1px;
-        margin-right: 1px;
-    }
-
-/* QTextEdit */
-    QTextEdit {
-        border-width: 1px;
-        border-style: solid;
-        border-color:t rgb(180,180,180);
-        color:rgb(17,17,17);
-        selection-background-color:rgb(236,116,64);
-    }
-    QTextEdit:hover {
-        border-width: 1px;
-        border-style: solid;
-        border-color:rgb(180,180,180);
-        color:rgb(17,17,17);
-        selection-background-color:rgb(236,116,64);
-    }
-    QTextEdit:focus {
-        border-width: 1px;
-        border-style: solid;
-        border-color:rgb(180,180,180);
-        color:rgb(17,17,17);
-        selection-background-color:rgb(236,116,64);
-    }
-
-    QTimeEdit, QToolBox, QToolBox::tab, QToolBox::tab:selected {
-        color:rgb(81,72,65);
-        background-color: #ffffff;
-    }
-
-    QToolTip
-        {
-            background-color: #f7ff8d;        /* 툴팁의 배경색을 어두운 회색으로 설정 */
-            color: #000000;                   /* 툴팁의 글자색을 흰색으로 설정 */
-            border: 1px solid #ffee00;        /* 테두리를 주황색으로 설정 */
-            border-radius: 3px;               /* 테두리를 둥글게 설정 */
-            padding: 5px;                     /* 툴팁 내부 여백 설정 */
-            font-size: 12px;                  /* 툴팁의 글자 크기를 12px로 설정 */
-            font-family: "맑은 고딕", "Arial", sans-serif; /* 툴팁의 글꼴을 Arial로 설정 */
-            /* font-weight: bold;                글자 굵기를 볼드체로 설정 */
-            /* font-style: italic;               글자에 이탤릭 스타일을 적용 */
-            /* letter-spacing: 1px;              글자 간격을 넓힘 */
-            /* text-shadow: 1px 1px 2px rgba(0, 0, 0, 150); 툴팁 텍스트에 그림자 효과 적용 */
-            /* box-shadow: 3px 3px 6px rgba(0, 0, 0, 150);  툴팁 자체에 그림자 효과 적용 */
-            opacity: 220;                     /* 툴팁의 투명도 설정 (0-255) */
-        }
-/* QGroupBox */
-    /* QGroupBox 기본 스타일 */
-
-    QGroupBox {
-        border: 2px solid #8f8f91;              /* 테두리 설정 */
-        border-radius: 5px;                     /* 테두리를 둥글게 설정 */
-        background-color: #ffffff;              /* 배경 색상을 흰색으로 설정 */
-        padding: 10px;                          /* QGroupBox 내부 패딩 */
-        margin-top: 10px;                       /* QGroupBox 상단 여백 설정 */
-
-        /* 3D 효과를 위한 입체 테두리 */
-        border-top-color: #d3d3d3;              /* 상단 테두리 색상 (밝은 색) */
-        border-left-color: #d3d3d3;             /* 왼쪽 테두리 색상 (밝은 색) */
-        border-right-color: #5c5c5c;            /* 오른쪽 테두리 색상 (어두운 색) */
-        border-bottom-color: #5c5c5c;           /* 하단 테두리 색상 (어두운 색) */
-
-        /* 그림자 효과 추가 */
-        box-shadow: 3px 3px 6px rgba(0, 0, 0, 0.3); /* 그림자 효과 (X축, Y축, 흐림 정도, 색상) */
-    }
-
-    /* QGroupBox 제목에 3D 효과 적용 */
-    QGroupBox::title {
-        subcontrol-origin: margin;                /* 제목 위치를 테두리 안쪽으로 설정 */
-        subcontrol-position: top left;            /* 제목 위치: 상단 왼쪽 */
-        padding: 0 5px;                           /* 제목의 좌우 여백 */
-        color: #333333;                           /* 제목 글자 색상 */
-        background-color: rgba(255, 255, 255, 0.8);                /* 제목의 배경 색상 */
-        font-size: 14px;                          /* 제목 글자 크기 */
-        font-weight: bold;                        /* 제목 글자 두께 설정 */
-        font-family: "맑은 고딕", "Arial", sans-serif; /* 제목 폰트 설정 */
-
-        /* 제목에도 약간의 그림자 효과 추가 */
-        text-shadow: 1px 1px 2px rgba(0, 0, 0, 0.2); /* 제목 텍스트에 그림자 추가 */
-    }
-
-    /* QGroupBox의 hover(마우스를 올렸을 때) 상태 */
-    QGroupBox:hover {
-        border-color: #f28f43;            /* 마우스를 올렸을 때 테두리 색상을 변경 */
-    }
-
-    /* QGroupBox가 비활성화된 경우 */
-    QGroupBox:disabled {
-        border-color: #d3d3d3;            /* 비활성화 상태일 때 테두리 색상 */
-        color: #a0a0a0;                   /* 비활성화 상태일 때 텍스트 색상 */
-    }
-
-    /* QGroupBox의 내부 레이아웃에 적용할 스타일 */
-    QGroupBox QLineEdit, QGroupBox QPushButton {
-        margin: 3px;                      /* 내부 위젯들 간의 간격을 설정 */
-        padding: 5px;                     /* 내부 위젯의 패딩 */
-    }
-
-    /* QGroupBox 제목 hover 시 효과 */
-    QGroupBox::title:hover {
-        color: #ff6600;                   /* 마우스를 올렸을 때 제목 글자 색상 */
-        background-color: #e6e6e6;        /* 제목의 배경색을 변경 */
-    }
-
-    /* QGroupBox 내부의 QCheckBox 스타일 */
-    QGroupBox QCheckBox {
-        color: #333333;                   /* 체크박스의 기본 글자 색상 */
-        padding-left: 5px;                /* 체크박스 텍스트 왼쪽 여백 */
-    }
-
-    /* QGroupBox 내부 QComboBox 스타일 */
-    QGroupBox QComboBox {
-        color: #333333;                   /* 콤보박스의 기본 글자 색상 */
-        background-color: #ffffff;        /* 콤보박스의 배경 색상 */
-        border: 1px solid #cccccc;        /* 콤보박스의 테두리 색상 */
-        border-radius: 3px;               /* 콤보박스의 테두리 둥근 정도 */
-    }
-
-    /* QGroupBox 내부 QComboBox가 비활성화되었을 때 */
-    QGroupBox QComboBox:disabled {
-        background-color: #f0f0f0;        /* 콤보박스가 비활성화되었을 때의 배경색 */
-        color: #a0a0a0;                   /* 비활성화 상태의 글자 색상 */
-        border: 1px solid #cccccc;        /* 비활성화 상태일 때 테두리 */
-    }
-
-        """
-        default_style2 = """
-/*Copyright (c) DevSec Studio. All rights reserved.
-
-MIT License
-
-Permission is hereby granted, free of charge, to any person obtaining a copy
-of this software and associated documentation files (the "Software"), to deal
-in the Software without restriction, including without limitation the rights
-to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
-copies of the Software, and to permit persons to whom the Software is
-furnished to do so, subject to the following conditions:
-
-The above copyright notice and this permission notice shall be included in all
-copies or substantial portions of the Software.
-
-THE SOFTWARE IS PROVIDED *AS IS*, WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
-IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
-FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
-AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
-LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
-OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
-*/
-
-/*-----QWidget-----*/
-QWidget
-{
-	background-color: #e4e4e4;
-	color: #000;
-	selection-background-color: #46a2da;
-	selection-color: #fff;
-
-}
-
-
-/*-----QLabel-----*/
-QLabel
-{
-	background-color: transparent;
-	color: #000;
-
-}
-
-
-/*-----QMenuBar-----*/
-QMenuBar
-{
-	background-color: qlineargradient(spread:repeat, x1:1, y1:0, x2:1, y2:1, stop:0 rgba(227, 227, 227, 255),stop:1 rgba(187, 187, 187, 255));
-	border: 1px solid #f1f1f1;
-	color: #000;
-
-}
-
-
-QMenuBar::item
-{
-	background-color: transparent;
-
-}
-
-
-QMenuBar::item:selected
-{
-	background-color: rgba(70,162,218,50%);
-	border: 1px solid #46a2da;
-	color: #000;
-
-}
-
-
-QMenuBar::item:pressed
-{
-	background-color: #46a2da;
-	border: 1px solid #46a2da;
-	color: #fff;
-
-}
-
-
-/*-----QMenu-----*/
-QMenu
-{
-    background-color: #d6d6d6;
-    border: 1px solid #222;
-    padding: 4px;
-	color: #000;
-
-}
-
-
-QMenu::item
-{
-    background-color: transparent;
-    padding: 2px 20px 2px 20px;
-
-}
-
-
-QMenu::separator
-{
-   	background-color: #46a2da;
-	height: 1px;
-
-}
-
-
-QMenu::item:disabled
-{
-    color: #555;
-    background-color: transparent;
-    padding: 2px 20px 2px 20px;
-
-}
-
-
-QMenu::item:selected
-{
-	background-color: rgba(70,162,218,50%);
-	border: 1px solid #46a2da;
-	color: #000;
-
-}
-
-
-/*-----QToolBar-----*/
-QToolBar
-{
-	background-color: #d6d6d6;
-	border-top: none;
-	border-bottom: 1px solid #f1f1f1;
-	border-left: 1px solid #f1f1f1;
-	border-right: 1px solid #f1f1f1;
-
-}
-
-
-QToolBar::separator
-{
-	background-color: #2e2e2e;
-	width: 1px;
-
-}
-
-
-/*-----QToolButton-----*/
-QToolButton
-{
-	background-color: transparent;
-	color: #fff;
-	padding: 3px;
-	margin-left: 1px;
-}
-
-
-QToolButton:hover
-{
-	background-color: rgba(70,162,218,50%);
-	border: 1px solid #46a2da;
-	color: #000;
-
-}
-
-
-QToolButton:pressed
-{
-	background-color: #727272;
-	border: 1px solid #46a2da;
-
-}
-
-
-QToolButton:checked
-{
-	background-color: #727272;
-	border: 1px solid #222;
-}
-
-
-/*-----QPushButton-----*/
-QPushButton
-{
-	background-color: qlineargradient(spread:repeat, x1:1, y1:0, x2:1, y2:1, stop:0 rgba(184, 184, 184, 255),stop:1 rgba(159, 159, 159, 255));
-	color: #000;
-	min-width: 80px;
-	border-style: solid;
-	border-width: 1px;
-	border-color: #051a39;
-	padding: 5px;
-
-}
-
-
-QPushButton::flat
-{
-	background-color: transparent;
-	border: none;
-	color: #000;
-
-}
-
-
-QPushButton::disabled
-{
-	background-color: #606060;
-	color: #959595;
-	border-color: #051a39;
-
-}
-
-
-QPushButton::hover
-{
-	background-color: rgba(70,162,218,50%);
-	border: 1px solid #46a2da;
-
-}
-
-
-QPushButton::pressed
-{
-	background-color: qlineargradient(spread:repeat, x1:1, y1:0, x2:1, y2:1, stop:0 rgba(174, 174, 174, 255),stop:1 rgba(149, 149, 149, 255));
-	border: 1px solid #46a2da;
-
-}
-
-
-QPushButton::checked
-{
-	background-color: qlineargradient(spread:repeat, x1:1, y1:0, x2:1, y2:1, stop:0 rgba(174, 174, 174, 255),stop:1 rgba(149, 149, 149, 255));
-	border: 1px solid #222;
-
-}
-
-
-/*-----QLineEdit-----*/
-QLineEdit
-{
-	background-color: #f6f6f6;
-	color : #000;
-	border: 1px solid #343434;
-	padding: 3px;
-	padding-left: 5px;
-
-}
-
-
-/*-----QPlainTExtEdit-----*/
-QPlainTextEdit
-{
-	background-color: #f6f6f6;
-	color : #000;
-	border: 1px solid #343434;
-	padding: 3px;
-	padding-left: 5px;
-
-}
-
-
-/*-----QTabBar-----*/
-QTabBar::tab
-{
-	background-color: qlineargradient(spread:repeat, x1:1, y1:0, x2:1, y2:1, stop:0 rgba(227, 227, 227, 255),stop:1 rgba(187, 187, 187, 255));
-	color: #000;
-	border-style: solid;
-	border-width: 1px;
-	border-color: #666;
-	border-bottom: none;
-	padding: 5px;
-	padding-left: 15px;
-	padding-right: 15px;
-
-}
-
-
-QTabWidget::pane
-{
-	background-color: red;
-	border: 1px solid #666;
-	top: 1px;
-
-}
-
-
-QTabBar::tab:last
-{
-	margin-right: 0;
-
-}
-
-
-QTabBar::tab:first:!selected
-{
-	background-color: #666666;
-	margin-left: 0px;
-
-}
-
-
-QTabBar::tab:!selected
-{
-	color: #b1b1b1;
-	border-bottom-style: solid;
-	background-color: #666666;
-
-}
-
-
-QTabBar::tab:selected
-{
-	margin-top: 0px;
-
-}
-
-
-QTabBar::tab:!selected:hover
-{
-	background-color: qlineargradient(spread:repeat, x1:1, y1:0, x2:1, y2:1, stop:0 rgba(127, 127, 127, 255),stop:1 rgba(87, 87, 87, 255));
-	color: #000;
-
-}
-
-
-/*-----QComboBox-----*/
-QComboBox
-{
-    background-color: qlineargradient(spread:repeat, x1:1, y1:0, x2:1, y2:1, stop:0 rgba(184, 184, 184, 255),stop:1 rgba(159, 159, 159, 255));
-    border: 1px solid #000;
-    padding-left: 6px;
-    color: #000;
-    height: 20px;
-
-}
-
-
-QComboBox::disabled
-{
-	background-color: #404040;
-	color: #656565;
-	border-color: #051a39;
-
-}
-
-
-QComboBox:on
-{
-    background-color: #46a2da;
-	color: #000;
-
-}
-
-
-QComboBox QAbstractItemView
-{
-    background-color: #383838;
-    color: #000;
-    border: 1px solid black;
-    selection-background-color: #46a2da;
-    outline: 0;
-
-}
-
-
-QComboBox::drop-down
-{
-	background-color: qlineargradient(spread:repeat, x1:1, y1:0, x2:1, y2:1, stop:0 rgba(157, 157, 157, 255),stop:1 rgba(150, 150, 150, 255));
-    subcontrol-origin: padding;
-    subcontrol-position: top right;
-    width: 15px;
-    border-left-width: 1px;
-    border-left-color: black;
-    border-left-style: solid;
-
-}
-
-
-QComboBox::down-arrow
-{
-    image: url(://arrow-down.png);
-    width: 8px;
-    height: 8px;
-}
-
-
-/*-----QSpinBox & QDateTimeEdit-----*/
-QSpinBox,
-QDateTimeEdit
-{
-    background-color: #f6f6f6;
-	color : #000;
-	border: 1px solid #000;
-	padding: 3px;
-	padding-left: 5px;
-
-}
-
-
-QSpinBox::up-button,
-QDateTimeEdit::up-button
-{
-	background-color: qlineargradient(spread:repeat, x1:1, y1:0, x2:1, y2:1, stop:0 rgba(184, 184, 184, 255),stop:1 rgba(159, 159, 159, 255));
-    width: 16px;
-    border-width: 1px;
-	border-color: #000;
-
-}
-
-
-QSpinBox::up-button:hover,
-QDateTimeEdit::up-button:hover
-{
-	background-color: #585858;
-
-}
-
-
-QSpinBox::up-button:pressed,
-QDateTimeEdit::up-button:pressed
-{
-	background-color: #252525;
-    width: 16px;
-    border-width: 1px;
-
-}
-
-
-QSpinBox::up-arrow,
-QDateTimeEdit::up-arrow
-{
-    image: url(://arrow-up.png);
-    width: 7px;
-    height: 7px;
-
-}
-
-
-QSpinBox::down-button,
-QDateTimeEdit::down-button
-{
-	background-color: qlineargradient(spread:repeat, x1:1, y1:0, x2:1, y2:1, stop:0 rgba(184, 184, 184, 255),stop:1 rgba(159, 159, 159, 255));
-    width: 16px;
-    border-width: 1px;
-	border-color: #000;
-
-}
-
-
-QSpinBox::down-button:hover,
-QDateTimeEdit::down-button:hover
-{
-	background-color: #585858;
-
-}
-
-
-QSpinBox::down-button:pressed,
-QDateTimeEdit::down-button:pressed
-{
-	background-color: #252525;
-    width: 16px;
-    border-width: 1px;
-
-}
-
-
-QSpinBox::down-arrow,
-QDateTimeEdit::down-arrow
-{
-    image: url(://arrow-down.png);
-    width: 7px;
-    height: 7px;
-
-}
-
-
-/*-----QGroupBox-----*/
-QGroupBox
-{
-    border: 1px solid;
-    border-color: #666666;
-    margin-top: 23px;
-
-}
-
-
-QGroupBox::title
-{
-    background-color: #a0a2a4;
-    color: #000;
-	subcontrol-position: top left;
-    subcontrol-origin: margin;
-    padding: 5px;
-	border: 1px solid #000;
-	border-bottom: none;
-
-}
-
-
-
-
-/*-----QHeaderView-----*/
-QHeaderView::section
-{
-    background-color: qlineargradient(spread:repeat, x1:1, y1:0, x2:1, y2:1, stop:0 rgba(227, 227, 227, 255),stop:1 rgba(187, 187, 187, 255));
-	border: 1px solid #000;
-    color: #000;
-    text-align: left;
-	padding: 4px;
-
-}
-
-
-QHeaderView::section:disabled
-{
-    background-color: #525251;
-    color: #656565;
-
-}
-
-
-QHeaderView::section:checked
-{
-    background-color: qlineargradient(spread:repeat, x1:1, y1:0, x2:1, y2:1, stop:0 rgba(227, 227, 227, 255),stop:1 rgba(187, 187, 187, 255));
-    color: #000;
-
-}
-
-
-QHeaderView::section::vertical::first,
-QHeaderView::section::vertical::only-one
-{
-    border-top: 1px solid #353635;
-
-}
-
-
-QHeaderView::section::vertical
-{
-    border-top: 1px solid #353635;
-
-}
-
-
-QHeaderView::section::horizontal::first,
-QHeaderView::section::horizontal::only-one
-{
-    border-left: 1px solid #353635;
-
-}
-
-
-QHeaderView::section::horizontal
-{
-    border-left: 1px solid #353635;
-
-}
-
-
-QTableCornerButton::section
-{
-    background-color: qlineargradient(spread:repeat, x1:1, y1:0, x2:1, y2:1, stop:0 rgba(227, 227, 227, 255),stop:1 rgba(187, 187, 187, 255));
-	border: 1px solid #000;
-    color: #fff;
-
-}
-
-
-/*-----QTreeWidget-----*/
-QTreeView
-{
-	show-decoration-selected: 1;
-	alternate-background-color: #c6c6c6;
-	selection-color: #fff;
-	background-color: #f6f6f6;
-	border: 1px solid gray;
-	padding-top : 5px;
-	color: #000;
-	font: 8pt;
-
-}
-
-
-QTreeView::item:selected
-{
-	color:#fff;
-	background-color: #46a2da;
-	border-radius: 0px;
-
-}
-
-
-QTreeView::item:!selected:hover
-{
-    background-color: #5e5e5e;
-    border: none;
-    color: white;
-
-}
-
-
-QTreeView::branch:has-children:!has-siblings:closed,
-QTreeView::branch:closed:has-children:has-siblings
-{
-	image: url(://tree-closed.png);
-
-}
-
-
-QTreeView::branch:open:has-children:!has-siblings,
-QTreeView::branch:open:has-children:has-siblings
-{
-	image: url(://tree-open.png);
-
-}
-
-
-/*-----QListView-----*/
-QListView
-{
-	background-color: #f6f6f6;
-    border : none;
-    color: #000;
-    show-decoration-selected: 1;
-    outline: 0;
-	border: 1px solid gray;
-
-}
-
-
-QListView::disabled
-{
-	background-color: #656565;
-	color: #1b1b1b;
-    border: 1px solid #656565;
-
-}
-
-
-QListView::item
-{
-	background-color: #f6f6f6;
-    padding: 1px;
-
-}
-
-
-QListView::item:alternate
-{
-    background-color: #c6c6c6;
-
-}
-
-
-QListView::item:alternate:selected
-{
-    background-color: red;
-
-}
-
-
-QListView::item:selected
-{
-	background-color: #b78620;
-	border: 1px solid #b78620;
-	color: #fff;
-
-}
-
-
-QListView::item:selected:!active
-{
-	background-color: #46a2da;
-	border: 1px solid #46a2da;
-	color: #fff;
-
-}
-
-
-QListView::item:selected:active
-{
-	background-color: #46a2da;
-	border: 1px solid #46a2da;
-	color: #fff;
-
-}
-
-
-QListView::item:hover {
-    background-color: #5e5e5e;
-    border: none;
-    color: #000;
-
-}
-
-
-/*-----QCheckBox-----*/
-QCheckBox
-{
-	background-color: transparent;
-    color: #000;
-	border: none;
-
-}
-
-
-QCheckBox::indicator
-{
-    background-color: lightgray;
-    border: 1px solid #000;
-    width: 12px;
-    height: 12px;
-
-}
-
-
-QCheckBox::indicator:checked
-{
-    image:url("./ressources/check.png");
-	background-color: #46a2da;
-    border: 1px solid #3a546e;
-
-}
-
-
-QCheckBox::indicator:unchecked:hover
-{
-	border: 1px solid #46a2da;
-
-}
-
-
-QCheckBox::disabled
-{
-	color: #656565;
-
-}
-
-
-QCheckBox::indicator:disabled
-{
-	background-color: #656565;
-	color: #656565;
-    border: 1px solid #656565;
-
-}
-
-
-/*-----QRadioButton-----*/
-QRadioButton
-{
-	color: #000;
-	background-color: transparent;
-
-}
-
-
-QRadioButton::indicator::unchecked:hover
-{
-	background-color: darkgray;
-	border: 2px solid #46a2da;
-	border-radius: 6px;
-}
-
-
-QRadioButton::indicator::checked
-{
-	border: 2px solid #52beff;
-	border-radius: 6px;
-	background-color: #0088da;
-	width: 9px;
-	height: 9px;
-
-}
-
-
-/*-----QSlider-----*/
-QSlider::groove:horizontal
-{
-	background-color: transparent;
-	height: 3px;
-
-}
-
-
-QSlider::sub-page:horizontal
-{
-	background-color: #46a2da;
-
-}
-
-
-QSlider::add-page:horizontal
-{
-	background-color: #5d5d5d;
-
-}
-
-
-QSlider::handle:horizontal
-{
-	background-color: #46a2da;
-	width: 14px;
-	margin-top: -6px;
-	margin-bottom: -6px;
-	border-radius: 6px;
-
-}
-
-
-QSlider::handle:horizontal:hover
-{
-	background-color: #0088da;
-	border-radius: 6px;
-
-}
-
-
-QSlider::sub-page:horizontal:disabled
-{
-	background-color: #bbb;
-	border-color: #999;
-
-}
-
-
-QSlider::add-page:horizontal:disabled
-{
-	background-color: #eee;
-	border-color: #999;
-
-}
-
-
-QSlider::handle:horizontal:disabled
-{
-	background-color: #eee;
-	border: 1px solid #aaa;
-	border-radius: 3px;
-
-}
-
-
-/*-----QScrollBar-----*/
-QScrollBar:horizontal
-{
-    border: 1px solid #222222;
-    background-color: #9d9d9d;
-    height: 13px;
-    margin: 0px 16px 0 16px;
-
-}
-
+# 테이블과 기본 데이터가 미리 들어있는 DB 파일 (첫 실행 시 DB_FILE로 복사, build_template_database로 생성)
+TEMPLATE_DB_FILE = os.path.join(BASE_DIR, "resource", "epub_config.template.db")
+
+# 연결마다 적용해야 하는 PRAGMA 설정 (연결이 닫히면 사라짐)
+# - synchronous=NORMAL: WAL 모드에서는 커밋마다 fsync하지 않아도 DB가 손상되지 않음
+# - temp_store=MEMORY: 임시 테이블/인덱스를 메모리에 생성
+# - mmap_size: DB 파일을 메모리 매핑하여 읽기 (256MB)
+# - cache_size: 페이지 캐시 크기 (음수는 KB 단위, 64MB)
+# - analysis_limit: PRAGMA optimize가 실행하는 ANALYZE가 테이블마다 검사하는 행 수 제한
+CONNECTION_PRAGMAS = """
+PRAGMA synchronous=NORMAL;
+PRAGMA temp_store=MEMORY;
+PRAGMA mmap_size=268435456;
+PRAGMA cache_size=-65536;
+PRAGMA analysis_limit=400;
+"""
 
-QScrollBar::handle:horizontal
-{
-	background-color: qlineargradient(spread:repeat, x1:1, y1:0, x2:1, y2:1, stop:0 rgba(227, 227, 227, 255),stop:1 rgba(187, 187, 187, 255));
-	border: 1px solid #2d2d2d;
-    min-height: 20px;
+# 스키마 버전 - SCHEMA_SQL이나 기본 데이터가 바뀌면 1 증가시킴
+# DB의 PRAGMA user_version이 이 값과 같으면 initialize_database()는 초기화를 생략함
+SCHEMA_VERSION = 7
+
+# 한 문장에 바인딩할 수 있는 최대 파라미터 수 (구버전 SQLite의 SQLITE_MAX_VARIABLE_NUMBER 기본값)
+MAX_SQL_VARIABLES = 999
+
+# AUTOINCREMENT를 제거하기 위해 다시 만드는 테이블 (스키마 버전 3)
+_REBUILT_TABLES_V3 = ("Stylesheet", "ChapterRegex", "PunctuationRegex", "TextStyle",
+                      "EpubHistory", "ChapterList", "EpubSetting")
+
+# 타임스탬프를 정수 Unix epoch로 바꾸는 테이블과 컬럼 (스키마 버전 4)
+_TIMESTAMP_COLUMNS_V4 = {
+    "Stylesheet": "created_at",
+    "ChapterRegex": "created_at",
+    "PunctuationRegex": "created_at",
+    "TextStyle": "created_at",
+    "EpubHistory": "generated_at",
+    "EpubSetting": "created_at",
+}
+
+# 이전 스키마 버전의 DB를 올릴 때 실행할 변경 내용 (도달 버전 -> 변경 내용)
+# - pre: SCHEMA_SQL 실행 전에 실행할 SQL
+# - rebuild: SCHEMA_SQL의 새 정의로 다시 만들 테이블 (기존 테이블은 _old_ 접두어로 옮겨두었다가
+#   같은 이름의 컬럼 데이터를 복사한 뒤 삭제하며, 여러 버전에 걸쳐 있어도 한 번만 다시 만듦.
+#   DB에 없는 테이블은 SCHEMA_SQL이 새로 만들기만 함)
+# - post: 복사 후, _old_ 테이블 삭제 전에 실행할 SQL
+# 변경 중에는 legacy_alter_table을 켜므로 (외래 키 검사는 연결 기본값대로 꺼져 있음)
+# 테이블 이름을 바꿔도 다른 테이블의 외래 키 참조는 바뀌지 않음
+SCHEMA_MIGRATIONS = {
+    # AlignStyle, FontStyle을 name 기본 키의 WITHOUT ROWID 테이블로 변경
+    # 기본 데이터만 들어있는 테이블이므로 삭제 후 SCHEMA_SQL로 다시 만들고 기본 데이터를 다시 삽입함
+    2: {
+        "pre": """
+DROP TABLE IF EXISTS AlignStyle;
+DROP TABLE IF EXISTS FontStyle;
+""",
+    },
+    # id의 AUTOINCREMENT 제거
+    3: {
+        "rebuild": _REBUILT_TABLES_V3,
+    },
+    # 타임스탬프 컬럼을 ISO-8601 문자열에서 정수 Unix epoch로 변경 (기본값 변경을 위해 테이블 재생성)
+    # 복사된 'YYYY-MM-DD HH:MM:SS'(UTC) 문자열을 epoch 초로 변환
+    4: {
+        "rebuild": tuple(_TIMESTAMP_COLUMNS_V4),
+        "post": "".join(
+            f"UPDATE {name} SET {column} = CAST(strftime('%s', {column}) AS INTEGER) WHERE typeof({column}) = 'text';\n"
+            for name, column in _TIMESTAMP_COLUMNS_V4.items()),
+    },
+    # EpubSetting.punctuation_regex_ids(쉼표로 연결된 ID 문자열)를 EpubSetting_PunctuationRegex 연결 테이블로 분리
+    # 재귀 CTE로 쉼표를 나누고, 존재하지 않는 PunctuationRegex ID는 버림
+    5: {
+        "rebuild": ("EpubSetting",),
+        "post": """
+INSERT OR IGNORE INTO EpubSetting_PunctuationRegex (setting_id, regex_id)
+WITH RECURSIVE split(setting_id, item, rest) AS (
+    SELECT id, '', punctuation_regex_ids || ',' FROM _old_EpubSetting WHERE punctuation_regex_ids IS NOT NULL
+    UNION ALL
+    SELECT setting_id, trim(substr(rest, 1, instr(rest, ',') - 1)), substr(rest, instr(rest, ',') + 1)
+    FROM split WHERE rest <> ''
+)
+SELECT setting_id, CAST(item AS INTEGER) FROM split
+WHERE item <> '' AND CAST(item AS INTEGER) IN (SELECT id FROM PunctuationRegex);
+""",
+    },
+    # FontFolder를 save_font_folder()에서 만들던 것을 SCHEMA_SQL로 옮김
+    # 처음 버전에서 만든 테이블(AUTOINCREMENT, 문자열 타임스탬프)이 있으면 다시 만들고 타임스탬프를 epoch로 변환
+    # save_font_folder()가 id 1 행만 덮어쓰므로 남아있는 최신 행의 id를 1로 맞춤
+    7: {
+        "rebuild": ("FontFolder",),
+        "post": "".join(
+            f"UPDATE FontFolder SET {column} = CAST(strftime('%s', {column}) AS INTEGER) WHERE typeof({column}) = 'text';\n"
+            for column in ("created_at", "updated_at")) + """
+DELETE FROM FontFolder WHERE id <> (SELECT id FROM FontFolder ORDER BY updated_at DESC, id DESC LIMIT 1);
+UPDATE FontFolder SET id = 1;
+""",
+    },
+}
+
+# 테이블 및 인덱스 스키마 - initialize_database()에서 한 번의 executescript로 실행
+# (IF NOT EXISTS이므로 이미 있는 테이블은 그대로 유지됨)
+# 타임스탬프는 정수 Unix epoch 초로 저장 (unixepoch()가 없는 SQLite 3.38 미만에서도 동작하도록 strftime 사용)
+SCHEMA_SQL = """
+-- Stylesheet 테이블: QSS 테마 스타일 저장
+CREATE TABLE IF NOT EXISTS Stylesheet (
+    id INTEGER PRIMARY KEY,               -- 고유 ID
+    name TEXT NOT NULL,                  -- 스타일 이름
+    description TEXT,                    -- 설명
+    content TEXT NOT NULL,               -- QSS 내용
+    is_default INTEGER DEFAULT 0,        -- 기본 적용 여부
+    created_at INTEGER DEFAULT (CAST(strftime('%s', 'now') AS INTEGER)) -- 생성일시
+);
+
+-- ChapterRegex 테이블: 챕터 구분용 정규식
+CREATE TABLE IF NOT EXISTS ChapterRegex (
+    id INTEGER PRIMARY KEY,               -- 고유 ID
+    name TEXT NOT NULL,                   -- 정규식 이름
+    example TEXT,                         -- 예시 텍스트
+    pattern TEXT NOT NULL,                -- 정규식 패턴
+    is_enabled INTEGER DEFAULT 1,         -- 활성화 여부
+    created_at INTEGER DEFAULT (CAST(strftime('%s', 'now') AS INTEGER))
+);
+
+-- PunctuationRegex 테이블: 괄호/기호 추출용 정규식
+CREATE TABLE IF NOT EXISTS PunctuationRegex (
+    id INTEGER PRIMARY KEY,               -- 고유 ID
+    name TEXT NOT NULL,                   -- 정규식 이름
+    pattern TEXT NOT NULL,                -- 정규식 패턴
+    description TEXT,                     -- 설명
+    is_enabled INTEGER DEFAULT 1,         -- 활성화 여부
+    created_at INTEGER DEFAULT (CAST(strftime('%s', 'now') AS INTEGER))
+);
+
+-- TextStyle 테이블: 텍스트 스타일 설정 (정렬, 굵기 등)
+CREATE TABLE IF NOT EXISTS TextStyle (
+    id INTEGER PRIMARY KEY,               -- 고유 ID
+    name TEXT NOT NULL,                   -- 스타일 이름
+    type TEXT NOT NULL,                   -- 구분 (chapter/main/bracket 등)
+    is_enabled INTEGER DEFAULT 1,         -- 활성화 여부
+    align TEXT DEFAULT 'left',            -- 정렬 (left/center/right)
+    font_style TEXT DEFAULT 'normal',     -- 스타일 (normal/bold/italic 등)
+    font_color TEXT DEFAULT '#000000',    -- 색상 (HEX)
+    description TEXT,                     -- 설명
+    created_at INTEGER DEFAULT (CAST(strftime('%s', 'now') AS INTEGER))
+);
+
+-- EpubHistory 테이블: ePub 생성 이력
+CREATE TABLE IF NOT EXISTS EpubHistory (
+    id INTEGER PRIMARY KEY,               -- 고유 ID
+    file_name TEXT NOT NULL,              -- 출력 파일명
+    output_path TEXT,                     -- 출력 경로
+    title TEXT,                           -- 책 제목
+    author TEXT,                          -- 작가명
+    isbn TEXT,                            -- ISBN
+    generated_at INTEGER DEFAULT (CAST(strftime('%s', 'now') AS INTEGER)), -- 생성일시
+    chapter_count INTEGER,                -- 챕터 수
+    duration_seconds REAL,                -- 생성 소요시간
+    setting_id INTEGER,                   -- 사용된 설정 ID
+    FOREIGN KEY(setting_id) REFERENCES EpubSetting(id)
+);
+
+-- ChapterList 테이블: ePub별 목차 정보
+CREATE TABLE IF NOT EXISTS ChapterList (
+    id INTEGER PRIMARY KEY,               -- 고유 ID
+    epub_id INTEGER NOT NULL,             -- EpubHistory 참조 ID
+    chapter_index INTEGER NOT NULL,       -- 챕터 인덱스
+    chapter_title TEXT NOT NULL,          -- 챕터 제목
+    regex_used TEXT,                      -- 사용된 정규식
+    FOREIGN KEY(epub_id) REFERENCES EpubHistory(id) ON DELETE CASCADE
+);
+
+-- EpubSetting 테이블: ePub 생성 시 사용한 전체 세팅 정보 저장
+CREATE TABLE IF NOT EXISTS EpubSetting (
+    id INTEGER PRIMARY KEY,                   -- 고유 ID
+    name TEXT NOT NULL,                       -- 세팅 이름
+    description TEXT,                         -- 설명
+    use_body_font INTEGER DEFAULT 0,          -- 본문 폰트 포함 여부
+    use_chapter_font INTEGER DEFAULT 0,       -- 챕터 폰트 포함 여부
+    body_font_path TEXT,                      -- 본문 폰트 경로
+    chapter_font_path TEXT,                   -- 챕터 폰트 경로
+    stylesheet_id INTEGER,                    -- Stylesheet 테이블 참조
+    chapter_regex_id INTEGER,                 -- ChapterRegex 테이블 참조
+    top_margin INTEGER DEFAULT 1,             -- 상단 여백
+    bottom_margin INTEGER DEFAULT 4,          -- 하단 여백
+    divide_by_chapter INTEGER DEFAULT 0,      -- 챕터별 분할 여부
+    chapter_style_enabled INTEGER DEFAULT 1,  -- 챕터 스타일 적용 여부
+    chapter_align TEXT DEFAULT 'center',      -- 챕터 정렬
+    chapter_font_style TEXT DEFAULT 'bold',   -- 챕터 폰트 스타일
+    chapter_font_color TEXT DEFAULT '#000000',-- 챕터 폰트 색상
+    created_at INTEGER DEFAULT (CAST(strftime('%s', 'now') AS INTEGER)),
+    FOREIGN KEY(stylesheet_id) REFERENCES Stylesheet(id),
+    FOREIGN KEY(chapter_regex_id) REFERENCES ChapterRegex(id)
+);
+
+-- EpubSetting_PunctuationRegex 테이블: 세팅별로 사용하는 PunctuationRegex 목록 (다대다 연결)
+CREATE TABLE IF NOT EXISTS EpubSetting_PunctuationRegex (
+    setting_id INTEGER NOT NULL REFERENCES EpubSetting(id) ON DELETE CASCADE,   -- EpubSetting 참조 ID
+    regex_id INTEGER NOT NULL REFERENCES PunctuationRegex(id) ON DELETE CASCADE, -- PunctuationRegex 참조 ID
+    PRIMARY KEY(setting_id, regex_id)
+) WITHOUT ROWID;
+
+-- AlignStyle 테이블: Left, Center, Right 정렬 스타일 저장
+-- (이름으로 조회하는 작은 조회용 테이블이므로 rowid 없이 name B-tree 하나에 저장)
+CREATE TABLE IF NOT EXISTS AlignStyle (
+    name TEXT PRIMARY KEY,                    -- 세팅 이름 Left, Center, Right
+    description TEXT                          -- 설명 Left, Center, Right
+) WITHOUT ROWID;
+
+-- FontStyle 테이블: bold, italic, normal 폰트 스타일 저장
+CREATE TABLE IF NOT EXISTS FontStyle (
+    name TEXT PRIMARY KEY,                    -- 세팅 이름 bold, italic, normal
+    description TEXT                          -- 설명 bold, italic, normal
+) WITHOUT ROWID;
+
+-- FontFolder 테이블: 폰트 파일을 찾을 폴더 경로 (id 1 행 1개만 유지)
+CREATE TABLE IF NOT EXISTS FontFolder (
+    id INTEGER PRIMARY KEY,                   -- 고유 ID
+    folder_path TEXT NOT NULL,                -- 폰트 폴더 경로
+    created_at INTEGER DEFAULT (CAST(strftime('%s', 'now') AS INTEGER)),
+    updated_at INTEGER DEFAULT (CAST(strftime('%s', 'now') AS INTEGER))
+);
+
+-- EncodingCache 테이블: 텍스트 파일별로 감지한 인코딩 (수정 시각과 크기가 같으면 다시 감지하지 않음)
+CREATE TABLE IF NOT EXISTS EncodingCache (
+    path TEXT PRIMARY KEY,                    -- 텍스트 파일 경로
+    mtime REAL NOT NULL,                      -- 감지 당시 파일 수정 시각 (os.stat().st_mtime)
+    size INTEGER NOT NULL,                    -- 감지 당시 파일 크기
+    encoding TEXT NOT NULL                    -- 감지한 인코딩
+) WITHOUT ROWID;
+
+-- 외래 키 컬럼 인덱스 (SQLite는 외래 키 컬럼에 인덱스를 자동으로 만들지 않음)
+CREATE INDEX IF NOT EXISTS idx_chapterlist_epub_id ON ChapterList(epub_id);
+CREATE INDEX IF NOT EXISTS idx_epubhistory_setting_id ON EpubHistory(setting_id);
+CREATE INDEX IF NOT EXISTS idx_epubsetting_stylesheet_id ON EpubSetting(stylesheet_id);
+CREATE INDEX IF NOT EXISTS idx_epubsetting_chapter_regex_id ON EpubSetting(chapter_regex_id);
+CREATE INDEX IF NOT EXISTS idx_epubsetting_punctuationregex_regex_id ON EpubSetting_PunctuationRegex(regex_id);
+
+-- 최근 생성 이력 조회용
+CREATE INDEX IF NOT EXISTS idx_epubhistory_generated_at ON EpubHistory(generated_at DESC);
+"""
 
-}
+# 스레드마다 하나씩 유지하는 연결 (get_connection()이 스레드에서 처음 호출될 때 생성)
+_local = threading.local()
+# 모든 스레드에서 연 연결 목록 (close_all()이 프로그램 종료 시 한꺼번에 닫음)
+_connections = []
+_connections_lock = threading.Lock()
 
+def get_connection():
+    """
+    현재 스레드에서 재사용하는 SQLite 연결을 반환합니다.
 
-QScrollBar::add-line:horizontal
-{
-	background-color: qlineargradient(spread:repeat, x1:1, y1:0, x2:1, y2:1, stop:0 rgba(227, 227, 227, 255),stop:1 rgba(187, 187, 187, 255));
-	border: 1px solid #2d2d2d;
-    width: 15px;
-    subcontrol-position: right;
-    subcontrol-origin: margin;
+    스레드에서 처음 호출될 때 연결을 열고 CONNECTION_PRAGMAS 적용과 PRAGMA optimize를 실행하며, 이후에는 같은 연결을
+    재사용하여 연결을 열 때마다 드는 비용(파일 열기, WAL 파일 매핑, PRAGMA 적용)을 줄입니다.
+    작업 스레드는 자신의 연결을 따로 가지므로 한 스레드의 트랜잭션(BEGIN/COMMIT)이 다른 스레드의
+    문장과 섞이지 않습니다.
+    sqlite3 모듈의 암묵적 트랜잭션 관리는 끄므로(isolation_level=None)
+    여러 문장을 묶어야 하면 BEGIN/COMMIT을 직접 실행해야 합니다.
 
-}
+    Returns:
+        sqlite3.Connection: 현재 스레드의 SQLite 연결 객체
 
+    Raises:
+        sqlite3.Error: 데이터베이스 연결 중 오류 발생 시
+    """
+    conn = getattr(_local, "connection", None)
+    if conn is None:
+        # 종료 시 메인 스레드의 close_all()이 닫을 수 있도록 check_same_thread=False
+        conn = sqlite3.connect(DB_FILE, check_same_thread=False, isolation_level=None)
+        conn.executescript(CONNECTION_PRAGMAS)
+        # 프로그램이 끝날 때까지 유지되는 연결이므로 열 때도 쿼리 플래너 통계를 점검
+        # (0x10000: 이 연결에서 아직 사용하지 않은 테이블도 검사 - SQLite 3.46 미만에서는 무시됨)
+        conn.execute("PRAGMA optimize=0x10002")
+        _local.connection = conn
+        with _connections_lock:
+            _connections.append(conn)
+    return conn
+
+def _close(conn):
+    """
+    연결을 닫기 전에 PRAGMA optimize를 실행하여 쿼리 플래너 통계를 필요한 경우에만 갱신합니다.
 
-QScrollBar::sub-line:horizontal
-{
-	background-color: qlineargradient(spread:repeat, x1:1, y1:0, x2:1, y2:1, stop:0 rgba(227, 227, 227, 255),stop:1 rgba(187, 187, 187, 255));
-	border: 1px solid #2d2d2d;
-    width: 15px;
-    subcontrol-position: left;
-    subcontrol-origin: margin;
+    Args:
+        conn (sqlite3.Connection): 닫을 연결
+    """
+    try:
+        conn.execute("PRAGMA optimize")
+    except sqlite3.Error as e:
+        logging.warning(f"PRAGMA optimize 실행 중 오류 발생: {e}")
+    conn.close()
 
-}
+def close_connection():
+    """
+    현재 스레드의 SQLite 연결을 닫습니다. (작업 스레드가 끝날 때 호출)
+    """
+    conn = getattr(_local, "connection", None)
+    if conn is None:
+        return
+    _local.connection = None
+    with _connections_lock:
+        _connections.remove(conn)
+    _close(conn)
+
+def close_all():
+    """
+    모든 스레드에서 연 SQLite 연결을 닫습니다. 프로그램 종료 시 자동으로 호출됩니다.
+    """
+    with _connections_lock:
+        connections = _connections[:]
+        _connections.clear()
+    _local.connection = None
+    for conn in connections:
+        _close(conn)
 
+atexit.register(close_all)
 
-QScrollBar::right-arrow:horizontal
-{
-    image: url(://arrow-right.png);
-    width: 6px;
-    height: 6px;
+def _build_migration_sql(cursor, db_version):
+    """
+    db_version에서 SCHEMA_VERSION으로 올리는 SQL 스크립트를 만듭니다.
 
-}
+    대기 중인 SCHEMA_MIGRATIONS의 pre, 다시 만들 테이블 이동, SCHEMA_SQL,
+    같은 이름 컬럼의 데이터 복사, post, 이동한 테이블 삭제 순서로 이어 붙입니다.
+    다시 만들 테이블의 인덱스는 이동한 테이블을 따라가므로 먼저 삭제하고
+    SCHEMA_SQL이 새 테이블에 다시 만들게 합니다.
 
+    Args:
+        cursor (sqlite3.Cursor): 올릴 DB의 SQLite 커서 객체
+        db_version (int): DB의 현재 스키마 버전 (PRAGMA user_version)
 
-QScrollBar::left-arrow:horizontal
-{
-    image: url(://arrow-left.png);
-    width: 6px;
-    height: 6px;
+    Returns:
+        str: BEGIN 없이 executescript로 실행할 SQL 스크립트
+    """
+    pending = [SCHEMA_MIGRATIONS[version] for version in sorted(SCHEMA_MIGRATIONS) if version > db_version]
+    existing_tables = {row[0] for row in cursor.execute("SELECT name FROM sqlite_master WHERE type='table'")}
+    rebuilt_tables = [name for name in dict.fromkeys(
+        name for migration in pending for name in migration.get("rebuild", ())) if name in existing_tables]
 
-}
+    # 새 테이블의 컬럼은 메모리 DB에 SCHEMA_SQL을 실행하여 확인
+    schema_conn = sqlite3.connect(":memory:")
+    try:
+        schema_conn.executescript(SCHEMA_SQL)
+        new_columns = {name: [row[1] for row in schema_conn.execute(f"PRAGMA table_info({name})")]
+                       for name in rebuilt_tables}
+    finally:
+        schema_conn.close()
+    old_columns = {name: {row[1] for row in cursor.execute(f"PRAGMA table_info({name})")}
+                   for name in rebuilt_tables}
+    index_names = [row[0] for row in cursor.execute(
+        f"SELECT name FROM sqlite_master WHERE type='index' AND sql IS NOT NULL "
+        f"AND tbl_name IN ({', '.join('?' * len(rebuilt_tables))})", rebuilt_tables)] if rebuilt_tables else []
+
+    parts = [migration.get("pre", "") for migration in pending]
+    parts += [f"DROP INDEX {name};\n" for name in index_names]
+    parts += [f"ALTER TABLE {name} RENAME TO _old_{name};\n" for name in rebuilt_tables]
+    parts.append(SCHEMA_SQL)
+    for name in rebuilt_tables:
+        columns = ", ".join(column for column in new_columns[name] if column in old_columns[name])
+        parts.append(f"INSERT INTO {name} ({columns}) SELECT {columns} FROM _old_{name};\n")
+    parts += [migration.get("post", "") for migration in pending]
+    parts += [f"DROP TABLE _old_{name};\n" for name in rebuilt_tables]
+    return "".join(parts)
 
+def initialize_database():
+    """
+    ePub 변환기의 SQLite 데이터베이스를 초기화합니다.
 
-QScrollBar::add-page:horizontal, QScrollBar::sub-page:horizontal
-{
-    background: none;
+    데이터베이스 파일이 존재하지 않으면 미리 만들어 둔 템플릿 DB(TEMPLATE_DB_FILE)를
+    복사하고, 템플릿이 없으면 새로 생성하여 필요한 모든 테이블과 기본 데이터를 설정합니다.
+    DB의 스키마 버전(PRAGMA user_version)이 SCHEMA_VERSION과 같으면
+    이미 초기화된 것으로 보고 바로 반환합니다.
 
-}
+    생성되는 테이블:
+    - Stylesheet: QSS 테마 스타일 저장
+    - ChapterRegex: 챕터 구분용 정규식 패턴
+    - PunctuationRegex: 구두점 스타일링용 정규식
+    - FontInfo: 폰트 정보 및 설정
+    - EpubMeta: ePub 메타데이터 기본값
+    - FontFolder: 폰트 폴더 경로
+    - EncodingCache: 텍스트 파일별 인코딩 감지 결과
 
+    Returns:
+        None
 
-QScrollBar:vertical
-{
-    background-color: #9d9d9d;
-    width: 13px;
-	border: 1px solid #2d2d2d;
-    margin: 16px 0px 16px 0px;
+    Raises:
+        sqlite3.Error: 데이터베이스 연결 또는 테이블 생성 중 오류 발생 시
+        OSError: 데이터베이스 파일 생성 권한 없음
+    """
+    try:
+        db_exists = os.path.exists(DB_FILE)
+        if not db_exists and not _connections and os.path.exists(TEMPLATE_DB_FILE):
+            # 첫 실행: 테이블 생성과 기본 데이터 삽입 대신 템플릿 DB 파일을 복사
+            # (템플릿의 스키마 버전이 낮으면 아래에서 이어서 갱신됨)
+            shutil.copyfile(TEMPLATE_DB_FILE, DB_FILE)
+            logging.info("DB 파일이 존재하지 않아 템플릿 DB를 복사했습니다.")
+        conn = get_connection()
+        cursor = conn.cursor()
 
-}
+        # WAL 저널 모드는 DB 파일에 저장되므로 한 번 설정하면 이후 모든 연결에 적용됨
+        # (템플릿 DB는 단일 파일로 배포하기 위해 WAL이 아니므로 버전 확인 전에 설정)
+        cursor.execute("PRAGMA journal_mode=WAL")
 
+        # 이미 현재 스키마 버전으로 초기화된 DB면 테이블/데이터 확인 생략
+        db_version = cursor.execute("PRAGMA user_version").fetchone()[0]
+        if db_version == SCHEMA_VERSION:
+            logging.info(f"DB 스키마 버전 {SCHEMA_VERSION}이 최신입니다. 초기화 생략.")
+            return
 
-QScrollBar::handle:vertical
-{
-    background-color: qlineargradient(spread:repeat, x1:1, y1:0, x2:1, y2:1, stop:0 rgba(227, 227, 227, 255),stop:1 rgba(187, 187, 187, 255));
-	border: 1px solid #2d2d2d;
-    min-height: 20px;
+        if not db_exists:
+            logging.info("DB 파일이 존재하지 않아 새로 생성합니다...")
+        else:
+            logging.info("기존 DB 파일이 존재합니다. 테이블 구조를 확인합니다...")
 
-}
+    except sqlite3.Error as e:
+        logging.error(f"데이터베이스 초기화 중 오류 발생: {e}")
+        raise
+    except OSError as e:
+        logging.error(f"데이터베이스 파일 생성 중 오류 발생: {e}")
+        raise
 
+    # 테이블 생성과 기본 데이터 삽입 전체를 하나의 명시적 트랜잭션으로 묶어 커밋(fsync)을 한 번만 수행
+    # (get_connection()의 연결은 암묵적 트랜잭션 관리가 꺼져 있으므로 BEGIN/COMMIT을 직접 실행)
+    migrating = False
+    try:
+        table_query = "SELECT name FROM sqlite_master WHERE type='table' AND name NOT LIKE 'sqlite_%'"
+        existing_tables = {row[0] for row in cursor.execute(table_query)}
+
+        # 이전 버전 DB는 변경 스크립트로 SCHEMA_SQL을 감싸서 실행 (테이블이 없는 새 DB는 생략)
+        schema_sql = SCHEMA_SQL
+        if existing_tables and any(version > db_version for version in SCHEMA_MIGRATIONS):
+            migrating = True
+            schema_sql = _build_migration_sql(cursor, db_version)
+            # 변경 스크립트 실행 동안만 legacy_alter_table을 켜서 다른 테이블의 참조가 바뀌지 않게 함
+            cursor.execute("PRAGMA legacy_alter_table=ON")
+
+        # executescript는 진행 중인 트랜잭션을 먼저 커밋하므로 BEGIN을 스크립트 안에 포함
+        cursor.executescript("BEGIN IMMEDIATE;" + schema_sql)
+        tables_created = [row[0] for row in cursor.execute(table_query) if row[0] not in existing_tables]
+
+        data_inserted = _seed_default_data(cursor)
+
+        # CSS 테마 초기화 (같은 트랜잭션에서 실행하여 커밋을 한 번만 수행)
+        if initialize_css_themes(cursor):
+            data_inserted.append('CSS 테마')
+
+        # 스키마 버전 기록 (트랜잭션과 함께 커밋되므로 초기화가 실패하면 기록되지 않음)
+        cursor.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+        cursor.execute("COMMIT")
+    except Exception as e:
+        logging.error(f"데이터베이스 초기화 중 오류 발생, 변경사항을 되돌립니다: {e}")
+        if conn.in_transaction:
+            cursor.execute("ROLLBACK")
+        raise
+    finally:
+        if migrating:
+            cursor.execute("PRAGMA legacy_alter_table=OFF")
 
-QScrollBar::add-line:vertical
-{
-	background-color: qlineargradient(spread:repeat, x1:1, y1:0, x2:1, y2:1, stop:0 rgba(227, 227, 227, 255),stop:1 rgba(187, 187, 187, 255));
-	border: 1px solid #2d2d2d;
-    height: 15px;
-    subcontrol-position: bottom;
-    subcontrol-origin: margin;
+    # 결과 기록
+    if tables_created or data_inserted:
+        if tables_created:
+            logging.info(f"생성된 테이블: {', '.join(tables_created)}")
+        if data_inserted:
+            logging.info(f"삽입된 데이터: {', '.join(data_inserted)}")
+        logging.info("DB 초기화 완료.")
+    else:
+        logging.info("모든 테이블과 데이터가 이미 존재합니다. 초기화 생략.")
 
-}
+def build_template_database(path=TEMPLATE_DB_FILE):
+    """
+    첫 실행 시 복사할 템플릿 DB 파일을 새로 생성합니다.
 
+    SCHEMA_SQL과 기본 데이터가 바뀌어 SCHEMA_VERSION을 올린 경우 다시 실행하여
+    resource/epub_config.template.db를 갱신합니다. 배포하기 쉽도록 WAL이 아닌
+    단일 파일로 만들고 VACUUM으로 빈 페이지를 정리합니다.
 
-QScrollBar::sub-line:vertical
-{
-	background-color: qlineargradient(spread:repeat, x1:1, y1:0, x2:1, y2:1, stop:0 rgba(227, 227, 227, 255),stop:1 rgba(187, 187, 187, 255));
-	border: 1px solid #2d2d2d;
-    height: 15px;
-    subcontrol-position: top;
-    subcontrol-origin: margin;
+    Args:
+        path (str): 생성할 템플릿 DB 파일 경로
 
-}
+    Returns:
+        None
+    """
+    if os.path.exists(path):
+        os.remove(path)
 
+    conn = sqlite3.connect(path, isolation_level=None)
+    try:
+        cursor = conn.cursor()
+        cursor.executescript("BEGIN IMMEDIATE;" + SCHEMA_SQL)
+        _seed_default_data(cursor)
+        cursor.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+        cursor.execute("COMMIT")
+        cursor.execute("VACUUM")
+    finally:
+        conn.close()
+    logging.info(f"템플릿 DB 생성 완료: {path} (스키마 버전 {SCHEMA_VERSION})")
 
-QScrollBar::up-arrow:vertical
-{
-    image: url(://arrow-up.png);
-    width: 6px;
-    height: 6px;
+@lru_cache(maxsize=None)
+def load_style(name):
+    """
+    resource 폴더의 QSS 스타일시트 파일을 읽습니다. (파일마다 한 번만 읽고 캐시)
 
-}
+    Args:
+        name (str): 확장자를 제외한 파일명 (예: "default_style")
 
+    Returns:
+        str: QSS 내용 (줄바꿈 변환 없이 파일 그대로)
+    """
+    with open(os.path.join(BASE_DIR, "resource", f"{name}.qss"), "r", encoding="utf-8", newline="") as f:
+        return f.read()
 
-QScrollBar::down-arrow:vertical
-{
-    image: url(://arrow-down.png);
-    width: 6px;
-    height: 6px;
+def _read_seed_tsv(file_name):
+    """
+    resource 폴더의 탭 구분(TSV) 기본 데이터 파일을 읽습니다.
 
-}
+    첫 줄은 컬럼명 헤더이며 건너뜁니다. 정규식 패턴에 따옴표와 역슬래시가 그대로
+    들어가므로 csv 모듈의 따옴표 처리 없이 탭으로만 구분합니다.
 
+    Args:
+        file_name (str): resource 폴더 안의 파일명
 
-QScrollBar::add-page:vertical, QScrollBar::sub-page:vertical
-{
-    background: none;
+    Yields:
+        tuple: 각 줄의 값 튜플 (파일 전체를 리스트로 만들지 않고 한 줄씩 반환)
+    """
+    with open(os.path.join(BASE_DIR, "resource", file_name), "r", encoding="utf-8") as f:
+        next(f)  # 헤더
+        for line in f:
+            if line.strip():
+                yield tuple(line.rstrip("\n").split("\t"))
 
-}
+def _insert_rows_if_empty(cursor, table_name, columns, rows):
+    """
+    테이블이 비어있는 경우에만 여러 행을 한 번에 삽입합니다.
 
+    다중 행 VALUES를 사용하는 INSERT ... SELECT ... WHERE NOT EXISTS 문 하나로
+    테이블이 비어있는지 확인과 삽입을 함께 처리합니다. 바인딩 파라미터가
+    MAX_SQL_VARIABLES를 넘으면 행을 나누어 여러 문장으로 삽입하며, 비어있는지
+    확인은 첫 문장에서만 합니다.
 
-/*-----QProgressBar-----*/
-QProgressBar
-{
-	background-color: qlineargradient(spread:repeat, x1:1, y1:0, x2:1, y2:1, stop:0 rgba(227, 227, 227, 255),stop:1 rgba(187, 187, 187, 255));
-    border: 1px solid #666666;
-    text-align: center;
-	color: #000;
-	font-weight: bold;
+    Args:
+        cursor (sqlite3.Cursor): SQLite 커서 객체
+        table_name (str): 삽입할 테이블명
+        columns (tuple): 삽입할 컬럼명 목록
+        rows (iterable): 컬럼 순서에 맞춘 값 튜플 (리스트 또는 제너레이터)
 
-}
+    Returns:
+        bool: 데이터가 삽입되었으면 True, 테이블에 이미 데이터가 있으면 False
+    """
+    # 행 튜플 리스트를 따로 만들지 않고 바인딩할 값 목록으로 바로 펼침
+    params = [value for row in rows for value in row]
+    row_count = len(params) // len(columns)
+    if row_count == 0:
+        return False
 
+    row_placeholder = "(" + ", ".join("?" * len(columns)) + ")"
+    select_columns = ", ".join(f"column{i}" for i in range(1, len(columns) + 1))
+    rows_per_statement = MAX_SQL_VARIABLES // len(columns)
+    for start in range(0, row_count, rows_per_statement):
+        chunk_rows = min(rows_per_statement, row_count - start)
+        # 첫 문장만 테이블이 비어있는지 확인 (이후 문장은 첫 문장이 삽입한 경우에만 실행됨)
+        guard = f"WHERE NOT EXISTS (SELECT 1 FROM {table_name})" if start == 0 else ""
+        cursor.execute(f"""
+            INSERT INTO {table_name} ({", ".join(columns)})
+            SELECT {select_columns} FROM (VALUES {", ".join([row_placeholder] * chunk_rows)})
+            {guard}
+        """, params[start * len(columns):(start + chunk_rows) * len(columns)])
+        if start == 0 and cursor.rowcount <= 0:
+            return False
+    return True
+
+def _seed_default_data(cursor):
+    """
+    비어있는 테이블에 기본 데이터를 삽입합니다.
 
-QProgressBar::chunk
-{
-    background-color: #46a2da;
-    width: 5px;
-    margin: 0.5px;
+    트랜잭션 시작과 커밋은 호출자(initialize_database)가 담당합니다.
 
-}
+    Args:
+        cursor (sqlite3.Cursor): 트랜잭션이 시작된 SQLite 커서 객체
 
+    Returns:
+        list: 삽입된 기본 데이터 설명 리스트
+    """
+    # 데이터 삽입 부분 - 테이블이 새로 생성된 경우에만 기본 데이터 삽입
+    data_inserted = []
 
-"""
+    # 기본 정규식 (ChapterRegex) - resource/chapter_regex.tsv
+    chapter_regex = _read_seed_tsv("chapter_regex.tsv")
+
+    # 정렬 스타일 (AlignStyle)
+    align_Style = [
+        ("Left", "Left"),
+        ("Center", "Center"),
+        ("Right", "Right")
+    ]
+
+    # 폰트 스타일 (FontStyle)
+    font_Style = [
+        ("Bold", "Bold"),
+        ("Italic", "Italic"),
+        ("Normal", "Normal")
+    ]
+
+    # 기본 괄호 정규식 (PunctuationRegex) - resource/punctuation_regex.tsv
+    punctuation_regex = _read_seed_tsv("punctuation_regex.tsv")
+
+    # 각 테이블이 비어있는 경우에만 삽입 (확인과 삽입을 테이블마다 한 문장으로 처리)
+    seed_data = [
+        ("ChapterRegex", ("name", "example", "pattern"), chapter_regex),
+        ("AlignStyle", ("name", "description"), align_Style),
+        ("FontStyle", ("name", "description"), font_Style),
+        ("PunctuationRegex", ("name", "pattern", "description"), punctuation_regex),
+    ]
+    for table_name, columns, rows in seed_data:
+        if _insert_rows_if_empty(cursor, table_name, columns, rows):
+            data_inserted.append(f'{table_name} 기본 데이터')
 
-        cursor.execute("""
-            INSERT INTO Stylesheet (name, description, content, is_default)
-            VALUES (?, ?, ?, 1)
-        """, ("기본 스타일", "기본 폰트 및 버튼 패딩", default_style))
-        cursor.execute("""
-            INSERT INTO Stylesheet (name, description, content, is_default)
-            VALUES (?, ?, ?, 1)
-        """, ("기본 스타일 2", "기본 폰트 및 버튼 패딩", default_style2))
+    # 기본 스타일시트 (Stylesheet) - Stylesheet 테이블이 비어있는 경우에만 삽입
+    # (스타일시트 파일은 DB를 새로 만들거나 갱신할 때만 resource 폴더에서 읽음)
+    stylesheets = [
+        ("기본 스타일", "기본 폰트 및 버튼 패딩", load_style("default_style"), 1),
+        ("기본 스타일 2", "기본 폰트 및 버튼 패딩", load_style("default_style2"), 1),
+    ]
+    if _insert_rows_if_empty(cursor, "Stylesheet", ("name", "description", "content", "is_default"), stylesheets):
         data_inserted.append('Stylesheet 기본 데이터')
 
     # 기본 텍스트 스타일 설정 (TextStyle) - TextStyle 테이블이 비어있는 경우에만 삽입
-    cursor.execute("SELECT COUNT(*) FROM TextStyle")
-    if cursor.fetchone()[0] == 0:
-        # 기본 텍스트 스타일 설정
-        text_styles = [
-            ("Chapter Title", "chapter", 1, "center", "bold", "#000000", "챕터 제목"),
-            ("Main Text", "main", 1, "left", "normal", "#000000", "본문 내용"),
-            ("Bracket 1", "bracket", 1, "left", "normal", "#888888", "괄호 스타일 1")
-        ]
-        cursor.executemany("""
-            INSERT INTO TextStyle (name, type, is_enabled, align, font_style, font_color, description)
-            VALUES (?, ?, ?, ?, ?, ?, ?)
-        """, text_styles)
+    text_styles = [
+        ("Chapter Title", "chapter", 1, "center", "bold", "#000000", "챕터 제목"),
+        ("Main Text", "main", 1, "left", "normal", "#000000", "본문 내용"),
+        ("Bracket 1", "bracket", 1, "left", "normal", "#888888", "괄호 스타일 1")
+    ]
+    if _insert_rows_if_empty(cursor, "TextStyle",
+                             ("name", "type", "is_enabled", "align", "font_style", "font_color", "description"),
+                             text_styles):
         data_inserted.append('TextStyle 기본 데이터')
 
-    # 변경사항 커밋
-    conn.commit()
-
-    # 결과 출력
-    if tables_created or data_inserted:
-        print("=== DB 초기화 결과 ===")
-        if tables_created:
-            print(f"생성된 테이블: {', '.join(tables_created)}")
-        if data_inserted:
-            print(f"삽입된 데이터: {', '.join(data_inserted)}")
-        print("DB 초기화 완료.")
-    else:
-        print("모든 테이블과 데이터가 이미 존재합니다. 초기화 생략.")
-
-    # CSS 테마 초기화
-    initialize_css_themes()
-
-    conn.close()
+    return data_inserted
 
 # CSS 테마 관리 함수들
-def initialize_css_themes():
-    """CSS 테마 데이터베이스 초기화 및 기본 테마 삽입"""
-    from css_themes import get_all_themes
+def initialize_css_themes(cursor=None):
+    """
+    CSS 테마 데이터베이스 초기화 및 기본 테마 삽입
 
-    conn = sqlite3.connect(DB_FILE)
-    cursor = conn.cursor()
+    Args:
+        cursor (sqlite3.Cursor): 진행 중인 트랜잭션의 커서. 주어지면 그 트랜잭션 안에서
+            삽입하고(커밋은 호출한 쪽에서 함), 없으면 현재 스레드의 연결로 새 트랜잭션을 만듦
 
-    # 기존 테마 개수 확인
-    cursor.execute("SELECT COUNT(*) FROM Stylesheet")
-    theme_count = cursor.fetchone()[0]
+    Returns:
+        int: 삽입한 테마 수 (이미 테마가 있으면 0)
+    """
+    from css_themes import get_all_themes
 
-    if theme_count == 0:
-        print("기본 CSS 테마들을 데이터베이스에 삽입 중...")
-        themes = get_all_themes()
+    own_transaction = cursor is None
+    if own_transaction:
+        cursor = get_connection().cursor()
 
-        for key, theme_data in themes.items():
-            is_default = 1 if key == "default" else 0
-            cursor.execute("""
-                INSERT INTO Stylesheet (name, description, content, is_default)
-                VALUES (?, ?, ?, ?)
-            """, (theme_data["name"], theme_data["description"], theme_data["content"], is_default))
+    # 기존 테마 존재 여부 확인 (전체 개수를 세지 않고 첫 행에서 바로 판단)
+    cursor.execute("SELECT EXISTS(SELECT 1 FROM Stylesheet)")
+    has_themes = cursor.fetchone()[0]
 
-        conn.commit()
-        print(f"{len(themes)}개의 기본 CSS 테마가 삽입되었습니다.")
-    else:
-        print(f"CSS 테마 {theme_count}개가 이미 존재합니다.")
+    if has_themes:
+        logging.debug("CSS 테마가 이미 존재합니다.")
+        return 0
 
-    conn.close()
+    logging.info("기본 CSS 테마들을 데이터베이스에 삽입 중...")
+    if own_transaction:
+        cursor.execute("BEGIN")
+    try:
+        # get_all_themes()가 테마 파일을 하나씩 읽어 행을 만들면 executemany가 바로 삽입
+        cursor.executemany("""
+            INSERT INTO Stylesheet (name, description, content, is_default)
+            VALUES (?, ?, ?, ?)
+        """, get_all_themes())
+        theme_count = cursor.rowcount
+        if own_transaction:
+            cursor.execute("COMMIT")
+    except Exception:
+        # 테마 파일 읽기 실패(OSError)도 공유 연결에 열린 트랜잭션을 남기지 않도록 되돌림
+        if own_transaction and cursor.connection.in_transaction:
+            cursor.execute("ROLLBACK")
+        raise
+    finally:
+        _invalidate_theme_cache()
+    logging.info(f"{theme_count}개의 기본 CSS 테마가 삽입되었습니다.")
+    return theme_count
 
 def get_all_css_themes():
     """모든 CSS 테마를 데이터베이스에서 가져오기"""
-    conn = sqlite3.connect(DB_FILE)
-    cursor = conn.cursor()
+    cursor = get_connection().cursor()
 
     cursor.execute("""
         SELECT id, name, description, content, is_default
@@ -2269,15 +724,13 @@ def get_all_css_themes():
         ORDER BY is_default DESC, name ASC
     """)
 
-    themes = cursor.fetchall()
-    conn.close()
-
-    return themes
+    return cursor.fetchall()
 
-def get_css_theme_by_id(theme_id):
-    """ID로 특정 CSS 테마 가져오기"""
-    conn = sqlite3.connect(DB_FILE)
-    cursor = conn.cursor()
+# 테마는 실행 중에 거의 바뀌지 않으므로 조회 결과를 캐시하고,
+# Stylesheet를 바꾸는 함수에서 _invalidate_theme_cache()로 비움
+@lru_cache(maxsize=64)
+def _fetch_theme_by_id(theme_id):
+    cursor = get_connection().cursor()
 
     cursor.execute("""
         SELECT id, name, description, content, is_default
@@ -2285,15 +738,11 @@ def get_css_theme_by_id(theme_id):
         WHERE id = ?
     """, (theme_id,))
 
-    theme = cursor.fetchone()
-    conn.close()
-
-    return theme
+    return cursor.fetchone()
 
-def get_default_css_theme():
-    """기본 CSS 테마 가져오기"""
-    conn = sqlite3.connect(DB_FILE)
-    cursor = conn.cursor()
+@lru_cache(maxsize=1)
+def _fetch_default_theme():
+    cursor = get_connection().cursor()
 
     cursor.execute("""
         SELECT id, name, description, content, is_default
@@ -2302,106 +751,81 @@ def get_default_css_theme():
         LIMIT 1
     """)
 
-    theme = cursor.fetchone()
-    conn.close()
-
-    return theme
+    return cursor.fetchone()
 
-def set_default_css_theme(theme_id):
-    """기본 CSS 테마 설정"""
-    conn = sqlite3.connect(DB_FILE)
-    cursor = conn.cursor()
+def _invalidate_theme_cache():
+    """Stylesheet 테이블이 바뀐 후 캐시된 테마 조회 결과를 비웁니다."""
+    _fetch_theme_by_id.cache_clear()
+    _fetch_default_theme.cache_clear()
 
-    # 모든 테마의 기본 설정 해제
-    cursor.execute("UPDATE Stylesheet SET is_default = 0")
+def get_css_theme_by_id(theme_id):
+    """ID로 특정 CSS 테마 가져오기 (캐시됨)"""
+    return _fetch_theme_by_id(theme_id)
 
-    # 선택한 테마를 기본으로 설정
-    cursor.execute("UPDATE Stylesheet SET is_default = 1 WHERE id = ?", (theme_id,))
+def get_default_css_theme():
+    """기본 CSS 테마 가져오기 (캐시됨)"""
+    return _fetch_default_theme()
 
-    conn.commit()
-    conn.close()
+def set_default_css_theme(theme_id):
+    """기본 CSS 테마 설정"""
+    # 한 문장으로 선택한 테마만 기본으로 설정 (값이 바뀌는 행만 수정하며, 기본 테마가 없는 순간이 없음)
+    get_connection().execute("""
+        UPDATE Stylesheet
+        SET is_default = CASE WHEN id = ?1 THEN 1 ELSE 0 END
+        WHERE id = ?1 OR is_default = 1
+    """, (theme_id,))
+    _invalidate_theme_cache()
 
 def add_custom_css_theme(name, description, content):
     """사용자 정의 CSS 테마 추가"""
-    conn = sqlite3.connect(DB_FILE)
-    cursor = conn.cursor()
+    cursor = get_connection().cursor()
 
     cursor.execute("""
         INSERT INTO Stylesheet (name, description, content, is_default)
         VALUES (?, ?, ?, 0)
     """, (name, description, content))
+    _invalidate_theme_cache()
 
-    theme_id = cursor.lastrowid
-    conn.commit()
-    conn.close()
-
-    return theme_id
+    return cursor.lastrowid
 
 def update_css_theme(theme_id, name, description, content):
     """CSS 테마 업데이트"""
-    conn = sqlite3.connect(DB_FILE)
-    cursor = conn.cursor()
+    cursor = get_connection().cursor()
 
     cursor.execute("""
         UPDATE Stylesheet
         SET name = ?, description = ?, content = ?
         WHERE id = ?
     """, (name, description, content, theme_id))
-
-    conn.commit()
-    conn.close()
+    _invalidate_theme_cache()
 
 def delete_css_theme(theme_id):
     """CSS 테마 삭제 (기본 테마가 아닌 경우에만)"""
-    conn = sqlite3.connect(DB_FILE)
-    cursor = conn.cursor()
+    cursor = get_connection().cursor()
 
     # 기본 테마인지 확인
     cursor.execute("SELECT is_default FROM Stylesheet WHERE id = ?", (theme_id,))
     result = cursor.fetchone()
 
     if result and result[0] == 1:
-        conn.close()
         return False, "기본 테마는 삭제할 수 없습니다."
 
     cursor.execute("DELETE FROM Stylesheet WHERE id = ?", (theme_id,))
+    _invalidate_theme_cache()
 
     if cursor.rowcount > 0:
-        conn.commit()
-        conn.close()
         return True, "테마가 삭제되었습니다."
     else:
-        conn.close()
         return False, "테마를 찾을 수 없습니다."
 
 def save_font_folder(folder_path):
     """폰트 폴더 경로를 저장합니다. (1개만 유지)"""
     try:
-        conn = sqlite3.connect(DB_FILE)
-        cursor = conn.cursor()
-
-        # FontFolder 테이블이 없으면 생성
-        if not table_exists(cursor, 'FontFolder'):
-            cursor.execute("""
-            CREATE TABLE FontFolder (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                folder_path TEXT NOT NULL,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-            );
-            """)
-
-        # 기존 데이터 모두 삭제 (1개만 유지)
-        cursor.execute("DELETE FROM FontFolder")
-
-        # 새 폴더 경로 삽입
-        cursor.execute("""
-            INSERT INTO FontFolder (folder_path, updated_at)
-            VALUES (?, CURRENT_TIMESTAMP)
+        # 항상 id 1 행을 덮어써서 삭제 없이 한 문장으로 1개만 유지
+        get_connection().execute("""
+            INSERT OR REPLACE INTO FontFolder (id, folder_path, updated_at)
+            VALUES (1, ?, CAST(strftime('%s', 'now') AS INTEGER))
         """, (folder_path,))
-
-        conn.commit()
-        conn.close()
         return True, "폰트 폴더가 저장되었습니다."
     except Exception as e:
         return False, f"폰트 폴더 저장 중 오류: {str(e)}"
@@ -2409,33 +833,53 @@ def save_font_folder(folder_path):
 def get_font_folder():
     """저장된 폰트 폴더 경로를 반환합니다."""
     try:
-        conn = sqlite3.connect(DB_FILE)
-        cursor = conn.cursor()
-
-        # FontFolder 테이블이 없으면 None 반환
-        if not table_exists(cursor, 'FontFolder'):
-            conn.close()
-            return None
+        cursor = get_connection().cursor()
 
         cursor.execute("SELECT folder_path FROM FontFolder ORDER BY updated_at DESC LIMIT 1")
         result = cursor.fetchone()
-        conn.close()
 
         if result:
             return result[0]
         return None
     except Exception as e:
-        print(f"폰트 폴더 조회 중 오류: {str(e)}")
+        logging.error(f"폰트 폴더 조회 중 오류: {str(e)}")
         return None
 
+def get_cached_encoding(file_path, mtime, size):
+    """
+    파일의 인코딩 감지 결과를 EncodingCache에서 조회합니다.
+
+    Args:
+        file_path (str): 텍스트 파일 경로
+        mtime (float): 현재 파일 수정 시각 (os.stat().st_mtime)
+        size (int): 현재 파일 크기
+
+    Returns:
+        str | None: 수정 시각과 크기가 같은 감지 결과가 있으면 인코딩, 없으면 None
+    """
+    row = get_connection().execute(
+        "SELECT encoding FROM EncodingCache WHERE path = ? AND mtime = ? AND size = ?",
+        (file_path, mtime, size)).fetchone()
+    return row[0] if row else None
+
+def save_cached_encoding(file_path, mtime, size, encoding):
+    """
+    파일의 인코딩 감지 결과를 EncodingCache에 저장합니다. (파일마다 최신 결과 1개만 유지)
+
+    Args:
+        file_path (str): 텍스트 파일 경로
+        mtime (float): 감지한 파일의 수정 시각 (os.stat().st_mtime)
+        size (int): 감지한 파일의 크기
+        encoding (str): 감지한 인코딩
+    """
+    get_connection().execute(
+        "INSERT OR REPLACE INTO EncodingCache (path, mtime, size, encoding) VALUES (?, ?, ?, ?)",
+        (file_path, mtime, size, encoding))
+
 def update_punctuation_regex_data():
     """PunctuationRegex 테이블의 데이터를 새로운 패턴으로 업데이트합니다."""
     try:
-        conn = sqlite3.connect(DB_FILE)
-        cursor = conn.cursor()
-
-        # 기존 데이터 삭제
-        cursor.execute("DELETE FROM PunctuationRegex")
+        cursor = get_connection().cursor()
 
         # 새로운 데이터 삽입
         new_punctuation_regex = [
@@ -2454,17 +898,21 @@ def update_punctuation_regex_data():
             ("（...） (Chinese Parentheses)", r"（(.*?)）", "중국어 소괄호로 감싸진 텍스트")
         ]
 
-        cursor.executemany("""
-            INSERT INTO PunctuationRegex (name, pattern, description) VALUES (?, ?, ?)
-        """, new_punctuation_regex)
-
-        conn.commit()
-        conn.close()
-        print(f"PunctuationRegex 데이터 업데이트 완료: {len(new_punctuation_regex)}개 항목")
+        # 기존 데이터 삭제 후 비운 테이블에 다중 행 VALUES 문으로 한 번에 삽입 (하나의 트랜잭션)
+        cursor.execute("BEGIN")
+        try:
+            cursor.execute("DELETE FROM PunctuationRegex")
+            _insert_rows_if_empty(cursor, "PunctuationRegex", ("name", "pattern", "description"), new_punctuation_regex)
+            cursor.execute("COMMIT")
+        except Exception:
+            if cursor.connection.in_transaction:
+                cursor.execute("ROLLBACK")
+            raise
+        logging.info(f"PunctuationRegex 데이터 업데이트 완료: {len(new_punctuation_regex)}개 항목")
         return True, f"{len(new_punctuation_regex)}개 항목이 업데이트되었습니다."
 
     except Exception as e:
-        print(f"PunctuationRegex 데이터 업데이트 실패: {str(e)}")
+        logging.error(f"PunctuationRegex 데이터 업데이트 실패: {str(e)}")
         return False, f"업데이트 실패: {str(e)}"
 
 if __name__ == "__main__":
@@ -16,11 +16,17 @@ PyQt6 UI 컴포넌트에 로드하는 기능을 제공합니다.
 """
 
 import os
+import re
 import sqlite3
 import logging
+from functools import lru_cache
 from typing import List, Tuple, Optional
+from PyQt6.QtCore import Qt
+from PyQt6.QtGui import QStandardItem, QStandardItemModel
 from PyQt6.QtWidgets import QComboBox
 
+import ePub_db
+
 # DB 파일 경로 설정 (현재 실행 파일 기준)
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 DB_FILE = os.path.join(BASE_DIR, "epub_config.db")
@@ -29,6 +35,9 @@ def get_connection():
     """
     SQLite 데이터베이스 연결 객체를 반환합니다.
 
+    ePub_db가 스레드마다 재사용하는 연결을 반환하므로 WAL 모드와 연결 PRAGMA(synchronous, cache_size,
+    mmap_size 등)가 이미 적용되어 있습니다.
+
     Returns:
         sqlite3.Connection: SQLite 데이터베이스 연결 객체
 
@@ -39,7 +48,7 @@ def get_connection():
     try:
         if not os.path.exists(DB_FILE):
             raise FileNotFoundError(f"데이터베이스 파일을 찾을 수 없습니다: {DB_FILE}")
-        return sqlite3.connect(DB_FILE)
+        return ePub_db.get_connection()
     except sqlite3.Error as e:
         logging.error(f"데이터베이스 연결 중 오류 발생: {e}")
         raise
@@ -127,6 +136,95 @@ def load_text_styles(style_type):
         """, (style_type,))
         return cursor.fetchall()
 
+def load_all_ui_lists():
+    """
+    콤보박스 초기화에 필요한 목록을 한 번에 조회합니다.
+
+    load_stylesheet_list, load_chapter_regex_list, load_punctuation_regex_list,
+    load_text_styles를 각각 호출하는 대신 같은 커서로 이어서 조회하고,
+    TextStyle은 타입별로 나누어 조회하지 않고 한 번에 읽어 Python에서 분류합니다.
+
+    Returns:
+        dict: {
+            "stylesheets": [(id, name)],
+            "chapter_regex": [(id, name, example, pattern)],
+            "punctuation_regex": [(id, name, pattern)],
+            "text_styles": {"bracket": [(id, name)], "chapter": [...], "main": [...]}
+        } (조회 실패 시 빈 목록)
+    """
+    result = {
+        "stylesheets": [],
+        "chapter_regex": [],
+        "punctuation_regex": [],
+        "text_styles": {"bracket": [], "chapter": [], "main": []},
+    }
+    try:
+        with get_connection() as conn:
+            cursor = conn.cursor()
+            result["stylesheets"] = cursor.execute("SELECT id, name FROM Stylesheet ORDER BY id").fetchall()
+            result["chapter_regex"] = cursor.execute("""
+                SELECT id, name, example, pattern
+                FROM ChapterRegex
+                WHERE is_enabled = 1
+                ORDER BY id
+            """).fetchall()
+            result["punctuation_regex"] = cursor.execute("""
+                SELECT id, name, pattern
+                FROM PunctuationRegex
+                WHERE is_enabled = 1
+                ORDER BY id
+            """).fetchall()
+            for style_id, name, style_type in cursor.execute("""
+                SELECT id, name, type
+                FROM TextStyle
+                WHERE type IN ('bracket', 'chapter', 'main') AND is_enabled = 1
+                ORDER BY type, id
+            """):
+                result["text_styles"][style_type].append((style_id, name))
+    except sqlite3.Error as e:
+        logging.error(f"콤보박스 목록 조회 중 오류 발생: {e}")
+    return result
+
+@lru_cache(maxsize=256)
+def compile_regex(pattern: str, flags: int = 0):
+    """
+    DB에서 읽은 정규식 패턴을 컴파일하고 결과를 프로세스 전체에서 캐시합니다.
+
+    콤보박스 userData에는 패턴 문자열을 그대로 두고(챕터 검색 워커가 패턴을 결합/분석함),
+    패턴을 적용하는 쪽에서 이 함수로 컴파일하여 같은 패턴과 플래그는 한 번만 컴파일합니다.
+    잘못된 패턴의 re.error는 캐시되지 않고 그대로 전달됩니다.
+
+    Args:
+        pattern (str): 정규식 패턴
+        flags (int): 정규식 플래그
+
+    Returns:
+        re.Pattern: 컴파일된 정규식 객체
+    """
+    return re.compile(pattern, flags)
+
+def _set_combobox_model(widget: QComboBox, items):
+    """
+    (표시 텍스트, userData) 항목으로 만든 모델을 콤보박스에 한 번에 설정
+
+    addItem을 항목마다 호출하면 항목마다 모델 변경 신호가 발생하므로
+    QStandardItemModel을 먼저 채운 뒤 setModel로 한 번에 교체합니다.
+    :param widget: QComboBox 객체
+    :param items: [(display_text, user_data)] 형태의 데이터
+    """
+    items = list(items)
+    model = QStandardItemModel(len(items), 1, widget)
+    for row, (display_text, user_data) in enumerate(items):
+        item = QStandardItem(display_text)
+        item.setData(user_data, Qt.ItemDataRole.UserRole)
+        model.setItem(row, item)
+
+    # 이전 모델은 콤보박스가 부모이면 setModel이 삭제함
+    widget.blockSignals(True)
+    widget.setModel(model)
+    widget.setCurrentIndex(0 if items else -1)
+    widget.blockSignals(False)
+
 def set_combobox_items(widget: QComboBox, data_list, display_column=1, user_data_column=0):
     """
     QComboBox 위젯에 항목들을 일괄 설정
@@ -135,11 +233,7 @@ def set_combobox_items(widget: QComboBox, data_list, display_column=1, user_data
     :param display_column: 콤보박스에 표시할 텍스트가 있는 컬럼 인덱스
     :param user_data_column: userData로 저장할 값의 컬럼 인덱스
     """
-    widget.clear()
-    for row in data_list:
-        display_text = row[display_column]
-        user_data = row[user_data_column]
-        widget.addItem(display_text, user_data)
+    _set_combobox_model(widget, ((row[display_column], row[user_data_column]) for row in data_list))
 
 def set_combobox_items_for_regex(widget: QComboBox, regex_list):
     """
@@ -148,22 +242,7 @@ def set_combobox_items_for_regex(widget: QComboBox, regex_list):
     :param widget: QComboBox
     :param regex_list: [(id, name, example, pattern)]
     """
-    widget.clear()
-    for row in regex_list:
-        name = row[1]
-        example = row[2] or ""
-        pattern = row[3]
-        display_text = f"{name} ({example})" if example else name
-        widget.addItem(display_text, userData=pattern)
-
-    """Stylesheet 테이블에서 기본 테마를 찾아 앱에 적용"""
-    with get_connection() as conn:
-        cursor = conn.cursor()
-        cursor.execute("""
-            SELECT content FROM Stylesheet
-            WHERE is_default = 1
-            LIMIT 1
-        """)
-        row = cursor.fetchone()
-      #  if row:
-      #      app.setStyleSheet(row[0])
+    _set_combobox_model(widget, (
+        (f"{name} ({example})" if example else name, pattern)
+        for _, name, example, pattern in regex_list
+    ))
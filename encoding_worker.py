@@ -1,56 +1,111 @@
 """
 텍스트 파일 인코딩 감지 워커 모듈
 
-텍스트 파일의 인코딩을 백그라운드에서 감지하는 QThread 워커 클래스를 제공합니다.
+텍스트 파일의 인코딩을 백그라운드에서 감지하는 QRunnable 작업 클래스를 제공합니다.
 GUI 블로킹 없이 파일 인코딩을 자동으로 감지하여 사용자에게 알려줍니다.
 
 주요 기능:
-- 비동기 인코딩 감지 (chardet 라이브러리 사용)
+- 비동기 인코딩 감지 (cchardet, charset-normalizer, chardet 중 설치된 라이브러리 사용)
 - PyQt6 신호를 통한 결과 전달
 - 오류 처리 및 예외 상황 관리
-- GUI 메인 스레드 블로킹 방지
+- GUI 메인 스레드 블로킹 방지 (QThreadPool의 스레드를 재사용하여 파일마다 스레드를 만들지 않음)
 
 작성자: ePub Python Team
 최종 수정일: 2025-07-28
 """
 
-from PyQt6.QtCore import QThread, pyqtSignal
-import chardet
+from PyQt6.QtCore import QObject, QRunnable, pyqtSignal
 import logging
+import os
+import sqlite3
 from typing import Optional
 
-class EncodingDetectWorker(QThread):
+import ePub_db
+
+# 인코딩 감지 라이브러리 - 설치된 것 중 가장 빠른 것을 사용
+# cchardet(uchardet C 바인딩)과 charset-normalizer는 순수 Python인 chardet보다 빠르며,
+# 모두 detect(bytes)가 {'encoding', 'confidence'} 사전을 반환하므로 그대로 바꿔 사용
+try:
+    import cchardet as chardet
+except ImportError:
+    try:
+        import charset_normalizer as chardet
+    except ImportError:
+        import chardet
+
+# 인코딩 감지에 사용할 파일 앞부분 크기 (처음 8KB만 읽어서 성능 향상)
+SAMPLE_SIZE = 8192
+
+
+def read_sample(file_path: str, size: int = SAMPLE_SIZE) -> bytes:
     """
-    텍스트 파일의 인코딩을 백그라운드에서 감지하는 워커 스레드입니다.
+    파일 앞부분을 버퍼링 없이 한 번의 시스템 호출로 읽습니다.
 
-    chardet 라이브러리를 사용하여 파일의 첫 8KB를 분석하고
-    가장 가능성이 높은 인코딩을 감지합니다.
+    open()의 BufferedReader를 거치지 않고 os.open + os.pread로 읽어
+    내부 버퍼로의 복사를 생략합니다. os.pread가 없는 Windows에서는 os.read를 사용합니다.
+
+    Args:
+        file_path (str): 읽을 파일 경로
+        size (int): 읽을 최대 바이트 수
+
+    Returns:
+        bytes: 파일 앞부분 (빈 파일이면 b"")
+
+    Raises:
+        OSError: 파일을 열거나 읽을 수 없을 때 (FileNotFoundError, PermissionError 포함)
+    """
+    fd = os.open(file_path, os.O_RDONLY | getattr(os, "O_BINARY", 0))
+    try:
+        if hasattr(os, "pread"):
+            return os.pread(fd, size, 0)
+        return os.read(fd, size)
+    finally:
+        os.close(fd)
+
+class EncodingDetectSignals(QObject):
+    """
+    EncodingDetectRunnable의 결과를 전달하는 신호 객체입니다.
+
+    QRunnable은 QObject가 아니어서 신호를 가질 수 없으므로 별도 객체로 분리합니다.
 
     Signals:
         finished (str, str): 감지 완료 시 (파일경로, 인코딩) 전달
         error (str): 오류 발생 시 오류 메시지 전달
-
-    Attributes:
-        file_path (str): 인코딩을 감지할 파일의 경로
     """
 
     # PyQt6 신호 정의
     finished = pyqtSignal(str, str)  # file_path, encoding
     error = pyqtSignal(str)         # error_message
 
+
+class EncodingDetectRunnable(QRunnable):
+    """
+    텍스트 파일의 인코딩을 백그라운드에서 감지하는 작업입니다.
+
+    chardet 호환 라이브러리를 사용하여 파일의 첫 8KB를 분석하고
+    가장 가능성이 높은 인코딩을 감지합니다.
+    QThreadPool.globalInstance().start()로 실행하면 풀의 스레드를 재사용하므로
+    파일마다 스레드를 새로 만들지 않습니다.
+
+    Attributes:
+        file_path (str): 인코딩을 감지할 파일의 경로
+        signals (EncodingDetectSignals): 결과 신호 (start() 전에 연결)
+    """
+
     def __init__(self, file_path: str):
         """
-        인코딩 감지 워커를 초기화합니다.
+        인코딩 감지 작업을 초기화합니다.
 
         Args:
             file_path (str): 인코딩을 감지할 텍스트 파일의 경로
         """
         super().__init__()
         self.file_path = file_path
+        self.signals = EncodingDetectSignals()
 
     def run(self):
         """
-        워커 스레드의 메인 실행 함수입니다.
+        스레드 풀에서 실행되는 작업 함수입니다.
 
         파일의 첫 8KB를 읽어 chardet으로 인코딩을 감지하고
         결과를 finished 신호로 전달하거나 오류 시 error 신호를 발생시킵니다.
@@ -63,44 +118,83 @@ class EncodingDetectWorker(QThread):
             error: 인코딩 감지 실패 또는 오류 발생 시 오류 메시지
         """
         try:
-            # 파일 존재 여부 확인
-            import os
-            if not os.path.exists(self.file_path):
-                self.error.emit(f"파일을 찾을 수 없습니다: {self.file_path}")
+            # 같은 파일을 다시 열면 이전 감지 결과 사용 (수정 시각과 크기로 변경 여부 확인)
+            # 파일이 없으면 FileNotFoundError
+            st = os.stat(self.file_path)
+            cached_encoding = self._get_cached_encoding(st)
+            if cached_encoding:
+                logging.info(f"저장된 인코딩 감지 결과 사용: {cached_encoding}")
+                self.signals.finished.emit(self.file_path, cached_encoding)
                 return
 
             # 파일 인코딩 감지
-            with open(self.file_path, 'rb') as f:
-                sample = f.read(8192)  # 처음 8KB만 읽어서 성능 향상
+            sample = read_sample(self.file_path)
 
-                if not sample:
-                    self.error.emit("파일이 비어있거나 읽을 수 없습니다.")
-                    return
+            if not sample:
+                self.signals.error.emit("파일이 비어있거나 읽을 수 없습니다.")
+                return
 
-                result = chardet.detect(sample)
-                encoding = result.get('encoding')
-                confidence = result.get('confidence', 0)
+            result = chardet.detect(sample)
+            encoding = result.get('encoding')
+            confidence = result.get('confidence') or 0  # cchardet은 None을 반환할 수 있음
 
-                if not encoding:
-                    self.error.emit("인코딩을 감지할 수 없습니다.")
-                    return
+            if not encoding:
+                self.signals.error.emit("인코딩을 감지할 수 없습니다.")
+                return
 
-                # 신뢰도가 너무 낮으면 경고
-                if confidence < 0.7:
-                    logging.warning(f"인코딩 감지 신뢰도가 낮습니다: {confidence:.2f}")
+            # 신뢰도가 너무 낮으면 경고
+            if confidence < 0.7:
+                logging.warning(f"인코딩 감지 신뢰도가 낮습니다: {confidence:.2f}")
 
-                logging.info(f"인코딩 감지 완료: {encoding} (신뢰도: {confidence:.2f})")
-                self.finished.emit(self.file_path, encoding)
+            logging.info(f"인코딩 감지 완료: {encoding} (신뢰도: {confidence:.2f})")
+            self._save_cached_encoding(st, encoding)
+            self.signals.finished.emit(self.file_path, encoding)
 
+        except FileNotFoundError:
+            self.signals.error.emit(f"파일을 찾을 수 없습니다: {self.file_path}")
         except PermissionError:
             error_msg = f"파일 접근 권한이 없습니다: {self.file_path}"
             logging.error(error_msg)
-            self.error.emit(error_msg)
+            self.signals.error.emit(error_msg)
         except UnicodeDecodeError as e:
             error_msg = f"파일 읽기 중 인코딩 오류 발생: {e}"
             logging.error(error_msg)
-            self.error.emit(error_msg)
+            self.signals.error.emit(error_msg)
         except Exception as e:
             error_msg = f"인코딩 감지 중 예상치 못한 오류 발생: {e}"
             logging.error(error_msg)
-            self.error.emit(error_msg)
+            self.signals.error.emit(error_msg)
+        finally:
+            # 풀 스레드는 유휴 시간이 지나면 끝나므로 이 작업에서 연 DB 연결은 바로 정리
+            ePub_db.close_connection()
+
+    def _get_cached_encoding(self, st) -> Optional[str]:
+        """
+        EncodingCache에서 파일의 이전 감지 결과를 조회합니다.
+
+        캐시는 성능을 위한 것이므로 DB 오류는 기록만 하고 감지를 계속합니다.
+
+        Args:
+            st (os.stat_result): 파일의 현재 상태
+
+        Returns:
+            Optional[str]: 파일이 바뀌지 않았으면 저장된 인코딩, 아니면 None
+        """
+        try:
+            return ePub_db.get_cached_encoding(self.file_path, st.st_mtime, st.st_size)
+        except sqlite3.Error as e:
+            logging.warning(f"인코딩 캐시 조회 실패: {e}")
+            return None
+
+    def _save_cached_encoding(self, st, encoding: str):
+        """
+        감지한 인코딩을 EncodingCache에 저장합니다. (DB 오류는 기록만 함)
+
+        Args:
+            st (os.stat_result): 감지 전에 읽은 파일 상태
+            encoding (str): 감지한 인코딩
+        """
+        try:
+            ePub_db.save_cached_encoding(self.file_path, st.st_mtime, st.st_size, encoding)
+        except sqlite3.Error as e:
+            logging.warning(f"인코딩 캐시 저장 실패: {e}")
@@ -33,7 +33,9 @@ import shutil
 import time
 import logging
 import re
+import posixpath
 import zipfile
+from urllib.parse import unquote
 from typing import List, Dict, Optional, Tuple
 from PyQt6.QtWidgets import QMessageBox, QProgressDialog
 from PyQt6.QtCore import QTimer, Qt
@@ -43,10 +45,101 @@ from fontTools.ttLib import TTFont
 from xml.etree import ElementTree as ET
 import io
 
+# 품질 검증에서 챕터마다 쓰는 HTML 태그 패턴 (미리 컴파일)
+_TAG_RE = re.compile(r'<[^>]+>')
+
+# '<title' 바로 뒤에 올 수 있는 문자 (<titlepage> 같은 다른 태그와 구분)
+_TITLE_TAG_END = ('>', ' ', '\t', '\n', '\r', '/')
+
+# XHTML 루트 요소 확인 시 파서에 한 번에 넘기는 바이트 수 (루트 태그는 문서 앞부분에 있음)
+_ROOT_PROBE_CHUNK = 256
+
+# 문서 맨 앞의 XML 선언 (UTF-8 BOM 허용)
+_XML_DECL_RE = re.compile(rb'^(?:\xef\xbb\xbf)?\s*<\?xml[^>]*\?>')
+
+# 품질 검증에서 OPF/내비게이션 문서를 직접 읽을 때 쓰는 XML 네임스페이스
+_DC_NS = '{http://purl.org/dc/elements/1.1/}'
+_EPUB_TYPE_ATTR = '{http://www.idpf.org/2007/ops}type'
+
 # ==================================================================================
 # ePub 품질 검증 클래스
 # ==================================================================================
 
+def _text_length(content: str) -> int:
+    """
+    HTML 태그를 제거하고 앞뒤 공백을 뺀 텍스트의 길이를 계산합니다.
+
+    re.sub(r'<[^>]+>', '', content).strip()과 같은 결과를 내지만, 마지막
+    '>' 뒤의 구간은 정규식에 넘기지 않습니다. 닫히지 않은 '<'가 많은
+    챕터에서 매 '<'마다 문서 끝까지 다시 훑는 이차 시간 동작을 막습니다.
+
+    Args:
+        content (str): HTML 문자열
+
+    Returns:
+        int: 태그를 제외한 텍스트 길이
+    """
+    # 마지막 '>' 이후의 '<'는 태그를 닫을 수 없으므로 그대로 텍스트로 취급
+    last_close = content.rfind('>')
+    text = _TAG_RE.sub('', content[:last_close + 1]) + content[last_close + 1:]
+    return len(text.strip())
+
+
+def _has_html_root(raw: bytes) -> bool:
+    """
+    XHTML 문서의 루트 요소가 <html>인지 확인합니다.
+
+    스트리밍 XML 파서에 문서 앞부분부터 조금씩 넘기다가 첫 시작 태그가
+    나오면 바로 멈추므로, 본문 전체를 파싱하지 않습니다. XML 선언이나
+    DOCTYPE이 깨진 문서, 루트가 <html>이 아닌 문서는 False를 반환합니다.
+
+    XML 선언에 파서가 지원하지 않는 다중 바이트 인코딩(euc-kr, shift_jis 등)이
+    적혀 있으면 선언을 떼고 UTF-8로 다시 확인합니다. 호출자는 UTF-8로 디코딩되는
+    문서만 넘기므로, 이런 문서는 인코딩을 바꿔 저장하면서 선언을 고치지 않은 경우입니다.
+
+    Args:
+        raw (bytes): 아카이브에서 읽은 XHTML 원본 바이트
+
+    Returns:
+        bool: 루트 요소가 html이면 True
+    """
+    try:
+        return _probe_html_root(raw)
+    except ValueError:
+        # "multi-byte encodings are not supported"
+        body = _XML_DECL_RE.sub(b'', raw, count=1)
+        if len(body) == len(raw):
+            return False
+        try:
+            return _probe_html_root(body)
+        except ValueError:
+            return False
+
+
+def _probe_html_root(raw: bytes) -> bool:
+    """
+    스트리밍 XML 파서로 첫 시작 태그가 html인지 확인합니다.
+
+    Args:
+        raw (bytes): XHTML 원본 바이트
+
+    Returns:
+        bool: 루트 요소가 html이면 True (XML 문법 오류가 있으면 False)
+
+    Raises:
+        ValueError: XML 선언의 인코딩을 파서가 지원하지 않는 경우
+    """
+    parser = ET.XMLPullParser(events=('start',))
+    try:
+        for offset in range(0, len(raw), _ROOT_PROBE_CHUNK):
+            parser.feed(raw[offset:offset + _ROOT_PROBE_CHUNK])
+            for _, element in parser.read_events():
+                return element.tag.rpartition('}')[2] == 'html'
+    except ET.ParseError:
+        return False
+    return False
+
+
 class EpubQualityValidator:
     """
     ePub 파일의 품질과 표준 준수를 검증하는 클래스입니다.
@@ -76,6 +169,7 @@ class EpubQualityValidator:
         """
         self.main_window = main_window
         self.issues = []
+        self._log_buffer = []  # 검증 로그 (검증이 끝날 때 한 번에 출력)
 
     def validate_epub_file(self, epub_path: str) -> List[str]:
         """
@@ -99,37 +193,49 @@ class EpubQualityValidator:
         try:
             self.log_info(f"ePub 품질 검증 시작: {epub_path}")
 
-            # 파일 존재 여부 확인
-            if not os.path.exists(epub_path):
+            # 파일 존재 여부 확인 (stat 결과는 크기 검증에도 재사용)
+            try:
+                file_stat = os.stat(epub_path)
+            except FileNotFoundError:
                 self.issues.append("❌ ePub 파일이 존재하지 않습니다.")
                 return self.issues
 
             # 1. 파일 크기 검증
-            self._check_file_size(epub_path)
+            self._check_file_size(file_stat.st_size)
+
+            # ZIP 아카이브는 한 번만 열어 모든 검사에서 공유
+            with zipfile.ZipFile(epub_path, 'r') as zip_file:
+                # 2. 파일 구조 검증 (ePub이 아니면 나머지 검사 생략)
+                if not self._check_file_structure(zip_file):
+                    self.log_warning("ePub 파일이 아니므로 나머지 검증을 건너뜁니다.")
+                    return self.issues
+
+                # ebooklib 대신 container.xml과 OPF만 직접 파싱
+                package = self._read_package(zip_file)
 
-            # 2. 파일 구조 검증
-            self._check_file_structure(epub_path)
+                # 3. 메타데이터 검증
+                self._check_metadata(package)
 
-            # 3. 메타데이터 검증
-            self._check_metadata(epub_path)
+                # 항목을 한 번만 순회하여 4~9번 검사에 필요한 통계 수집
+                stats = self._scan_items(zip_file, package)
 
-            # 4. 챕터 내용 검증
-            self._check_chapter_content(epub_path)
+                # 4. 챕터 내용 검증
+                self._check_chapter_content(stats)
 
-            # 5. 이미지 검증
-            self._check_images(epub_path)
+                # 5. 이미지 검증
+                self._check_images(stats)
 
-            # 6. CSS 스타일 검증
-            self._check_css_styles(epub_path)
+                # 6. CSS 스타일 검증
+                self._check_css_styles(stats)
 
-            # 7. 폰트 검증
-            self._check_fonts(epub_path)
+                # 7. 폰트 검증
+                self._check_fonts(stats)
 
-            # 8. XHTML 구조 검증
-            self._check_xhtml_structure(epub_path)
+                # 8. XHTML 구조 검증
+                self._check_xhtml_structure(stats)
 
-            # 9. 목차 구조 검증
-            self._check_toc_structure(epub_path)
+                # 9. 목차 구조 검증
+                self._check_toc_structure(package, stats)
 
             if not self.issues:
                 self.log_info("ePub 품질 검증 통과: 문제점이 발견되지 않았습니다.")
@@ -139,12 +245,14 @@ class EpubQualityValidator:
         except Exception as e:
             self.issues.append(f"❌ 품질 검증 중 오류 발생: {str(e)}")
 
+        finally:
+            self._flush_log()
+
         return self.issues
 
-    def _check_file_size(self, epub_path):
+    def _check_file_size(self, file_size):
         """파일 크기를 확인합니다."""
         try:
-            file_size = os.path.getsize(epub_path)
             size_mb = file_size / (1024 * 1024)
 
             if size_mb > 100:  # 100MB 초과
@@ -157,50 +265,166 @@ class EpubQualityValidator:
         except Exception as e:
             self.issues.append(f"❌ 파일 크기 확인 실패: {str(e)}")
 
-    def _check_file_structure(self, epub_path):
-        """ePub 파일 구조를 확인합니다."""
+    def _check_file_structure(self, zip_file):
+        """
+        ePub 파일 구조를 확인합니다.
+
+        Args:
+            zip_file (zipfile.ZipFile): 열려 있는 ePub 아카이브
+
+        Returns:
+            bool: mimetype이 올바른 ePub이면 True, 아니면 False
+        """
         try:
-            with zipfile.ZipFile(epub_path, 'r') as zip_file:
-                file_list = zip_file.namelist()
-
-                # 필수 파일 확인
-                required_files = ['mimetype', 'META-INF/container.xml']
-                for required_file in required_files:
-                    if required_file not in file_list:
-                        self.issues.append(f"❌ 필수 파일 누락: {required_file}")
-
-                # OPF 파일 확인
-                opf_files = [f for f in file_list if f.endswith('.opf')]
-                if not opf_files:
-                    self.issues.append("❌ OPF 파일이 없습니다.")
-
-                # XHTML 파일 확인
-                xhtml_files = [f for f in file_list if f.endswith(('.xhtml', '.html'))]
-                if not xhtml_files:
-                    self.issues.append("❌ 콘텐츠 파일(XHTML)이 없습니다.")
-                else:
-                    self.log_info(f"콘텐츠 파일 수: {len(xhtml_files)}개")
+            required_files = ['mimetype', 'META-INF/container.xml']
+            required_set = set(required_files)
+            found_files = set()
+            opf_count = 0
+            xhtml_count = 0
+
+            # 파일 목록을 한 번만 순회하며 필수 파일, OPF, XHTML을 함께 집계
+            for name in zip_file.namelist():
+                if name in required_set:
+                    found_files.add(name)
+                elif name.endswith('.opf'):
+                    opf_count += 1
+                elif name.endswith(('.xhtml', '.html')):
+                    xhtml_count += 1
+
+            # 필수 파일 확인
+            for required_file in required_files:
+                if required_file not in found_files:
+                    self.issues.append(f"❌ 필수 파일 누락: {required_file}")
+
+            # mimetype 내용 확인
+            is_epub = 'mimetype' in found_files
+            if is_epub:
+                mimetype = zip_file.read('mimetype').strip()
+                if mimetype != b'application/epub+zip':
+                    self.issues.append(f"❌ mimetype이 올바르지 않습니다: {mimetype[:50].decode('utf-8', errors='replace')}")
+                    is_epub = False
+
+            # OPF 파일 확인
+            if opf_count == 0:
+                self.issues.append("❌ OPF 파일이 없습니다.")
+
+            # XHTML 파일 확인
+            if xhtml_count == 0:
+                self.issues.append("❌ 콘텐츠 파일(XHTML)이 없습니다.")
+            else:
+                self.log_info(f"콘텐츠 파일 수: {xhtml_count}개")
+
+            return is_epub
 
         except Exception as e:
             self.issues.append(f"❌ 파일 구조 확인 실패: {str(e)}")
+            return False
+
+    def _read_package(self, zip_file):
+        """
+        container.xml과 OPF 파일을 직접 읽어 검증에 필요한 패키지 정보를 만듭니다.
+
+        epub.read_epub()은 모든 항목을 압축 해제하고 목차까지 객체로 만들지만,
+        검증에는 메타데이터, manifest 목록, 최상위 목차 항목 수만 필요합니다.
+
+        Args:
+            zip_file (zipfile.ZipFile): 열려 있는 ePub 아카이브
+
+        Returns:
+            dict: 'metadata' (DC 항목별 텍스트 목록),
+                  'items' (document/image/style/font별 아카이브 경로 목록),
+                  'toc_count' (최상위 목차 항목 수)
+
+        Raises:
+            KeyError: container.xml 또는 OPF 파일이 아카이브에 없을 때
+            ValueError: container.xml에 OPF 경로가 없을 때
+            ET.ParseError: container.xml 또는 OPF가 올바른 XML이 아닐 때
+        """
+        container = ET.fromstring(zip_file.read('META-INF/container.xml'))
+        rootfile = container.find('.//{*}rootfile')
+        if rootfile is None or not rootfile.get('full-path'):
+            raise ValueError("container.xml에 OPF 경로가 없습니다.")
+
+        opf_path = rootfile.get('full-path')
+        opf_dir = posixpath.dirname(opf_path)
+        opf = ET.fromstring(zip_file.read(opf_path))
+
+        metadata = {
+            name: [element.text or '' for element in opf.iterfind(f'.//{_DC_NS}{name}')]
+            for name in ('title', 'creator', 'language')
+        }
+
+        # 항목 종류별로 한 번만 분류해 두고 검사 루프에서는 분기 없이 순회
+        items = {'document': [], 'image': [], 'style': [], 'font': []}
+        nav_path = None
+        ncx_path = None
+        for entry in opf.iterfind('.//{*}manifest/{*}item'):
+            href = entry.get('href')
+            if not href:
+                continue
+
+            path = posixpath.normpath(posixpath.join(opf_dir, unquote(href)))
+            media_type = entry.get('media-type', '')
+            properties = (entry.get('properties') or '').split()
+
+            if media_type == 'application/xhtml+xml':
+                items['document'].append(path)
+            elif media_type.startswith('image/') and 'cover-image' not in properties:
+                items['image'].append(path)
+            elif media_type == 'text/css':
+                items['style'].append(path)
+            if 'font' in media_type:
+                items['font'].append(path)
+
+            if 'nav' in properties:
+                nav_path = path
+            elif media_type == 'application/x-dtbncx+xml':
+                ncx_path = path
+
+        # 목차: ePub 3 내비게이션 문서를 우선 사용하고, 없거나 비어 있으면 NCX 사용
+        toc_count = 0
+        # 목차 문서가 없거나 깨졌거나 파서가 지원하지 않는 인코딩(ValueError)이면 빈 목차로 처리
+        if nav_path is not None:
+            try:
+                nav_document = ET.fromstring(zip_file.read(nav_path))
+            except (KeyError, ET.ParseError, ValueError):
+                nav_document = None
+
+            if nav_document is not None:
+                for nav in nav_document.iterfind('.//{*}nav'):
+                    if 'toc' in nav.get(_EPUB_TYPE_ATTR, '').split():
+                        toc_list = nav.find('{*}ol')
+                        if toc_list is not None:
+                            toc_count = len(toc_list.findall('{*}li'))
+                        break
+
+        if toc_count == 0 and ncx_path is not None:
+            try:
+                nav_map = ET.fromstring(zip_file.read(ncx_path)).find('{*}navMap')
+            except (KeyError, ET.ParseError, ValueError):
+                nav_map = None
+            if nav_map is not None:
+                toc_count = len(nav_map.findall('{*}navPoint'))
 
-    def _check_metadata(self, epub_path):
+        return {'metadata': metadata, 'items': items, 'toc_count': toc_count}
+
+    def _check_metadata(self, package):
         """메타데이터를 확인합니다."""
         try:
-            book = epub.read_epub(epub_path)
+            metadata = package['metadata']
 
             # 제목 확인
-            title = book.get_metadata('DC', 'title')
-            if not title or not title[0][0].strip():
+            title = metadata['title']
+            if not title or not title[0].strip():
                 self.issues.append("⚠️ 제목이 설정되지 않았습니다.")
 
             # 저자 확인
-            authors = book.get_metadata('DC', 'creator')
+            authors = metadata['creator']
             if not authors:
                 self.issues.append("⚠️ 저자 정보가 설정되지 않았습니다.")
 
             # 언어 확인
-            languages = book.get_metadata('DC', 'language')
+            languages = metadata['language']
             if not languages:
                 self.issues.append("⚠️ 언어 정보가 설정되지 않았습니다.")
 
@@ -209,47 +433,118 @@ class EpubQualityValidator:
         except Exception as e:
             self.issues.append(f"❌ 메타데이터 확인 실패: {str(e)}")
 
-    def _check_chapter_content(self, epub_path):
+    def _scan_items(self, zip_file, package):
+        """
+        ePub 항목을 한 번만 순회하며 각 검사에 필요한 통계를 수집합니다.
+
+        챕터, 이미지, CSS, 폰트, XHTML, 목차 검사가 각자 항목을 순회하는
+        대신 이 결과를 함께 사용합니다. 이미지와 폰트는 압축을 풀지 않고
+        ZIP 중앙 디렉터리에 기록된 크기만 확인합니다.
+
+        Args:
+            zip_file (zipfile.ZipFile): 열려 있는 ePub 아카이브
+            package (dict): _read_package()가 만든 패키지 정보
+
+        Returns:
+            dict: 항목 종류별 집계 결과
+        """
+        stats = {
+            'chapter_count': 0,
+            'empty_chapters': 0,
+            'short_chapters': 0,
+            'long_chapters': 0,
+            'total_content_length': 0,
+            'invalid_html_count': 0,
+            'missing_title_count': 0,
+            'broken_encoding_files': [],
+            'image_count': 0,
+            'large_images': 0,
+            'css_count': 0,
+            'empty_css_count': 0,
+            'font_count': 0,
+            'large_fonts': 0,
+        }
+
+        items = package['items']
+        file_sizes = {info.filename: info.file_size for info in zip_file.infolist()}
+
+        for path in items['document']:
+            stats['chapter_count'] += 1
+            try:
+                raw = zip_file.read(path)
+                content = raw.decode('utf-8')
+            except Exception:
+                stats['invalid_html_count'] += 1
+                continue
+
+            # HTML 태그 제거 후 본문 텍스트 길이 확인 (<head>의 제목은 제외)
+            body_start = content.find('<body')
+            content_length = _text_length(content[body_start:] if body_start > 0 else content)
+            stats['total_content_length'] += content_length
+
+            if content_length < 10:  # 10자 미만
+                stats['empty_chapters'] += 1
+            elif content_length < 100:  # 100자 미만 (너무 짧은 챕터)
+                stats['short_chapters'] += 1
+            elif content_length > 50000:  # 50,000자 초과 (너무 긴 챕터)
+                stats['long_chapters'] += 1
+
+            # 기본적인 HTML 구조 검증 (루트 요소가 <html>인지 확인)
+            if not _has_html_root(raw):
+                stats['invalid_html_count'] += 1
+                continue
+
+            # title 태그 확인 ('<title>'과 '<title ...>'을 한 번의 스캔으로 확인)
+            title_pos = content.find('<title')
+            while title_pos >= 0 and content[title_pos + 6:title_pos + 7] not in _TITLE_TAG_END:
+                title_pos = content.find('<title', title_pos + 6)
+            if title_pos < 0:
+                stats['missing_title_count'] += 1
+
+            # 잘못된 문자 인코딩 확인
+            if '�' in content:  # 깨진 문자
+                stats['broken_encoding_files'].append(path)
+
+        # 이미지: 5MB 초과 확인
+        stats['image_count'] = len(items['image'])
+        for path in items['image']:
+            if file_sizes.get(path, 0) > 5 * 1024 * 1024:
+                stats['large_images'] += 1
+
+        # CSS: 기본적인 내용 검증
+        stats['css_count'] = len(items['style'])
+        for path in items['style']:
+            css_content = zip_file.read(path).decode('utf-8', errors='replace')
+            if len(css_content.strip()) < 10:
+                stats['empty_css_count'] += 1
+
+        # 폰트: 10MB 초과 확인
+        stats['font_count'] = len(items['font'])
+        for path in items['font']:
+            if file_sizes.get(path, 0) > 10 * 1024 * 1024:
+                stats['large_fonts'] += 1
+
+        return stats
+
+    def _check_chapter_content(self, stats):
         """챕터 내용을 확인합니다."""
         try:
-            book = epub.read_epub(epub_path)
-            chapter_count = 0
-            empty_chapters = 0
-            short_chapters = 0
-            long_chapters = 0
-            total_content_length = 0
-
-            for item in book.get_items():
-                if item.get_type() == epub.ITEM_DOCUMENT:
-                    chapter_count += 1
-                    content = item.get_content().decode('utf-8')
-
-                    # HTML 태그 제거 후 텍스트 길이 확인
-                    text_content = re.sub(r'<[^>]+>', '', content).strip()
-                    content_length = len(text_content)
-                    total_content_length += content_length
-
-                    if content_length < 10:  # 10자 미만
-                        empty_chapters += 1
-                    elif content_length < 100:  # 100자 미만 (너무 짧은 챕터)
-                        short_chapters += 1
-                    elif content_length > 50000:  # 50,000자 초과 (너무 긴 챕터)
-                        long_chapters += 1
+            chapter_count = stats['chapter_count']
 
             if chapter_count == 0:
                 self.issues.append("❌ 챕터가 없습니다.")
             else:
                 # 평균 챕터 길이 계산
-                avg_length = total_content_length / chapter_count if chapter_count > 0 else 0
+                avg_length = stats['total_content_length'] / chapter_count
 
-                if empty_chapters > 0:
-                    self.issues.append(f"⚠️ 빈 챕터가 {empty_chapters}개 있습니다. (10자 미만)")
+                if stats['empty_chapters'] > 0:
+                    self.issues.append(f"⚠️ 빈 챕터가 {stats['empty_chapters']}개 있습니다. (10자 미만)")
 
-                if short_chapters > 0:
-                    self.issues.append(f"⚠️ 너무 짧은 챕터가 {short_chapters}개 있습니다. (100자 미만)")
+                if stats['short_chapters'] > 0:
+                    self.issues.append(f"⚠️ 너무 짧은 챕터가 {stats['short_chapters']}개 있습니다. (100자 미만)")
 
-                if long_chapters > 0:
-                    self.issues.append(f"⚠️ 너무 긴 챕터가 {long_chapters}개 있습니다. (50,000자 초과)")
+                if stats['long_chapters'] > 0:
+                    self.issues.append(f"⚠️ 너무 긴 챕터가 {stats['long_chapters']}개 있습니다. (50,000자 초과)")
 
                 if avg_length < 500:
                     self.issues.append(f"⚠️ 평균 챕터 길이가 짧습니다: {avg_length:.0f}자 (권장: 1,000자 이상)")
@@ -259,106 +554,52 @@ class EpubQualityValidator:
         except Exception as e:
             self.issues.append(f"❌ 챕터 내용 확인 실패: {str(e)}")
 
-    def _check_images(self, epub_path):
+    def _check_images(self, stats):
         """이미지를 확인합니다."""
         try:
-            book = epub.read_epub(epub_path)
-            image_count = 0
-            large_images = 0
-
-            for item in book.get_items():
-                if item.get_type() == epub.ITEM_IMAGE:
-                    image_count += 1
-                    image_size = len(item.get_content())
-
-                    # 5MB 초과 이미지 확인
-                    if image_size > 5 * 1024 * 1024:
-                        large_images += 1
+            if stats['large_images'] > 0:
+                self.issues.append(f"⚠️ 큰 이미지가 {stats['large_images']}개 있습니다. (5MB 초과)")
 
-            if large_images > 0:
-                self.issues.append(f"⚠️ 큰 이미지가 {large_images}개 있습니다. (5MB 초과)")
-
-            if image_count > 0:
-                self.log_info(f"이미지 확인 완료: {image_count}개 이미지")
+            if stats['image_count'] > 0:
+                self.log_info(f"이미지 확인 완료: {stats['image_count']}개 이미지")
 
         except Exception as e:
             self.issues.append(f"❌ 이미지 확인 실패: {str(e)}")
 
-    def _check_css_styles(self, epub_path):
+    def _check_css_styles(self, stats):
         """CSS 스타일을 확인합니다."""
         try:
-            book = epub.read_epub(epub_path)
-            css_count = 0
-
-            for item in book.get_items():
-                if item.get_type() == epub.ITEM_STYLE:
-                    css_count += 1
-                    css_content = item.get_content().decode('utf-8')
-
-                    # 기본적인 CSS 검증
-                    if len(css_content.strip()) < 10:
-                        self.issues.append("⚠️ CSS 파일이 거의 비어있습니다.")
+            for _ in range(stats['empty_css_count']):
+                self.issues.append("⚠️ CSS 파일이 거의 비어있습니다.")
 
-            if css_count == 0:
+            if stats['css_count'] == 0:
                 self.issues.append("⚠️ CSS 스타일시트가 없습니다.")
             else:
-                self.log_info(f"CSS 확인 완료: {css_count}개 스타일시트")
+                self.log_info(f"CSS 확인 완료: {stats['css_count']}개 스타일시트")
 
         except Exception as e:
             self.issues.append(f"❌ CSS 확인 실패: {str(e)}")
 
-    def _check_fonts(self, epub_path):
+    def _check_fonts(self, stats):
         """폰트를 확인합니다."""
         try:
-            book = epub.read_epub(epub_path)
-            font_count = 0
-            large_fonts = 0
-
-            for item in book.get_items():
-                if item.media_type and 'font' in item.media_type:
-                    font_count += 1
-                    font_size = len(item.get_content())
-
-                    # 10MB 초과 폰트 확인
-                    if font_size > 10 * 1024 * 1024:
-                        large_fonts += 1
+            if stats['large_fonts'] > 0:
+                self.issues.append(f"⚠️ 큰 폰트 파일이 {stats['large_fonts']}개 있습니다. (10MB 초과)")
 
-            if large_fonts > 0:
-                self.issues.append(f"⚠️ 큰 폰트 파일이 {large_fonts}개 있습니다. (10MB 초과)")
-
-            if font_count > 0:
-                self.log_info(f"폰트 확인 완료: {font_count}개 폰트")
+            if stats['font_count'] > 0:
+                self.log_info(f"폰트 확인 완료: {stats['font_count']}개 폰트")
 
         except Exception as e:
             self.issues.append(f"❌ 폰트 확인 실패: {str(e)}")
 
-    def _check_xhtml_structure(self, epub_path):
+    def _check_xhtml_structure(self, stats):
         """XHTML 구조와 유효성을 확인합니다."""
         try:
-            book = epub.read_epub(epub_path)
-            invalid_html_count = 0
-            missing_title_count = 0
-
-            for item in book.get_items():
-                if item.get_type() == epub.ITEM_DOCUMENT:
-                    try:
-                        content = item.get_content().decode('utf-8')
-
-                        # 기본적인 HTML 구조 검증
-                        if '<html' not in content:
-                            invalid_html_count += 1
-                            continue
-
-                        # title 태그 확인
-                        if '<title>' not in content and '<title ' not in content:
-                            missing_title_count += 1
+            invalid_html_count = stats['invalid_html_count']
+            missing_title_count = stats['missing_title_count']
 
-                        # 잘못된 문자 인코딩 확인
-                        if '�' in content:  # 깨진 문자
-                            self.issues.append(f"⚠️ 문자 인코딩 문제가 있는 챕터가 발견되었습니다: {item.file_name}")
-
-                    except Exception:
-                        invalid_html_count += 1
+            for file_name in stats['broken_encoding_files']:
+                self.issues.append(f"⚠️ 문자 인코딩 문제가 있는 챕터가 발견되었습니다: {file_name}")
 
             if invalid_html_count > 0:
                 self.issues.append(f"❌ 유효하지 않은 XHTML 구조: {invalid_html_count}개 파일")
@@ -372,25 +613,17 @@ class EpubQualityValidator:
         except Exception as e:
             self.issues.append(f"❌ XHTML 구조 확인 실패: {str(e)}")
 
-    def _check_toc_structure(self, epub_path):
+    def _check_toc_structure(self, package, stats):
         """목차 구조를 확인합니다."""
         try:
-            book = epub.read_epub(epub_path)
-
             # 목차 항목 수 확인
-            toc_items = book.toc
-            if not toc_items:
+            toc_count = package['toc_count']
+            if toc_count == 0:
                 self.issues.append("⚠️ 목차가 비어있습니다.")
                 return
 
-            # 목차 항목 개수 확인
-            toc_count = len(toc_items)
-
-            # 챕터 수와 목차 수 비교
-            chapter_count = 0
-            for item in book.get_items():
-                if item.get_type() == epub.ITEM_DOCUMENT:
-                    chapter_count += 1
+            # 챕터 수와 목차 수 비교 (챕터 수는 항목 순회 결과를 재사용)
+            chapter_count = stats['chapter_count']
 
             # 커버나 네비게이션 파일 제외하고 비교
             expected_toc_count = max(1, chapter_count - 2)  # 대략적 예상
@@ -417,10 +650,15 @@ class EpubQualityValidator:
             self.log_info("ePub 품질 검증 완료: 문제 없음")
         else:
             # 문제가 있는 경우
-            message = "📋 ePub 품질 검증 결과\n\n"
-            message += f"총 {len(issues)}개의 문제점이 발견되었습니다:\n\n"
-            message += "\n".join(issues)
-            message += "\n\n💡 대부분의 문제는 ePub 사용에 큰 영향을 주지 않을 수 있습니다."
+            message_lines = [
+                "📋 ePub 품질 검증 결과",
+                "",
+                f"총 {len(issues)}개의 문제점이 발견되었습니다:",
+                "",
+            ]
+            message_lines.extend(issues)
+            message_lines.extend(["", "💡 대부분의 문제는 ePub 사용에 큰 영향을 주지 않을 수 있습니다."])
+            message = "\n".join(message_lines)
 
             QMessageBox.warning(
                 self.main_window,
@@ -431,13 +669,21 @@ class EpubQualityValidator:
             for issue in issues:
                 self.log_warning(f"  - {issue}")
 
+        self._flush_log()
+
     def log_info(self, message):
-        """정보 로그를 기록합니다."""
-        print(f"[VALIDATION] {message}")
+        """정보 로그를 버퍼에 기록합니다."""
+        self._log_buffer.append(f"[VALIDATION] {message}\n")
 
     def log_warning(self, message):
-        """경고 로그를 기록합니다."""
-        print(f"[VALIDATION WARNING] {message}")
+        """경고 로그를 버퍼에 기록합니다."""
+        self._log_buffer.append(f"[VALIDATION WARNING] {message}\n")
+
+    def _flush_log(self):
+        """버퍼에 모아 둔 검증 로그를 한 번에 출력합니다."""
+        if self._log_buffer:
+            print(''.join(self._log_buffer), end='', flush=True)
+            self._log_buffer.clear()
 
 # ==================================================================================
 
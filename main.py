@@ -38,7 +38,7 @@ from datetime import datetime
 from functools import partial
 
 # PyQt6 Core
-from PyQt6.QtCore import Qt, QSize, pyqtSignal, QEvent
+from PyQt6.QtCore import Qt, QSize, pyqtSignal, QEvent, QDir, QResource, QThreadPool
 
 # PyQt6 GUI
 from PyQt6.QtGui import QColor, QGuiApplication, QCursor, QFont, QFontDatabase, QKeySequence, QShortcut
@@ -58,14 +58,14 @@ from ePub_db import initialize_database, update_punctuation_regex_data
 # Loader (DB 관련 기능들)
 from ePub_loader import (
     set_combobox_items_for_regex,
-    load_chapter_regex_list,
+    compile_regex,
+    load_all_ui_lists,
     load_text_styles,
-    load_punctuation_regex_list,
     set_combobox_items,
 )
 
 # 워커들
-from encoding_worker import EncodingDetectWorker
+from encoding_worker import EncodingDetectRunnable
 from chapter_finder import ChapterFinderWorker
 from font_checker_worker import FontCheckerWorker
 
@@ -73,13 +73,17 @@ from font_checker_worker import FontCheckerWorker
 from epub_converter import EpubConverter
 
 # 스타일 매니저 (선택적 사용)
-from style_manager import StyleManager
+from style_manager import StyleManager, apply_stylesheet
 
 from functools import partial
 from PyQt6.QtGui import QPixmap, QImage, QGuiApplication, QAction
 from PyQt6.QtWidgets import QMenu, QProgressDialog
 from PyQt6.QtWidgets import QMenu
 
+# 스타일시트로 배경/테두리를 그리는 위젯이 많아 Qt가 그릴 때마다 겹친 불투명 형제 위젯 영역을
+# 빼는 계산(subtractOpaqueSiblings)의 비용이 큼 - 투명한 위젯이 겹쳐 잔상이 생기면 False로 변경
+DISABLE_SUBTRACT_OPAQUE_SIBLINGS = True
+
 # 메인 윈도우 클래스
 class MainWindow(QMainWindow):
     """
@@ -188,7 +192,7 @@ class MainWindow(QMainWindow):
         """
         백그라운드 워커 객체들을 초기화합니다.
         """
-        self.encoding_worker = None
+        self.encoding_signals = None
         self.font_checker_worker = None
         self.font_progress_dialog = None
         self.chapter_finder_worker = None
@@ -311,10 +315,12 @@ class MainWindow(QMainWindow):
         )
         if not file_path:
             return
-        self.encoding_worker = EncodingDetectWorker(file_path)
-        self.encoding_worker.finished.connect(self.on_encoding_detected)
-        self.encoding_worker.error.connect(self.on_encoding_error)
-        self.encoding_worker.start()
+        # 스레드 풀에서 실행 (작업 객체는 실행 후 Qt가 삭제하므로 신호 객체만 보관)
+        runnable = EncodingDetectRunnable(file_path)
+        self.encoding_signals = runnable.signals
+        self.encoding_signals.finished.connect(self.on_encoding_detected)
+        self.encoding_signals.error.connect(self.on_encoding_error)
+        QThreadPool.globalInstance().start(runnable)
 
     def select_cover_image(self):
         file_path, _ = QFileDialog.getOpenFileName(
@@ -379,18 +385,19 @@ class MainWindow(QMainWindow):
         return f"{base}{suffix}{ext}"
 
     def initialize_comboboxes(self):
-        regex_list = load_chapter_regex_list()
+        # 콤보박스에 넣을 목록을 한 번에 조회
+        ui_lists = load_all_ui_lists()
+
+        regex_list = ui_lists["chapter_regex"]
         for i in range(1, 10):
             combo = getattr(self.ui, f"comboBox_RegEx{i}")
             set_combobox_items_for_regex(combo, regex_list)
 
-        bracket_patterns = load_punctuation_regex_list()
+        # 괄호 패턴 설정: (id, pattern) 형태로 저장
+        bracket_items = [(name, (pattern_id, pattern)) for pattern_id, name, pattern in ui_lists["punctuation_regex"]]
         for i in range(1, 8):
             combo = getattr(self.ui, f"comboBox_Brackets{i}")
-            # 괄호 패턴 설정: (id, pattern) 형태로 저장
-            combo.clear()
-            for pattern_id, name, pattern in bracket_patterns:
-                combo.addItem(name, (pattern_id, pattern))
+            set_combobox_items(combo, bracket_items, display_column=0, user_data_column=1)
 
         # 정렬 옵션 초기화
         self.initialize_alignment_comboboxes()
@@ -588,6 +595,10 @@ class MainWindow(QMainWindow):
     def set_color_to_lineedit(self, lineedit, color_hex):
         """LineEdit에 색상을 설정합니다."""
         lineedit.setText(color_hex)
+        # 적용된 색상은 동적 프로퍼티로 기억하여 같은 색이면 스타일시트를 다시 설정(파싱)하지 않음
+        if lineedit.property("swatchColor") == color_hex:
+            return
+        lineedit.setProperty("swatchColor", color_hex)
         # 배경색에 따라 텍스트 색상 자동 조정
         if color_hex.upper() in ["#FFFFFF", "#FFFFFE", "#FFFEFF", "#FEFFFF"] or self._is_light_color(color_hex):
             text_color = "black"
@@ -2304,16 +2315,6 @@ p {{
                 logging.warning(f"유효하지 않은 텍스트 파일 경로: {file_path}")
                 return
 
-            # 텍스트 파일 읽기 (UTF-8)
-            try:
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    content = f.read()
-                logging.debug(f"텍스트 파일 읽기 완료: {len(content)} 문자")
-            except Exception as e:
-                QMessageBox.critical(self, "파일 읽기 실패", str(e))
-                logging.error(f"텍스트 파일 읽기 실패: {e}")
-                return
-
             # 체크된 정규식만 수집
             selected_patterns = []
             for i in range(1, 10):
@@ -2331,9 +2332,10 @@ p {{
 
             logging.info(f"선택된 정규식 패턴 수: {len(selected_patterns)}")
 
-            # QThread로 백그라운드 작업 실행
-            self.chapter_worker = ChapterFinderWorker(content, selected_patterns)
-            self.chapter_worker.chapter_found.connect(self.add_chapter_row)  # 실시간 행 추가
+            # QThread로 백그라운드 작업 실행 (텍스트 파일(UTF-8)도 워커 스레드에서 읽음)
+            self.chapter_worker = ChapterFinderWorker.from_file(file_path, selected_patterns)
+            self.chapter_worker.error.connect(self.on_chapter_file_error)
+            self.chapter_worker.chapters_found.connect(self.add_chapter_rows)  # 실시간 행 추가 (묶음 단위)
             self.chapter_worker.progress.connect(self.ui.progressBar.setValue)
             self.chapter_worker.finished.connect(self.finish_chapter_search)
             self.chapter_worker.start()
@@ -3400,12 +3402,15 @@ p {{
             lines = text.split('\n')
             styled_lines = []
 
+            # 정규식은 루프 밖에서 한 번만 컴파일 (같은 패턴은 캐시된 객체 사용)
+            line_pattern = compile_regex(pattern_regex)
+
+            # 스타일 정보 수집 (모든 줄에 동일하게 적용)
+            style_info = self.get_bracket_style_info(index)
+
             for line in lines:
-                match = re.match(pattern_regex, line)
+                match = line_pattern.match(line)
                 if match:
-                    # 스타일 정보 수집
-                    style_info = self.get_bracket_style_info(index)
-
                     # HTML 스타일 적용
                     styled_line = self.apply_bracket_html_styles(line, style_info)
                     styled_lines.append(styled_line)
@@ -3440,7 +3445,7 @@ p {{
                 return self.apply_bracket_html_styles(matched_text, style_info)
 
             # 패턴에 매치되는 모든 텍스트에 스타일 적용
-            styled_text = re.sub(pattern_regex, style_replacement, text, flags=flags)
+            styled_text = compile_regex(pattern_regex, flags).sub(style_replacement, text)
 
             if styled_text != text:
                 logging.debug(f"범위 기반 괄호 스타일 적용 완료")
@@ -3530,7 +3535,26 @@ p {{
         # 기존 apply_character_html_styles와 동일한 로직 사용
         return self.apply_character_html_styles(text, style_info)
 
-    def add_chapter_row(self, line_no, title, regex_name, pattern):
+    def add_chapter_rows(self, chapters):
+        """
+        챕터 검색 워커가 묶어서 보낸 챕터들을 테이블에 한 번에 추가합니다.
+
+        행을 모두 추가한 뒤 화면 갱신과 순서 번호 계산을 한 번만 수행합니다.
+
+        Args:
+            chapters (list): (라인번호, 제목, 정규식명, 패턴) 튜플 리스트
+        """
+        table = self.ui.tableWidget_ChapterList
+        table.setUpdatesEnabled(False)
+        try:
+            for line_no, title, regex_name, pattern in chapters:
+                self._insert_chapter_row(line_no, title)
+        finally:
+            table.setUpdatesEnabled(True)
+        self.update_chapter_order()
+
+    def _insert_chapter_row(self, line_no, title):
+        """챕터 목록 테이블 끝에 한 행을 추가합니다. 순서 번호는 호출자가 갱신합니다."""
         table = self.ui.tableWidget_ChapterList
         row = table.rowCount()
         table.insertRow(row)
@@ -3551,11 +3575,13 @@ p {{
 
         table.setItem(row, 5, QTableWidgetItem(""))
 
-        self.update_chapter_order()
-
     def finish_chapter_search(self, total):
         self.ui.label_ChapterCount.setText(f"총 {total}개의 목차를 찾았습니다.")
 
+    def on_chapter_file_error(self, message):
+        """챕터 검색 워커가 텍스트 파일을 읽지 못했을 때 호출됩니다."""
+        QMessageBox.critical(self, "파일 읽기 실패", message)
+
     def update_chapter_order(self):
         """체크된 챕터들의 순서를 업데이트합니다."""
         table = self.ui.tableWidget_ChapterList
@@ -3958,6 +3984,9 @@ p {{
         """
         통합된 CSS 스타일을 적용합니다. (선택적 사용)
 
+        위젯마다 따로 설정하지 않고 QApplication에 한 번 설정하여 Qt가 스타일시트를
+        한 번만 파싱하고 모든 창이 같은 규칙을 공유하게 합니다.
+
         Args:
             style_files: 사용하지 않음 (호환성을 위해 유지)
         """
@@ -3967,7 +3996,7 @@ p {{
 
         try:
             stylesheet = self.style_manager.get_combined_stylesheet()
-            self.setStyleSheet(stylesheet)
+            apply_stylesheet(QApplication.instance(), stylesheet)
             print(f"[INFO] 통합 스타일 적용 완료: {len(stylesheet)} 문자")
         except Exception as e:
             print(f"[ERROR] 스타일 적용 실패: {str(e)}")
@@ -3990,7 +4019,7 @@ p {{
 
     def reset_to_default_styles(self):
         """기본 PyQt6 스타일로 리셋합니다."""
-        self.setStyleSheet("")
+        apply_stylesheet(QApplication.instance(), "")
         print("[INFO] 기본 스타일로 리셋 완료")
 
     def get_style_template_info(self):
@@ -4243,6 +4272,25 @@ p {{
 
 
 
+def register_qt_resources():
+    """
+    QSS의 url(resource:...) 이미지 경로를 등록합니다.
+
+    resources.qrc를 컴파일한 resources.rcc가 있으면 메모리에 올려 Qt 리소스(:/resource)에서
+    이미지를 읽고, 없으면 resource 폴더에서 읽습니다. 검색 경로는 등록 순서대로 찾으므로
+    Qt 리소스가 있으면 스타일 적용/크기 계산 때마다 이미지 파일을 다시 열지 않습니다.
+
+    컴파일 방법 (PyQt6에는 rcc가 없으므로 Qt 또는 PySide6의 rcc 사용):
+        pyside6-rcc --binary resources.qrc -o resources.rcc
+    """
+    base_dir = os.path.dirname(os.path.abspath(__file__))
+    rcc_path = os.path.join(base_dir, "resources.rcc")
+    if os.path.exists(rcc_path) and QResource.registerResource(rcc_path):
+        QDir.addSearchPath("resource", ":/resource")
+    else:
+        logging.debug("resources.rcc가 없어 resource 폴더의 이미지를 사용합니다.")
+    QDir.addSearchPath("resource", os.path.join(base_dir, "resource"))
+
 if __name__ == "__main__":
     """
     애플리케이션 진입점
@@ -4254,8 +4302,11 @@ if __name__ == "__main__":
         initialize_database()
         logging.info("데이터베이스 초기화 완료")
 
-        # PyQt6 애플리케이션 시작
+        # PyQt6 애플리케이션 시작 (Qt 환경 변수는 QApplication 생성 전에 설정)
+        if DISABLE_SUBTRACT_OPAQUE_SIBLINGS:
+            os.environ.setdefault("QT_NO_SUBTRACTOPAQUESIBLINGS", "1")
         app = QApplication(sys.argv)
+        register_qt_resources()
         window = MainWindow()
         window.show()
 
@@ -0,0 +1,101 @@
+"""
+QSS/CSS 스타일시트 축소(minify) 빌드 스크립트
+
+주석과 불필요한 공백을 제거하고, 연속된 규칙의 본문이 같으면 선택자를 묶어
+Qt가 setStyleSheet()에서 파싱할 문자열을 줄입니다. 결과는 원본 옆에
+'<이름>.min<확장자>'로 저장되며 StyleManager는 원본보다 새로운 .min 파일이 있으면
+그것을 대신 읽습니다.
+
+사용법:
+    python scripts/minify_qss.py styles/app_style.css [다른 파일 ...]
+"""
+
+import os
+import re
+import sys
+
+# 따옴표 문자열은 그대로 두고 주석/공백만 처리하기 위한 토큰 패턴
+_STRING_OR_COMMENT_RE = re.compile(r'("(?:\\.|[^"\\])*"|\'(?:\\.|[^\'\\])*\')|/\*.*?\*/', re.S)
+_WHITESPACE_RE = re.compile(r"\s+")
+_PUNCT_SPACE_RE = re.compile(r"\s*([{};,>])\s*")
+_COLON_SPACE_RE = re.compile(r":\s+")
+_RULE_RE = re.compile(r"([^{}]+)\{([^{}]*)\}")
+
+
+def _minify_segment(text):
+    """따옴표 밖의 텍스트에서 공백을 줄입니다. (':' 앞의 공백은 선택자 의미가 있으므로 유지)"""
+    text = _WHITESPACE_RE.sub(" ", text)
+    text = _PUNCT_SPACE_RE.sub(r"\1", text)
+    return _COLON_SPACE_RE.sub(":", text)
+
+
+def minify_qss(text):
+    """
+    스타일시트 문자열을 축소합니다.
+
+    Args:
+        text (str): 원본 QSS/CSS 문자열
+
+    Returns:
+        str: 주석과 공백을 제거하고 연속된 같은 본문의 규칙을 묶은 문자열
+    """
+    # 주석 제거 및 공백 정리 (따옴표 문자열 내부는 유지)
+    minified = []
+    outside = []
+    pos = 0
+    for match in _STRING_OR_COMMENT_RE.finditer(text):
+        outside.append(text[pos:match.start()])
+        if match.group(1):
+            minified.append(_minify_segment("".join(outside)))
+            minified.append(match.group(1))
+            outside = []
+        else:
+            outside.append(" ")
+        pos = match.end()
+    outside.append(text[pos:])
+    minified.append(_minify_segment("".join(outside)))
+    text = "".join(minified).strip()
+
+    # @규칙 등 단순한 '선택자{본문}' 나열이 아니면 규칙 병합 생략
+    rules = _RULE_RE.findall(text)
+    if "".join(f"{selector}{{{body}}}" for selector, body in rules) != text:
+        return text
+
+    # 바로 이어지는 규칙의 본문이 같으면 선택자 목록으로 합침
+    # (떨어진 규칙끼리 합치면 우선순위가 바뀔 수 있으므로 연속된 규칙만 합침)
+    merged = []
+    for selector, body in rules:
+        body = body.rstrip(";")
+        if merged and merged[-1][1] == body:
+            merged[-1][0].append(selector)
+        else:
+            merged.append(([selector], body))
+    return "".join(f"{','.join(selectors)}{{{body}}}" for selectors, body in merged)
+
+
+def minify_file(path):
+    """
+    스타일시트 파일을 축소하여 '<이름>.min<확장자>' 파일로 저장합니다.
+
+    Args:
+        path (str): 원본 파일 경로
+
+    Returns:
+        str: 저장한 파일 경로
+    """
+    root, ext = os.path.splitext(path)
+    out_path = f"{root}.min{ext}"
+    with open(path, "r", encoding="utf-8") as f:
+        minified = minify_qss(f.read())
+    with open(out_path, "w", encoding="utf-8", newline="") as f:
+        f.write(minified)
+    return out_path
+
+
+if __name__ == "__main__":
+    if len(sys.argv) < 2:
+        print(__doc__)
+        sys.exit(1)
+    for file_path in sys.argv[1:]:
+        out = minify_file(file_path)
+        print(f"{file_path} ({os.path.getsize(file_path)} bytes) -> {out} ({os.path.getsize(out)} bytes)")
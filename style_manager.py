@@ -4,8 +4,72 @@
 """
 
 import os
+import re
+import sys
+from functools import lru_cache
 from typing import Dict, List, Optional
 
+_COMMENT_RE = re.compile(r"/\*.*?\*/", re.S)
+_INDENT_RE = re.compile(r"\n\s+")
+
+
+@lru_cache(maxsize=16)
+def _read_style_file(file_path: str, mtime: float) -> str:
+    """
+    스타일 파일 내용을 읽어 프로세스 전체에서 공유합니다.
+
+    수정 시각(mtime)을 캐시 키에 포함하므로 파일이 바뀌면 다시 읽습니다.
+    같은 파일은 모든 StyleManager 인스턴스가 같은 문자열 객체를 받습니다.
+
+    Args:
+        file_path: 스타일 파일 경로
+        mtime: 파일 수정 시각 (캐시 키)
+
+    Returns:
+        CSS 내용 문자열
+    """
+    with open(file_path, 'r', encoding='utf-8') as f:
+        return sys.intern(f.read())
+
+
+@lru_cache(maxsize=16)
+def compact_stylesheet(stylesheet: str) -> str:
+    """
+    스타일시트에서 주석과 줄 앞 들여쓰기를 제거합니다. (같은 문자열은 한 번만 처리)
+
+    저장된 스타일시트는 편집용 주석을 그대로 두고, Qt에 넘길 때만 이 결과를 사용하여
+    QCss 파서가 주석을 건너뛰는 작업을 줄입니다.
+
+    Args:
+        stylesheet: 원본 QSS 문자열
+
+    Returns:
+        주석과 들여쓰기를 제거한 QSS 문자열
+    """
+    return _INDENT_RE.sub("\n", _COMMENT_RE.sub("", stylesheet)).strip()
+
+
+def apply_stylesheet(target, stylesheet: str) -> bool:
+    """
+    위젯 또는 QApplication에 스타일시트를 적용합니다. 이미 같은 스타일시트가
+    적용되어 있으면 다시 설정하지 않습니다.
+
+    Qt에는 compact_stylesheet로 주석을 제거한 문자열을 넘기며, 같은 문자열이
+    이미 설정되어 있는지는 대상의 현재 스타일시트와 직접 비교합니다.
+
+    Args:
+        target: setStyleSheet를 가진 PyQt6 객체 (QWidget, QApplication)
+        stylesheet: 적용할 QSS 문자열
+
+    Returns:
+        스타일시트를 새로 설정했으면 True, 이미 같은 스타일시트였으면 False
+    """
+    compact = compact_stylesheet(stylesheet)
+    if target.styleSheet() == compact:
+        return False
+    target.setStyleSheet(compact)
+    return True
+
 
 class StyleManager:
     """각 컨트롤별 CSS 스타일을 관리하는 클래스"""
@@ -32,11 +96,16 @@ class StyleManager:
         """
         try:
             file_path = os.path.join(self.styles_dir, filename)
+            # scripts/minify_qss.py로 만든 축소본이 원본보다 새로우면 축소본을 읽음
+            root, ext = os.path.splitext(file_path)
+            min_path = f"{root}.min{ext}"
+            if (os.path.exists(min_path) and os.path.exists(file_path)
+                    and os.path.getmtime(min_path) >= os.path.getmtime(file_path)):
+                file_path = min_path
             if os.path.exists(file_path):
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    content = f.read()
-                    self.loaded_styles[filename] = content
-                    return content
+                content = _read_style_file(file_path, os.path.getmtime(file_path))
+                self.loaded_styles[filename] = content
+                return content
             else:
                 print(f"[WARNING] 스타일 파일을 찾을 수 없습니다: {file_path}")
                 return None
@@ -78,7 +147,7 @@ class StyleManager:
             style_files: 적용할 CSS 파일명 리스트
         """
         stylesheet = self.get_combined_stylesheet(style_files)
-        widget.setStyleSheet(stylesheet)
+        apply_stylesheet(widget, stylesheet)
 
     def get_template_properties(self, control_type: str) -> List[str]:
         """
@@ -0,0 +1,47 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+ePub 품질 검증의 XHTML 루트 요소 확인 테스트 스크립트
+"""
+
+import sys
+import os
+
+# 현재 디렉토리를 모듈 검색 경로에 추가
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from epub_converter import _has_html_root
+
+
+def test_has_html_root_multibyte_declaration():
+    """다중 바이트 인코딩이 선언되었지만 UTF-8로 저장된 챕터를 예외 없이 확인하는지 테스트"""
+    body = '<html xmlns="http://www.w3.org/1999/xhtml"><body><p>본문</p></body></html>'
+    for encoding in ('euc-kr', 'shift_jis', 'gb2312'):
+        raw = f'<?xml version="1.0" encoding="{encoding}"?>\n{body}'.encode('utf-8')
+        assert _has_html_root(raw), encoding
+        assert _has_html_root(b'\xef\xbb\xbf' + raw), encoding
+
+    # 선언을 떼어도 루트가 html이 아니거나 문법이 깨진 문서는 잘못된 문서로 판단
+    raw = '<?xml version="1.0" encoding="euc-kr"?><body><p>본문</p></body>'.encode('utf-8')
+    assert not _has_html_root(raw)
+    raw = '<?xml version="1.0" encoding="euc-kr"?><<html><body/></html>'.encode('utf-8')
+    assert not _has_html_root(raw)
+
+
+def test_has_html_root_basic():
+    """일반적인 XHTML 문서의 루트 요소 확인 테스트"""
+    assert _has_html_root(b'<?xml version="1.0" encoding="utf-8"?><html><body/></html>')
+    assert _has_html_root(b'<!DOCTYPE html><html><body/></html>')
+    assert not _has_html_root(b'<div>html</div>')
+    assert not _has_html_root(b'<?xml version="1.0"?><<html>')
+    assert not _has_html_root(b'')
+
+
+if __name__ == "__main__":
+    try:
+        test_has_html_root_basic()
+        test_has_html_root_multibyte_declaration()
+        print("=== 테스트 완료 ===")
+    except Exception as e:
+        print(f"테스트 실행 중 오류 발생: {e}")
+        sys.exit(1)
@@ -7,12 +7,14 @@ import sys
 from PyQt6.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QPushButton, QLabel,
     QLineEdit, QTextEdit, QComboBox, QMessageBox, QSplitter,
-    QListWidget, QListWidgetItem, QWidget, QFrame
+    QListWidget, QListWidgetItem, QWidget, QFrame, QApplication
 )
 from PyQt6.QtCore import Qt, pyqtSignal
 from PyQt6.QtGui import QFont, QTextCharFormat, QSyntaxHighlighter
 import re
 
+from style_manager import apply_stylesheet
+
 class CSSHighlighter(QSyntaxHighlighter):
     """CSS 구문 강조를 위한 클래스"""
 
@@ -313,7 +315,8 @@ QPushButton:hover {
         """현재 편집 중인 테마를 미리보기로 적용"""
         content = self.css_editor.toPlainText()
         if self.parent():
-            self.parent().setStyleSheet(content)
+            # 애플리케이션 전체에 한 번 적용 (다른 창과 나중에 만들어지는 위젯에도 같은 규칙이 적용되도록 걸러내지 않음)
+            apply_stylesheet(QApplication.instance(), content)
 
 # 테스트용 실행 코드
 if __name__ == "__main__":